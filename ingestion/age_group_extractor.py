@@ -4,6 +4,13 @@ import re
 
 from ingestion.config import AGE_GROUP_PATTERN, AGE_GROUP_NORMALIZE, AGE_GROUP_KEYWORDS
 
+# All keyword patterns as one alternation, compiled once. Group i+1 is the
+# i-th AGE_GROUP_KEYWORDS entry, so match.lastindex maps back to its ages.
+_KEYWORD_AGES = list(AGE_GROUP_KEYWORDS.values())
+_KEYWORD_RE = re.compile(
+    "|".join(f"({pattern})" for pattern in AGE_GROUP_KEYWORDS), re.IGNORECASE
+)
+
 
 def extract_age_groups(event_name: str, categories: list) -> list:
     """Extract age groups (U10-U21) from event name and categories.
@@ -13,25 +20,20 @@ def extract_age_groups(event_name: str, categories: list) -> list:
 
     Returns sorted list of normalized age group strings.
     """
-    found = set()
-
-    # Search event name for explicit U-codes
-    for match in AGE_GROUP_PATTERN.finditer(event_name):
-        raw = match.group(1).lower()
-        found.add(AGE_GROUP_NORMALIZE.get(raw, raw.upper()))
+    # Name and categories (which may contain "U10/U12/U14/U16" or similar)
+    # are scanned as one string; the joining space keeps word boundaries
+    searchable = " ".join([event_name] + categories)
 
-    # Search categories (may contain "U10/U12/U14/U16" or similar)
-    for cat in categories:
-        for match in AGE_GROUP_PATTERN.finditer(cat):
-            raw = match.group(1).lower()
-            found.add(AGE_GROUP_NORMALIZE.get(raw, raw.upper()))
+    # Explicit U-codes
+    found = {
+        AGE_GROUP_NORMALIZE.get(raw.lower(), raw.upper())
+        for raw in AGE_GROUP_PATTERN.findall(searchable)
+    }
 
     # Fallback: infer from keywords if no explicit U-codes found
     if not found:
-        searchable = " ".join([event_name] + categories)
-        for pattern, age_groups in AGE_GROUP_KEYWORDS.items():
-            if re.search(pattern, searchable, re.IGNORECASE):
-                found.update(age_groups)
+        for match in _KEYWORD_RE.finditer(searchable):
+            found.update(_KEYWORD_AGES[match.lastindex - 1])
 
     # Sort by age number
     return sorted(found, key=lambda x: int(x[1:]))
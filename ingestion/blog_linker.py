@@ -12,9 +12,15 @@ from __future__ import annotations
 import json
 import re
 import xml.etree.ElementTree as ET
-from datetime import date, datetime, timedelta
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 
 import requests
+import urllib3
 
 from ingestion.config import (
     BLOG_LINKS_PATH,
@@ -24,68 +30,83 @@ from ingestion.config import (
 )
 
 
+def _parse_pub_date(text: str | None) -> date | None:
+    """Parse an RSS pubDate ("Mon, 10 Feb 2026 00:00:00 GMT"), or an ISO date."""
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        return parsedate_to_datetime(text).date()
+    except (TypeError, ValueError):
+        pass
+    # Try ISO format as fallback
+    try:
+        return date.fromisoformat(text[:10])
+    except ValueError:
+        return None
+
+
 def _fetch_rss_items(url: str = None) -> list[dict]:
     """Fetch the RSS feed and return parsed items.
 
+    The response is parsed as it streams in, and each <item> is cleared once
+    read, so the whole feed is never held as text or as a full tree.
+
     Returns list of {title, link, slug, pub_date}.
     """
     url = url or BLOG_RSS_URL
     try:
-        resp = requests.get(url, timeout=20)
+        resp = requests.get(url, timeout=20, stream=True)
         resp.raise_for_status()
     except Exception as e:
         print(f"  Warning: Could not fetch blog RSS feed: {e}")
         return []
 
+    items = []
     try:
-        root = ET.fromstring(resp.text)
+        resp.raw.decode_content = True  # undo any gzip transfer encoding
+        for _, item in ET.iterparse(resp.raw):
+            if item.tag != "item":
+                continue
+            title = item.findtext("title")
+            link = item.findtext("link")
+            pub_date = _parse_pub_date(item.findtext("pubDate"))
+            item.clear()
+
+            if title is None or link is None:
+                continue
+
+            link = link.strip()
+            # Extract slug from URL: last path segment
+            slug = link.rstrip("/").rsplit("/", 1)[-1] if link else ""
+
+            items.append({
+                "title": title.strip(),
+                "link": link,
+                "slug": slug,
+                "pub_date": pub_date,
+            })
     except ET.ParseError as e:
         print(f"  Warning: Could not parse RSS XML: {e}")
         return []
-
-    items = []
-    for item in root.iter("item"):
-        title_el = item.find("title")
-        link_el = item.find("link")
-        pub_date_el = item.find("pubDate")
-
-        if title_el is None or link_el is None:
-            continue
-
-        link = (link_el.text or "").strip()
-        # Extract slug from URL: last path segment
-        slug = link.rstrip("/").rsplit("/", 1)[-1] if link else ""
-
-        pub_date = None
-        if pub_date_el is not None and pub_date_el.text:
-            try:
-                # RSS dates: "Mon, 10 Feb 2026 00:00:00 GMT"
-                dt = datetime.strptime(
-                    pub_date_el.text.strip(), "%a, %d %b %Y %H:%M:%S %Z"
-                )
-                pub_date = dt.date()
-            except ValueError:
-                # Try ISO format as fallback
-                try:
-                    pub_date = date.fromisoformat(pub_date_el.text.strip()[:10])
-                except ValueError:
-                    pass
-
-        items.append({
-            "title": (title_el.text or "").strip(),
-            "link": link,
-            "slug": slug,
-            "pub_date": pub_date,
-        })
+    except (requests.RequestException, urllib3.exceptions.HTTPError, OSError) as e:
+        # The body is read while parsing, so a dropped connection surfaces here
+        print(f"  Warning: Could not read blog RSS feed: {e}")
+        return []
+    finally:
+        resp.close()
 
     return items
 
 
-def _build_venue_slug_map() -> dict[str, str]:
+@lru_cache(maxsize=1)
+def _build_venue_slug_map() -> Mapping[str, str]:
     """Build a mapping from slug fragments to canonical venue names.
 
     Auto-generates from KNOWN_VENUES by slugifying each name, then merges
-    in VENUE_SLUG_ALIASES for abbreviations.
+    in VENUE_SLUG_ALIASES for abbreviations. Built once per process from the
+    static config and returned read-only; call ``cache_clear()`` after
+    changing the venue config.
     """
     slug_map: dict[str, str] = {}
 
@@ -103,39 +124,74 @@ def _build_venue_slug_map() -> dict[str, str]:
     # Merge explicit aliases (these override auto-generated ones)
     slug_map.update(VENUE_SLUG_ALIASES)
 
-    return slug_map
+    return MappingProxyType(slug_map)
+
 
+@lru_cache(maxsize=8)
+def _slug_matcher(fragments: tuple[str, ...]) -> tuple[re.Pattern, dict[str, int]]:
+    """Compile one scanner for all slug fragments.
+
+    Returns the pattern and each fragment's rank (longest first, ties in map
+    order). The pattern is a zero-width lookahead, so it reports the longest
+    hyphen-bounded fragment starting at every position, overlapping or not.
+    """
+    ordered = sorted(fragments, key=len, reverse=True)
+    alternation = "|".join(map(re.escape, ordered))
+    pattern = re.compile(rf"(?<![^-])(?=({alternation})(?![^-]))")
+    return pattern, {fragment: rank for rank, fragment in enumerate(ordered)}
 
-def _extract_venue_from_slug(slug: str, slug_map: dict[str, str]) -> str | None:
+
+def _extract_venue_from_slug(slug: str, slug_map: Mapping[str, str]) -> str | None:
     """Scan a blog slug for known venue fragments, longest match first.
 
     Returns the canonical venue name, or None if no venue found.
     """
-    if not slug:
+    if not slug or not slug_map:
+        return None
+
+    # One pass over the slug with a pattern compiled once per slug_map,
+    # instead of a regex search per fragment. Fragments must be at
+    # start/end or bordered by hyphens; the longest wins, so e.g.
+    # "utah-olympic-park" beats "park".
+    pattern, rank = _slug_matcher(tuple(slug_map))
+    matches = [m.group(1) for m in pattern.finditer(slug.lower())]
+    if not matches:
         return None
+    return slug_map[min(matches, key=rank.__getitem__)]
 
-    slug_lower = slug.lower()
 
-    # Sort candidate keys longest-first to prefer specific matches
-    # e.g. "utah-olympic-park" before "park"
-    candidates = sorted(slug_map.keys(), key=len, reverse=True)
+def _index_events_by_venue(
+    events: list[dict],
+) -> dict[str, tuple[list[date], list[tuple[int, str]]]]:
+    """Group completed events by lowercased venue for blog matching.
 
-    for fragment in candidates:
-        # Check if fragment appears as a substring in the slug
-        # Use word-boundary-like matching: fragment must be at start/end or
-        # bordered by hyphens
-        pattern = r"(?:^|-)" + re.escape(fragment) + r"(?:$|-)"
-        if re.search(pattern, slug_lower):
-            return slug_map[fragment]
+    Each bucket is (end_dates, entries): parallel lists sorted by end date,
+    where entries are (position in events, event id). Keeping the position
+    lets ties resolve the way a scan of ``events`` would.
+    """
+    grouped: dict[str, list[tuple[date, int, str]]] = {}
+    for position, event in enumerate(events):
+        # Only match completed events
+        if event.get("status") not in ("completed", "in_progress"):
+            continue
+        event_end = date.fromisoformat(event["dates"]["end"])
+        grouped.setdefault(event.get("venue", "").lower(), []).append(
+            (event_end, position, event["id"])
+        )
 
-    return None
+    index = {}
+    for venue, rows in grouped.items():
+        rows.sort()
+        index[venue] = ([end for end, _, _ in rows], [(pos, eid) for _, pos, eid in rows])
+    return index
 
 
 def _match_blog_to_event(
     item: dict,
     events: list[dict],
-    slug_map: dict[str, str],
+    slug_map: Mapping[str, str],
     lookback_days: int = 14,
+    venue_index: dict | None = None,
 ) -> tuple[str | None, str | None]:
     """Match a blog post to a completed event.
 
@@ -143,6 +199,9 @@ def _match_blog_to_event(
     where the event end date is within lookback_days before the post pub_date.
     Prefers the most recent matching event.
 
+    Pass ``venue_index`` from ``_index_events_by_venue(events)`` when matching
+    many posts against the same events, so they are grouped once.
+
     Returns (event_id, venue) or (None, None).
     """
     venue = _extract_venue_from_slug(item["slug"], slug_map)
@@ -153,36 +212,33 @@ def _match_blog_to_event(
     if not pub_date:
         return None, None
 
-    best_match = None
-    best_end_date = None
+    if venue_index is None:
+        venue_index = _index_events_by_venue(events)
 
-    for event in events:
-        # Only match completed events
-        if event.get("status") not in ("completed", "in_progress"):
-            continue
+    venue_lower = venue.lower()
+    earliest = pub_date - timedelta(days=lookback_days)
+    best = None  # (end_date, -position, event_id)
 
-        event_venue = event.get("venue", "")
+    for event_venue, (end_dates, entries) in venue_index.items():
         # Check venue match (case-insensitive substring in either direction)
-        if not (
-            venue.lower() in event_venue.lower()
-            or event_venue.lower() in venue.lower()
-        ):
+        if not (venue_lower in event_venue or event_venue in venue_lower):
             continue
 
-        event_end = date.fromisoformat(event["dates"]["end"])
-
-        # Event must have ended within lookback_days before the blog post
-        if event_end > pub_date:
+        # Most recent event that ended on or before the blog post...
+        i = bisect_right(end_dates, pub_date)
+        if not i:
             continue
-        if (pub_date - event_end).days > lookback_days:
+        event_end = end_dates[i - 1]
+        # ...and within lookback_days of it
+        if event_end < earliest:
             continue
+        # First in events order among those ending the same day
+        position, event_id = entries[bisect_left(end_dates, event_end)]
+        candidate = (event_end, -position, event_id)
+        if best is None or candidate > best:
+            best = candidate
 
-        # Prefer most recent event
-        if best_end_date is None or event_end > best_end_date:
-            best_match = event["id"]
-            best_end_date = event_end
-
-    return best_match, venue
+    return (best[2] if best else None), venue
 
 
 def _clean_title(title: str) -> str:
@@ -225,11 +281,14 @@ def discover_blog_links(events: list[dict]) -> dict:
     print(f"  Found {len(items)} blog posts in RSS feed")
 
     slug_map = _build_venue_slug_map()
+    venue_index = _index_events_by_venue(events)
     blog_links = _load_blog_links()
     new_links = 0
 
     for item in items:
-        event_id, venue = _match_blog_to_event(item, events, slug_map)
+        event_id, venue = _match_blog_to_event(
+            item, events, slug_map, venue_index=venue_index
+        )
         if not event_id:
             continue
 
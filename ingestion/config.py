@@ -31,12 +31,16 @@ VENUE_SLUG_ALIASES = {
 }
 
 # --- PCSS Detection Patterns (word-boundary regex from existing monitor) ---
-PCSS_PATTERNS = [
+PCSS_PATTERNS = (
     re.compile(r"\bPCSS\b", re.IGNORECASE),
     re.compile(r"\bPark City\b", re.IGNORECASE),
     re.compile(r"\bPark City SS\b", re.IGNORECASE),
     re.compile(r"\bPark City Ski\b", re.IGNORECASE),
-]
+)
+# All of the above as one alternation, so a text is scanned once, not per pattern
+PCSS_PATTERN = re.compile(
+    "|".join(f"(?:{p.pattern})" for p in PCSS_PATTERNS), re.IGNORECASE
+)
 
 # --- Discipline Parsing ---
 # Matches patterns like "2 SL", "2SL", "SL", "3 SG" — with optional run count
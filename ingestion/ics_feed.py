@@ -66,19 +66,15 @@ def _build_description(event: dict) -> str:
     return "\n".join(parts)
 
 
-def generate_feed(database_path: Path = DATABASE_PATH, output_path: Path = OUTPUT_PATH) -> str:
-    """Generate .ics feed from race database.
+def build_feed(data: dict) -> str:
+    """Build .ics content from already-loaded race database data.
 
     Args:
-        database_path: Path to race_database.json
-        output_path: Path to write the .ics file
+        data: Parsed race_database.json contents
 
     Returns:
         The .ics content as a string.
     """
-    with open(database_path) as f:
-        data = json.load(f)
-
     events = data.get("events", [])
     generated_at = data.get("generated_at", datetime.now().isoformat(timespec="seconds"))
 
@@ -133,13 +129,29 @@ def generate_feed(database_path: Path = DATABASE_PATH, output_path: Path = OUTPU
     lines.append("END:VCALENDAR")
 
     # RFC 5545 requires CRLF line endings
-    content = "\r\n".join(lines) + "\r\n"
+    return "\r\n".join(lines) + "\r\n"
+
+
+def generate_feed(database_path: Path = DATABASE_PATH, output_path: Path = OUTPUT_PATH) -> str:
+    """Generate .ics feed from race database.
+
+    Args:
+        database_path: Path to race_database.json
+        output_path: Path to write the .ics file
+
+    Returns:
+        The .ics content as a string.
+    """
+    with open(database_path) as f:
+        data = json.load(f)
+
+    content = build_feed(data)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, "w", newline="") as f:
         f.write(content)
 
-    print(f"Wrote {len(events)} events to {output_path}")
+    print(f"Wrote {len(data.get('events', []))} events to {output_path}")
     return content
 
 
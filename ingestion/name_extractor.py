@@ -97,17 +97,22 @@ def _is_valid_name(last: str, first: str) -> bool:
     return True
 
 
+# Splits a name on apostrophes and hyphens, keeping the separators
+_NAME_PART_SPLIT = re.compile(r"(['\-])")
+
+
+def _title_part(s: str) -> str:
+    """Capitalize each apostrophe/hyphen-separated piece of a name."""
+    return "".join(
+        p.capitalize() if p not in ("'", "-") else p
+        for p in _NAME_PART_SPLIT.split(s)
+    )
+
+
 def _normalize_name(last: str, first: str) -> str:
     """Normalize to 'Firstname Lastname' display format."""
     # Handle names like O'BRIEN -> O'Brien, MC'DONALD -> Mc'Donald
-    def title_part(s):
-        # Handle apostrophes and hyphens
-        parts = re.split(r"(['\-])", s)
-        return "".join(
-            p.capitalize() if p not in ("'", "-") else p
-            for p in parts
-        )
-    return f"{title_part(first)} {title_part(last)}"
+    return f"{_title_part(first)} {_title_part(last)}"
 
 
 def parse_names_from_text(text: str) -> list[tuple[str, str, str | None]]:
@@ -119,6 +124,21 @@ def parse_names_from_text(text: str) -> list[tuple[str, str, str | None]]:
     seen = set()
     names = []
 
+    # Racers appear once per run and again in the combined results, so each
+    # raw (last, first) pair is validated and normalized only once per text.
+    # Maps the pair to its display name, or None if it is not a valid name.
+    resolved: dict[tuple[str, str], str | None] = {}
+
+    def resolve(last_raw: str, first_raw: str) -> str | None:
+        pair = (last_raw, first_raw)
+        if pair not in resolved:
+            resolved[pair] = (
+                _normalize_name(last_raw, first_raw)
+                if _is_valid_name(last_raw, first_raw)
+                else None
+            )
+        return resolved[pair]
+
     # First pass: extended pattern with club extraction
     matched_spans = set()
     for m in _NAME_CLUB_PATTERN.finditer(text):
@@ -127,10 +147,9 @@ def parse_names_from_text(text: str) -> list[tuple[str, str, str | None]]:
         token3 = m.group(3)          # club or country
         token4 = m.group(4)          # country (if token3 is club)
 
-        if not _is_valid_name(last_raw, first_raw):
+        display = resolve(last_raw, first_raw)
+        if display is None:
             continue
-
-        display = _normalize_name(last_raw, first_raw)
         key = display.lower()
 
         # Disambiguate: if token4 exists, token3 is the club.
@@ -152,13 +171,9 @@ def parse_names_from_text(text: str) -> list[tuple[str, str, str | None]]:
         if m.start() in matched_spans:
             continue
 
-        last_raw = m.group(1)
-        first_raw = m.group(2)
-
-        if not _is_valid_name(last_raw, first_raw):
+        display = resolve(m.group(1), m.group(2))
+        if display is None:
             continue
-
-        display = _normalize_name(last_raw, first_raw)
         key = display.lower()
 
         if key not in seen:
@@ -12,7 +12,7 @@ from __future__ import annotations
 import io
 import json
 import re
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 
 import requests
 from bs4 import BeautifulSoup
@@ -21,7 +21,7 @@ from pypdf import PdfReader
 from ingestion.config import (
     IMD_RESULTS_URL,
     KNOWN_VENUES,
-    PCSS_PATTERNS,
+    PCSS_PATTERN,
     PCSS_RESULTS_CACHE_PATH,
     VENUE_NORMALIZE,
 )
@@ -156,9 +156,9 @@ def _venues_match(results_venue: str, event_venue: str) -> bool:
 
 def _dates_overlap(rs: date, re_: date, es: date, ee: date, tolerance: int = 1) -> bool:
     """Check if two date ranges overlap, with tolerance for edge cases."""
-    from datetime import timedelta
-    rs_adj = rs - timedelta(days=tolerance)
-    re_adj = re_ + timedelta(days=tolerance)
+    slack = timedelta(days=tolerance)
+    rs_adj = rs - slack
+    re_adj = re_ + slack
     return rs_adj <= ee and re_adj >= es
 
 
@@ -205,7 +205,7 @@ def _check_pdf_for_pcss(pdf_url: str) -> bool:
     if not text:
         return False
 
-    return any(p.search(text) for p in PCSS_PATTERNS)
+    return PCSS_PATTERN.search(text) is not None
 
 
 def _load_cache() -> dict:
@@ -1,6 +1,6 @@
 """Tag events for PCSS relevance using word-boundary regex patterns."""
 
-from ingestion.config import PCSS_PATTERNS
+from ingestion.config import PCSS_PATTERN
 
 
 def is_pcss_relevant(event: dict) -> bool:
@@ -15,8 +15,4 @@ def is_pcss_relevant(event: dict) -> bool:
         event.get("description", ""),
     ])
 
-    for pattern in PCSS_PATTERNS:
-        if pattern.search(searchable_text):
-            return True
-
-    return False
+    return PCSS_PATTERN.search(searchable_text) is not None
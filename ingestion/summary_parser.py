@@ -19,6 +19,13 @@ from ingestion.config import (
     VENUE_NORMALIZE,
 )
 
+# Lowercased lookup tables for the case-insensitive venue checks. On a
+# case-only collision the first VENUE_NORMALIZE entry wins, as a scan would.
+_KNOWN_VENUES_LOWER = frozenset(venue.lower() for venue in KNOWN_VENUES)
+_VENUE_ALIASES = {
+    typo.lower(): correct for typo, correct in reversed(VENUE_NORMALIZE.items())
+}
+
 
 def parse_summary(summary: str) -> dict:
     """Parse a SUMMARY string into structured components.
@@ -147,33 +154,24 @@ def _extract_disciplines(text: str) -> tuple:
 
     Returns (disciplines: list[str], counts: dict[str, int]).
     """
-    disciplines = []
     counts = {}
 
     # Split on "/" to handle "2 SL/2 GS/2 SG" or "SL/GS"
-    parts = text.split("/")
-    for part in parts:
-        part = part.strip()
+    for part in text.split("/"):
         match = DISCIPLINE_PATTERN.search(part)
         if match:
-            count_str = match.group(1)
-            disc_raw = match.group(2)
+            count_str, disc_raw = match.groups()
             disc = DISCIPLINE_NORMALIZE.get(disc_raw.lower(), disc_raw.upper())
-            count = int(count_str.strip()) if count_str else 1
-            if disc not in disciplines:
-                disciplines.append(disc)
-            counts[disc] = count
+            counts[disc] = int(count_str) if count_str else 1
 
-    return disciplines, counts
+    # A repeated discipline updates its count but keeps its first position,
+    # so the dict's key order is the discipline order.
+    return list(counts), counts
 
 
 def _is_venue(text: str) -> bool:
     """Check if text matches a known venue name."""
-    normalized = _normalize_venue(text)
-    for venue in KNOWN_VENUES:
-        if venue.lower() == normalized.lower():
-            return True
-    return False
+    return _normalize_venue(text).lower() in _KNOWN_VENUES_LOWER
 
 
 def _normalize_venue(venue: str) -> str:
@@ -183,7 +181,4 @@ def _normalize_venue(venue: str) -> str:
     if venue in VENUE_NORMALIZE:
         return VENUE_NORMALIZE[venue]
     # Check case-insensitive
-    for typo, correct in VENUE_NORMALIZE.items():
-        if venue.lower() == typo.lower():
-            return correct
-    return venue
+    return _VENUE_ALIASES.get(venue.lower(), venue)
@@ -9,6 +9,7 @@ RACE_DB_PATH = DATA_DIR / "race_database.json"
 FONTS_DIR = PROJECT_ROOT / "fonts"
 LOGO_PATH = PROJECT_ROOT / "site" / "assets" / "sim_sports_logo_horizontal_dark.jpg"
 OUTPUT_DIR = PROJECT_ROOT / "output" / "social"
+CACHE_DIR = PROJECT_ROOT / "output" / ".cache"
 VENUES_DIR = PROJECT_ROOT / "site" / "assets" / "venues"
 
 # Brand colors
@@ -44,6 +45,11 @@ FORMATS = {
     "reel": (1080, 1920),
 }
 
+# Formats that render pixel-identical images to another format
+FORMAT_ALIASES = {
+    "reel": "story",
+}
+
 # Template types
 TEMPLATE_TYPES = ["pre_race", "race_day", "weekly_preview", "weekend_preview", "monthly_calendar"]
 
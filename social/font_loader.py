@@ -1,15 +1,21 @@
 """Load Montserrat TTF fonts from the fonts/ directory."""
 
+from functools import lru_cache
+
 from PIL import ImageFont
 from social.config import FONTS_DIR
 
 
+@lru_cache(maxsize=None)
 def load_font(weight: str = "Regular", size: int = 32) -> ImageFont.FreeTypeFont:
     """Load a Montserrat font at the given weight and size.
 
     Args:
         weight: "Regular", "Bold", or "SemiBold"
         size: Font size in pixels
+
+    Fonts are cached per (weight, size), so repeated renders don't re-parse
+    the TTF. Treat the returned font as read-only.
     """
     path = FONTS_DIR / f"Montserrat-{weight}.ttf"
     if not path.exists():
@@ -12,11 +12,16 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import os
 import re
+import shutil
 import subprocess
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
 from social.captions import (
@@ -25,13 +30,40 @@ from social.captions import (
     generate_weekend_caption,
     _write_caption_file,
 )
-from social.config import FORMATS, OUTPUT_DIR, RACE_DB_PATH, TEMPLATE_TYPES
+from social.config import (
+    FONTS_DIR,
+    FORMAT_ALIASES,
+    FORMATS,
+    LOGO_PATH,
+    OUTPUT_DIR,
+    RACE_DB_PATH,
+    TEMPLATE_TYPES,
+    VENUES_DIR,
+)
 from social.templates.pre_race import PreRaceTemplate
 from social.templates.race_day import RaceDayTemplate
 from social.templates.weekly_preview import WeeklyPreviewTemplate
 from social.templates.weekend_preview import WeekendPreviewTemplate
 from social.templates.monthly_calendar import MonthlyCalendarTemplate
 
+# Part of every render key: bump when templates, fonts, assets or renderer
+# changes alter output pixels, so reruns re-render instead of keeping old PNGs
+_RENDER_VERSION = 1
+
+# PNG encoding releases the GIL, so saves run here while the next image renders.
+# Each template owns its canvas, so a submitted save never races a render.
+_SAVE_POOL = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+
+
+def _reset_save_pool() -> None:
+    """Give a forked worker its own save pool; the parent's threads don't survive fork."""
+    global _SAVE_POOL
+    _SAVE_POOL = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_save_pool)
+
 
 def load_events() -> list[dict]:
     """Load events from the race database."""
@@ -43,18 +75,30 @@ def load_events() -> list[dict]:
 def filter_pcss_upcoming(events: list[dict]) -> list[dict]:
     """Filter to PCSS-relevant upcoming events."""
     today = date.today().isoformat()
-    return [
-        e for e in events
-        if e.get("pcss_relevant")
-        and e.get("dates", {}).get("end", "") >= today
-    ]
 
+    def is_upcoming_pcss(e: dict) -> bool:
+        return bool(e.get("pcss_relevant")) and (e.get("dates") or {}).get("end", "") >= today
 
-def get_weekly_events(events: list[dict]) -> list[dict]:
-    """Get PCSS events happening this week (Mon-Sun)."""
-    today = date.today()
+    return list(filter(is_upcoming_pcss, events))
+
+
+def _week_bounds(today: date) -> tuple[date, date]:
+    """Return (Monday, Sunday) of the week containing today."""
     monday = today - timedelta(days=today.weekday())
-    sunday = monday + timedelta(days=6)
+    return monday, monday + timedelta(days=6)
+
+
+def _weekend_bounds(today: date) -> tuple[date, date]:
+    """Return (Friday, Sunday) of the upcoming weekend."""
+    # Friday of this week (weekday 4)
+    days_to_friday = (4 - today.weekday()) % 7
+    friday = today + timedelta(days=days_to_friday)
+    return friday, friday + timedelta(days=2)
+
+
+def get_weekly_events(events: list[dict], ref_date: date | None = None) -> list[dict]:
+    """Get PCSS events happening this week (Mon-Sun)."""
+    monday, sunday = _week_bounds(ref_date or date.today())
     mon_str = monday.isoformat()
     sun_str = sunday.isoformat()
 
@@ -66,13 +110,9 @@ def get_weekly_events(events: list[dict]) -> list[dict]:
     ]
 
 
-def get_weekend_events(events: list[dict]) -> list[dict]:
+def get_weekend_events(events: list[dict], ref_date: date | None = None) -> list[dict]:
     """Get ALL events happening this weekend (Fri-Sun)."""
-    today = date.today()
-    # Friday of this week (weekday 4)
-    days_to_friday = (4 - today.weekday()) % 7
-    friday = today + timedelta(days=days_to_friday)
-    sunday = friday + timedelta(days=2)
+    friday, sunday = _weekend_bounds(ref_date or date.today())
     fri_str = friday.isoformat()
     sun_str = sunday.isoformat()
 
@@ -83,6 +123,64 @@ def get_weekend_events(events: list[dict]) -> list[dict]:
     ]
 
 
+def _window_buckets(events: list[dict], today: date, include_all: bool = False) -> dict[str, list[dict]]:
+    """Sort events into every posting window relative to today, in one pass.
+
+    The single home of the window bounds and predicates; partition_events and
+    bucketize_events each return the buckets they need from it. Keys:
+      - "upcoming": PCSS events (all events with include_all) ending today or later
+      - "today": PCSS events starting today (race day)
+      - "in_2_days": PCSS events starting two days later (pre-race)
+      - "this_week": PCSS events overlapping today's Mon-Sun week
+      - "this_weekend": all events overlapping the upcoming Fri-Sun
+    """
+    monday, sunday = _week_bounds(today)
+    friday, weekend_end = _weekend_bounds(today)
+    today_str = today.isoformat()
+    pre_race_str = (today + timedelta(days=2)).isoformat()
+    mon_str, sun_str = monday.isoformat(), sunday.isoformat()
+    fri_str, weekend_end_str = friday.isoformat(), weekend_end.isoformat()
+
+    buckets: dict[str, list[dict]] = {
+        "upcoming": [], "today": [], "in_2_days": [], "this_week": [], "this_weekend": [],
+    }
+    for e in events:
+        dates = e.get("dates") or {}
+        end = dates.get("end", "")
+        # Monday is the earliest bound of any window
+        if end < mon_str:
+            continue
+        start = dates.get("start", "")
+        pcss = e.get("pcss_relevant")
+        if end >= today_str and (pcss or include_all):
+            buckets["upcoming"].append(e)
+        if pcss:
+            if start == today_str:
+                buckets["today"].append(e)
+            elif start == pre_race_str:
+                buckets["in_2_days"].append(e)
+            if start <= sun_str:
+                buckets["this_week"].append(e)
+        if end >= fri_str and start <= weekend_end_str:
+            buckets["this_weekend"].append(e)
+    return buckets
+
+
+def partition_events(
+    events: list[dict],
+    include_all: bool = False,
+    ref_date: date | None = None,
+) -> tuple[list[dict], list[dict], list[dict]]:
+    """Split events into (upcoming, weekly, weekend) in a single pass.
+
+    Equivalent to filter_pcss_upcoming + get_weekly_events +
+    get_weekend_events, but walks the event list once. With include_all,
+    the upcoming bucket also keeps non-PCSS events.
+    """
+    buckets = _window_buckets(events, ref_date or date.today(), include_all)
+    return buckets["upcoming"], buckets["this_week"], buckets["this_weekend"]
+
+
 def get_pre_race_events(events: list[dict], days_ahead: int = 2, ref_date: date | None = None) -> list[dict]:
     """Get PCSS events starting in exactly N days."""
     target = (ref_date or date.today()) + timedelta(days=days_ahead)
@@ -104,6 +202,158 @@ def get_race_day_events(events: list[dict], ref_date: date | None = None) -> lis
     ]
 
 
+def bucketize_events(events: list[dict], ref_date: date | None = None) -> dict[str, list[dict]]:
+    """Sort events into the scheduler's posting windows in a single pass.
+
+    Returns a dict with:
+      - "today": PCSS events starting on ref_date (race day)
+      - "in_2_days": PCSS events starting two days later (pre-race)
+      - "this_week": PCSS events overlapping ref_date's Mon-Sun week
+      - "this_weekend": all events overlapping the upcoming Fri-Sun
+
+    Same results as the get_*_events helpers, all relative to ref_date.
+    """
+    buckets = _window_buckets(events, ref_date or date.today())
+    del buckets["upcoming"]
+    return buckets
+
+
+# Output folders known to exist, filled one directory listing at a time
+_known_dirs: set[str] = set()
+_scanned_parents: set[str] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """mkdir -p, but list each parent once instead of calling mkdir per folder.
+
+    On reruns nearly every event folder already exists, so a single scandir of
+    OUTPUT_DIR answers for all of them.
+    """
+    key = str(path)
+    if key in _known_dirs:
+        return
+    parent = str(path.parent)
+    if parent not in _scanned_parents:
+        _scanned_parents.add(parent)
+        try:
+            with os.scandir(parent) as entries:
+                _known_dirs.update(e.path for e in entries if e.is_dir())
+        except FileNotFoundError:
+            pass
+        if key in _known_dirs:
+            return
+    path.mkdir(parents=True, exist_ok=True)
+    _known_dirs.add(key)
+
+
+def _reset_known_dirs() -> None:
+    """Forget which output folders exist (e.g. after OUTPUT_DIR was wiped)."""
+    _known_dirs.clear()
+    _scanned_parents.clear()
+
+
+@lru_cache(maxsize=1)
+def _asset_stamp() -> str:
+    """Fingerprint (name, size, mtime) of the logo, font and venue photo files.
+
+    Taken over all venue photos rather than the one a render uses, so
+    replacing any photo re-renders everything; stat'ed once per process.
+    """
+    parts = []
+    for path in (LOGO_PATH, *sorted(FONTS_DIR.glob("*")), *sorted(VENUES_DIR.glob("*"))):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue
+        parts.append(f"{path.name}:{st.st_size}:{st.st_mtime_ns}")
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def _render_key(*parts) -> str:
+    """Stable SHA1 over everything that feeds a render (kind, format, event data).
+
+    Includes _RENDER_VERSION and the asset files' stamp, so images rendered by
+    older code or from since-replaced fonts, logo or venue photos count as stale.
+    """
+    payload = json.dumps(
+        (_RENDER_VERSION, _asset_stamp(), *parts), sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _key_path(path: Path) -> Path:
+    """Sidecar file recording the render key of an output image."""
+    return path.with_name(path.name + ".sha1")
+
+
+def _is_fresh(path: Path, key: str) -> bool:
+    """True if path was rendered from exactly this input."""
+    try:
+        return path.exists() and _key_path(path).read_text().strip() == key
+    except OSError:
+        return False
+
+
+def _save_rendered(template, targets: list[tuple[Path, str]]) -> None:
+    """Save a rendered template to each (path, key) target.
+
+    The PNG is encoded once and copied to any further targets; each gets its
+    key recorded so reruns can skip it. Old keys are removed first and the PNG
+    is swapped in whole, so an interrupted save never leaves a partial image
+    that still looks fresh.
+    """
+    for path, _ in targets:
+        _key_path(path).unlink(missing_ok=True)
+    first = targets[0][0]
+    tmp_path = first.with_name(f"{first.name}.{os.getpid()}.tmp")
+    try:
+        template.save(tmp_path, create_parent=False)
+    except FileNotFoundError:
+        # The folder was removed after _ensure_dir cached it; recreate it
+        _reset_known_dirs()
+        template.save(tmp_path, create_parent=True)
+    os.replace(tmp_path, first)
+    for path, key in targets:
+        if path != first:
+            shutil.copyfile(first, path)
+        _key_path(path).write_text(key + "\n")
+
+
+def _render_formats(
+    template_cls: type,
+    kind: str,
+    out_dir: Path,
+    formats: list[str],
+    render_kwargs: dict,
+    saves: list[Future],
+    force: bool = False,
+) -> list[Path]:
+    """Render kind in each format, once per distinct layout (see FORMAT_ALIASES).
+
+    Saves are queued onto saves; returns the image paths in format order.
+    """
+    outputs = []
+    groups: dict[str, list[tuple[Path, str]]] = {}
+    for fmt in formats:
+        path = out_dir / f"{kind}_{fmt}.png"
+        key = _render_key(kind, fmt, render_kwargs)
+        if force or not _is_fresh(path, key):
+            groups.setdefault(FORMAT_ALIASES.get(fmt, fmt), []).append((path, key))
+        outputs.append(path)
+
+    for layout, targets in groups.items():
+        template = template_cls(layout)
+        template.render(**render_kwargs)
+        saves.append(_SAVE_POOL.submit(_save_rendered, template, targets))
+    return outputs
+
+
+def _wait_for_saves(saves: list[Future]) -> None:
+    """Block until queued saves finish, re-raising the first failure."""
+    for future in saves:
+        future.result()
+
+
 def _event_folder_name(event: dict) -> str:
     """Build a descriptive, filesystem-safe folder name from event data.
 
@@ -134,28 +384,26 @@ def generate_event_images(
     formats: list[str],
     all_events: list[dict] | None = None,
     captions_only: bool = False,
+    force: bool = False,
 ) -> list[Path]:
-    """Generate images for a single event. Returns list of output paths."""
+    """Generate images for a single event. Returns list of output paths.
+
+    Images whose .sha1 sidecar matches the current event data are left as-is
+    unless force is set.
+    """
     outputs = []
+    saves: list[Future] = []
     event_dir = OUTPUT_DIR / _event_folder_name(event)
 
     if not captions_only:
-        for fmt in formats:
-            if "pre_race" in types:
-                template = PreRaceTemplate(fmt)
-                template.render(event=event)
-                path = event_dir / f"pre_race_{fmt}.png"
-                template.save(path)
-                outputs.append(path)
-
-            if "race_day" in types:
-                template = RaceDayTemplate(fmt)
-                template.render(event=event)
-                path = event_dir / f"race_day_{fmt}.png"
-                template.save(path)
-                outputs.append(path)
-
-    # Generate captions
+        _ensure_dir(event_dir)
+        for kind, template_cls in (("pre_race", PreRaceTemplate), ("race_day", RaceDayTemplate)):
+            if kind in types:
+                outputs.extend(_render_formats(
+                    template_cls, kind, event_dir, formats, {"event": event}, saves, force=force,
+                ))
+
+    # Generate captions while the last images are still being written
     captions = generate_event_captions(event, all_events or [])
     sections = {}
     for caption_type in ("pre_race", "race_day"):
@@ -169,86 +417,88 @@ def generate_event_images(
         caption_path = _write_caption_file(event_dir / "captions.txt", sections)
         outputs.append(caption_path)
 
+    _wait_for_saves(saves)
     return outputs
 
 
-def generate_weekly_images(
-    events: list[dict],
+def _generate_collection(
+    template_cls: type,
+    kind: str,
+    out_dir: Path,
     formats: list[str],
+    render_kwargs: dict,
+    caption_sections: dict[str, str] | None = None,
     captions_only: bool = False,
+    force: bool = False,
 ) -> list[Path]:
-    """Generate weekly preview images. Returns list of output paths."""
-    if not events:
-        return []
+    """Render one multi-event template in every format, plus its captions.
 
-    today = date.today()
-    monday = today - timedelta(days=today.weekday())
-    sunday = monday + timedelta(days=6)
-    week_dir = OUTPUT_DIR / f"This Week in PC Ski Racing {monday.strftime('%b %-d')}-{sunday.strftime('%-d')}"
+    Shared by the weekly, weekend and monthly generators. Images go to
+    out_dir as '<kind>_<fmt>.png'; caption_sections (instagram/facebook/short)
+    are written to captions.txt when any of them is non-empty.
+    """
     outputs = []
+    saves: list[Future] = []
 
     if not captions_only:
-        for fmt in formats:
-            template = WeeklyPreviewTemplate(fmt)
-            template.render(events=events)
-            path = week_dir / f"weekly_preview_{fmt}.png"
-            template.save(path)
-            outputs.append(path)
-
-    # Generate captions
-    caption_sections = generate_weekly_caption(events)
-    if any(caption_sections.values()):
+        _ensure_dir(out_dir)
+        outputs.extend(_render_formats(
+            template_cls, kind, out_dir, formats, render_kwargs, saves, force=force,
+        ))
+
+    if caption_sections and any(caption_sections.values()):
         sections = {
             "INSTAGRAM": caption_sections["instagram"],
             "FACEBOOK": caption_sections["facebook"],
             "SHORT (Blog/Email)": caption_sections["short"],
         }
-        caption_path = _write_caption_file(week_dir / "captions.txt", sections)
+        caption_path = _write_caption_file(out_dir / "captions.txt", sections)
         outputs.append(caption_path)
 
+    _wait_for_saves(saves)
     return outputs
 
 
+def generate_weekly_images(
+    events: list[dict],
+    formats: list[str],
+    captions_only: bool = False,
+    force: bool = False,
+) -> list[Path]:
+    """Generate weekly preview images. Returns list of output paths."""
+    if not events:
+        return []
+
+    monday, sunday = _week_bounds(date.today())
+    week_dir = OUTPUT_DIR / f"This Week in PC Ski Racing {monday.strftime('%b %-d')}-{sunday.strftime('%-d')}"
+    return _generate_collection(
+        WeeklyPreviewTemplate, "weekly_preview", week_dir, formats,
+        {"events": events}, generate_weekly_caption(events),
+        captions_only=captions_only, force=force,
+    )
+
+
 def generate_weekend_images(
     events: list[dict],
     formats: list[str],
     captions_only: bool = False,
+    force: bool = False,
 ) -> list[Path]:
     """Generate weekend preview images. Returns list of output paths."""
     if not events:
         return []
 
-    today = date.today()
-    days_to_friday = (4 - today.weekday()) % 7
-    friday = today + timedelta(days=days_to_friday)
-    sunday = friday + timedelta(days=2)
+    friday, sunday = _weekend_bounds(date.today())
     if friday.month == sunday.month:
         date_range = f"{friday.strftime('%b %-d')}-{sunday.strftime('%-d')}"
     else:
         date_range = f"{friday.strftime('%b %-d')}-{sunday.strftime('%b %-d')}"
     week_dir = OUTPUT_DIR / f"This Weekend in PC Ski Racing {date_range}"
-    outputs = []
-
-    if not captions_only:
-        for fmt in formats:
-            template = WeekendPreviewTemplate(fmt)
-            template.render(events=events)
-            path = week_dir / f"weekend_preview_{fmt}.png"
-            template.save(path)
-            outputs.append(path)
-
-    # Generate captions
-    caption_sections = generate_weekend_caption(events)
-    if any(caption_sections.values()):
-        sections = {
-            "INSTAGRAM": caption_sections["instagram"],
-            "FACEBOOK": caption_sections["facebook"],
-            "SHORT (Blog/Email)": caption_sections["short"],
-        }
-        caption_path = _write_caption_file(week_dir / "captions.txt", sections)
-        outputs.append(caption_path)
-
-    return outputs
+    return _generate_collection(
+        WeekendPreviewTemplate, "weekend_preview", week_dir, formats,
+        {"events": events}, generate_weekend_caption(events),
+        captions_only=captions_only, force=force,
+    )
 
 
 def generate_monthly_images(
@@ -256,20 +506,26 @@ def generate_monthly_images(
     year: int,
     month: int,
     formats: list[str],
+    force: bool = False,
 ) -> list[Path]:
     """Generate monthly calendar images. Returns list of output paths."""
     month_name = date(year, month, 1).strftime("%B %Y")
     month_dir = OUTPUT_DIR / f"Monthly Calendar {month_name}"
-    outputs = []
+    return _generate_collection(
+        MonthlyCalendarTemplate, "monthly_calendar", month_dir, formats,
+        {"events": events, "year": year, "month": month},
+        force=force,
+    )
 
-    for fmt in formats:
-        template = MonthlyCalendarTemplate(fmt)
-        template.render(events=events, year=year, month=month)
-        path = month_dir / f"monthly_calendar_{fmt}.png"
-        template.save(path)
-        outputs.append(path)
 
-    return outputs
+def _open_preview(path: str) -> None:
+    """Open a file in the default viewer without waiting for it."""
+    subprocess.Popen(
+        ["open", path],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
 
 
 def main():
@@ -281,7 +537,9 @@ def main():
     parser.add_argument("--preview", action="store_true", help="Open first image after generation")
     parser.add_argument("--all-events", action="store_true", help="Include non-PCSS events too")
     parser.add_argument("--captions-only", action="store_true", help="Generate captions without images (fast, no Pillow needed)")
+    parser.add_argument("--force", action="store_true", help="Re-render images even if their inputs (event data, render code version, fonts, logo, venue photos) are unchanged")
     args = parser.parse_args()
+    _reset_known_dirs()
 
     types = [args.type] if args.type else ["pre_race", "race_day"]
     formats = [args.format] if args.format else list(FORMATS.keys())
@@ -303,7 +561,7 @@ def main():
             year, month = today.year, today.month
 
         print(f"Generating monthly calendar for {year}-{month:02d}")
-        outputs = generate_monthly_images(events, year, month, formats)
+        outputs = generate_monthly_images(events, year, month, formats, force=args.force)
         all_outputs.extend(outputs)
 
         print(f"\nGenerated {len(all_outputs)} image(s)")
@@ -313,28 +571,23 @@ def main():
         if args.preview and all_outputs:
             first = str(all_outputs[0])
             print(f"\nOpening: {first}")
-            subprocess.run(["open", first])
+            _open_preview(first)
         return
 
     if args.event:
         # Specific event
-        matching = [e for e in events if e["id"] == args.event]
-        if not matching:
+        event = next((e for e in events if e["id"] == args.event), None)
+        if event is None:
             print(f"Event not found: {args.event}")
             sys.exit(1)
-        event = matching[0]
         print(f"Generating for: {event['name']}")
-        outputs = generate_event_images(event, types, formats, all_events=events, captions_only=args.captions_only)
+        outputs = generate_event_images(event, types, formats, all_events=events, captions_only=args.captions_only, force=args.force)
         all_outputs.extend(outputs)
     else:
-        # All upcoming PCSS events
-        if args.all_events:
-            upcoming = [
-                e for e in events
-                if e.get("dates", {}).get("end", "") >= date.today().isoformat()
-            ]
-        else:
-            upcoming = filter_pcss_upcoming(events)
+        # All upcoming PCSS events, plus this week's and weekend's windows
+        upcoming, weekly_events, weekend_events = partition_events(
+            events, include_all=args.all_events,
+        )
 
         if not upcoming:
             print("No upcoming PCSS events found.")
@@ -347,25 +600,23 @@ def main():
         if event_types:
             for event in upcoming:
                 print(f"  Generating: {event['name']}")
-                outputs = generate_event_images(event, event_types, formats, all_events=events, captions_only=args.captions_only)
+                outputs = generate_event_images(event, event_types, formats, all_events=events, captions_only=args.captions_only, force=args.force)
                 all_outputs.extend(outputs)
 
         # Generate weekly preview
         if "weekly_preview" in types or args.type is None:
-            weekly_events = get_weekly_events(events)
             if weekly_events:
                 print(f"  Generating weekly preview ({len(weekly_events)} events)")
-                outputs = generate_weekly_images(weekly_events, formats, captions_only=args.captions_only)
+                outputs = generate_weekly_images(weekly_events, formats, captions_only=args.captions_only, force=args.force)
                 all_outputs.extend(outputs)
             else:
                 print("  No PCSS events this week, skipping weekly preview")
 
         # Generate weekend preview
         if "weekend_preview" in types or args.type is None:
-            weekend_events = get_weekend_events(events)
             if weekend_events:
                 print(f"  Generating weekend preview ({len(weekend_events)} events)")
-                outputs = generate_weekend_images(weekend_events, formats, captions_only=args.captions_only)
+                outputs = generate_weekend_images(weekend_events, formats, captions_only=args.captions_only, force=args.force)
                 all_outputs.extend(outputs)
             else:
                 print("  No events this weekend, skipping weekend preview")
@@ -378,7 +629,7 @@ def main():
     if args.preview and all_outputs:
         first = str(all_outputs[0])
         print(f"\nOpening: {first}")
-        subprocess.run(["open", first])
+        _open_preview(first)
 
 
 if __name__ == "__main__":
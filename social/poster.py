@@ -7,17 +7,30 @@ Usage:
     python3 -m social.poster "Folder Name" --facebook-only
     python3 -m social.poster "Folder Name" --instagram-only
     python3 -m social.poster "Folder Name" --type pre_race
+    python3 -m social.poster "Folder Name" --batch    # One batched upload request
+    python3 -m social.poster "Folder A" "Folder B"    # Post several folders in parallel
 """
 
 from __future__ import annotations
 
 import argparse
+import json
 import os
+import random
 import sys
 import time
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable
+from urllib.parse import urlencode
 
 import requests
+from PIL import Image
+from requests import RequestException
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder
+from urllib3.util.retry import Retry
 
 from social.captions import get_caption_for_platform, parse_caption_file
 from social.config import (
@@ -26,6 +39,43 @@ from social.config import (
     PLATFORM_FORMAT_MAP,
     TEMPLATE_TYPES,
 )
+from social.poster_cache import CACHE_MODES, CDN_STALE_TTL, CDN_TTL, UPLOAD_TTL, PosterCache, file_digest
+from social.rate_limit import TokenBucket
+
+
+class ImagePreflightError(RuntimeError):
+    """An image would be rejected by Meta, so it was not uploaded."""
+
+
+# Upload limits enforced by the Graph API
+_MAX_IMAGE_BYTES = {"facebook": 10 * 1024 * 1024, "instagram": 8 * 1024 * 1024}
+_IG_ASPECT_RANGE = (0.8, 1.91)
+
+
+def _preflight_image(path: Path, platform: str) -> None:
+    """Check size, format and (for Instagram) aspect ratio before uploading.
+
+    Only the file size and image header are read. Raises ImagePreflightError.
+    """
+    size = path.stat().st_size
+    limit = _MAX_IMAGE_BYTES[platform]
+    if size >= limit:
+        raise ImagePreflightError(
+            f"{path.name} is {size / 1024 / 1024:.1f} MB; {platform} allows under {limit // 1024 // 1024} MB"
+        )
+    try:
+        with Image.open(path) as im:
+            fmt, (width, height) = im.format, im.size
+    except (OSError, SyntaxError) as e:
+        raise ImagePreflightError(f"{path.name} is not a readable image: {e}")
+    if fmt not in ("PNG", "JPEG"):
+        raise ImagePreflightError(f"{path.name} is {fmt}; expected PNG or JPEG")
+    if platform == "instagram":
+        low, high = _IG_ASPECT_RANGE
+        if not low <= width / height <= high:
+            raise ImagePreflightError(
+                f"{path.name} aspect ratio {width / height:.2f} is outside Instagram's {low}-{high}"
+            )
 
 
 def _check_response(resp: requests.Response, context: str) -> dict:
@@ -40,54 +90,196 @@ def _check_response(resp: requests.Response, context: str) -> dict:
     except ValueError:
         raise RuntimeError(f"{context}: non-JSON response ({resp.status_code}): {resp.text[:200]}")
 
-    if "error" in data:
-        err = data["error"]
-        code = err.get("code", 0)
-        msg = err.get("message", "Unknown error")
-
-        if code in (4, 32, 613):
-            raise RuntimeError(f"{context}: rate limited (code {code}). Wait and retry. API said: {msg}")
-        if code == 190:
-            raise RuntimeError(
-                f"{context}: access token expired or invalid (code 190). "
-                f"Generate a new Page Access Token. API said: {msg}"
-            )
-        raise RuntimeError(f"{context}: API error (code {code}): {msg}")
-
+    _raise_for_api_error(data, context)
     resp.raise_for_status()
     return data
 
 
+def _raise_for_api_error(data, context: str) -> None:
+    """Raise a RuntimeError if a decoded Graph API payload carries an error."""
+    if not isinstance(data, dict) or "error" not in data:
+        return
+    err = data["error"]
+    code = err.get("code", 0)
+    msg = err.get("message", "Unknown error")
+
+    if code in (4, 32, 613):
+        raise RuntimeError(f"{context}: rate limited (code {code}). Wait and retry. API said: {msg}")
+    if code == 190:
+        raise RuntimeError(
+            f"{context}: access token expired or invalid (code 190). "
+            f"Generate a new Page Access Token. API said: {msg}"
+        )
+    raise RuntimeError(f"{context}: API error (code {code}): {msg}")
+
+
+def _check_batch_response(
+    resp: requests.Response, names: list[str]
+) -> dict[str, dict | RuntimeError]:
+    """Decode a Graph API batch response into {operation name: body or error}.
+
+    A failed batch request raises like ``_check_response``. Each sub-response
+    carries its own status code and JSON-encoded body; a failed operation is
+    returned as a RuntimeError with the same messages rather than raised, so
+    the caller keeps the results of the operations that did succeed.
+    """
+    entries = _check_response(resp, "Batch request")
+    if not isinstance(entries, list) or len(entries) != len(names):
+        raise RuntimeError(f"Batch request: unexpected response: {str(entries)[:200]}")
+
+    outcomes: dict[str, dict | RuntimeError] = {}
+    for name, entry in zip(names, entries):
+        try:
+            outcomes[name] = _batch_entry_body(name, entry)
+        except RuntimeError as e:
+            outcomes[name] = e
+    return outcomes
+
+
+def _batch_entry_body(name: str, entry: dict | None) -> dict:
+    """Decode one batch sub-response, raising if the operation failed."""
+    if entry is None:
+        raise RuntimeError(f"Batch {name}: no response (an earlier operation failed)")
+    try:
+        body = json.loads(entry.get("body") or "{}")
+    except ValueError:
+        raise RuntimeError(f"Batch {name}: non-JSON response ({entry.get('code')}): {entry.get('body', '')[:200]}")
+    _raise_for_api_error(body, f"Batch {name}")
+    if entry.get("code", 200) >= 400:
+        raise RuntimeError(f"Batch {name}: HTTP {entry.get('code')}: {str(body)[:200]}")
+    return body
+
+
+def _batch_body(outcomes: dict[str, dict | RuntimeError], *names: str) -> dict:
+    """Body of the last of a chain of batch operations; raises the first failure."""
+    for name in names:
+        if isinstance(outcomes[name], RuntimeError):
+            raise outcomes[name]
+    return outcomes[names[-1]]
+
+
+# Priority order: prefer aggregate types over single-event types
+_CONTENT_TYPE_PRIORITY = ("weekend_preview", "weekly_preview", "monthly_calendar", "race_day", "pre_race")
+
+
 def detect_content_type(folder: Path) -> str:
     """Detect the content type from files present in an output folder.
 
     Returns one of the TEMPLATE_TYPES values.
     """
-    filenames = {f.name for f in folder.iterdir()} if folder.is_dir() else set()
-    # Priority order: prefer aggregate types over single-event types
-    for prefix in ("weekend_preview", "weekly_preview", "monthly_calendar", "race_day", "pre_race"):
-        if any(name.startswith(prefix) for name in filenames):
-            return prefix
-    return "pre_race"
+    best = len(_CONTENT_TYPE_PRIORITY)
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                for rank, prefix in enumerate(_CONTENT_TYPE_PRIORITY[:best]):
+                    if entry.name.startswith(prefix):
+                        best = rank
+                        break
+                if best == 0:
+                    break
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return _CONTENT_TYPE_PRIORITY[best] if best < len(_CONTENT_TYPE_PRIORITY) else "pre_race"
+
+
+def _sink_result(platform: str, job: Callable[[], str]) -> str:
+    """Run a posting pipeline and describe its outcome.
+
+    A failed preflight is reported as a skip and any other error as a
+    failure, so one platform's error never hides another's successful post.
+    """
+    try:
+        return job()
+    except ImagePreflightError as e:
+        print(f"  Skipped: {e}")
+        return f"skipped: {e}"
+    except Exception as e:
+        print(f"  {platform.capitalize()}: failed: {e}")
+        return f"failed: {e}"
 
 
 class MetaPoster:
     """Client for posting images to Facebook and Instagram via the Meta Graph API."""
 
-    # Seconds to wait between Instagram container status polls
-    POLL_INTERVAL = 3
-    MAX_POLLS = 20
+    # Instagram container status polling: exponential backoff (seconds)
+    INITIAL_POLL = 0.3
+    MAX_POLL = 5.0
+    POLL_DEADLINE_S = 60
+
+    # Local pacing for Graph API calls (override with META_RATE_PER_MIN)
+    RATE_PER_MIN = 180
+    RATE_BURST = 30
 
     def __init__(
         self,
         page_access_token: str,
         page_id: str,
         ig_user_id: str,
+        cache: PosterCache | None = None,
+        allow_stale: bool = True,
     ):
         self.token = page_access_token
         self.page_id = page_id
         self.ig_user_id = ig_user_id
         self.api = META_GRAPH_API_BASE
+        self.session = self._build_session()
+        self.cache = cache
+        self.allow_stale = allow_stale
+        self.rate_limiter = TokenBucket(
+            rate_per_min=float(os.environ.get("META_RATE_PER_MIN", self.RATE_PER_MIN)),
+            burst=self.RATE_BURST,
+        )
+
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """Keep-alive session with pooled connections to graph.facebook.com.
+
+        Transient 429/5xx responses are retried for GETs only; retrying a POST
+        could publish the same photo twice.
+        """
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        return session
+
+    def _post(self, url: str, **kwargs) -> requests.Response:
+        """Rate-limited ``session.post``."""
+        self.rate_limiter.acquire()
+        return self.session.post(url, **kwargs)
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """Rate-limited ``session.get``."""
+        self.rate_limiter.acquire()
+        return self.session.get(url, **kwargs)
+
+    def close(self) -> None:
+        """Close pooled connections and the response cache."""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    def __enter__(self) -> MetaPoster:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _post_image(self, url: str, image_path: Path, fields: dict[str, str]) -> requests.Response:
+        """POST form fields plus the image as ``source``, streamed from disk.
+
+        MultipartEncoder reads the file in chunks as the socket drains, so
+        large PNGs are never held in memory as one encoded body.
+        """
+        with open(image_path, "rb") as f:
+            encoder = MultipartEncoder(fields={**fields, "source": (image_path.name, f, "image/png")})
+            return self._post(url, data=encoder, headers={"Content-Type": encoder.content_type})
 
     # ------------------------------------------------------------------
     # Facebook
@@ -99,13 +291,9 @@ class MetaPoster:
         Uses multipart upload via ``POST /{page_id}/photos``.
         Returns the API response dict (contains ``id`` and ``post_id``).
         """
+        _preflight_image(image_path, "facebook")
         url = f"{self.api}/{self.page_id}/photos"
-        with open(image_path, "rb") as f:
-            resp = requests.post(
-                url,
-                files={"source": (image_path.name, f, "image/png")},
-                data={"caption": caption, "access_token": self.token},
-            )
+        resp = self._post_image(url, image_path, {"caption": caption, "access_token": self.token})
         return _check_response(resp, f"Facebook post ({image_path.name})")
 
     def get_photo_cdn_url(self, photo_id: str) -> str:
@@ -113,31 +301,54 @@ class MetaPoster:
 
         Uses ``GET /{photo_id}?fields=images`` and returns the largest image URL.
         """
+        if self.cache is not None:
+            cached = self.cache.get("cdn", photo_id, CDN_TTL)
+            if cached:
+                return cached
+            self.cache.check_miss("cdn", photo_id)
+
         url = f"{self.api}/{photo_id}"
-        resp = requests.get(url, params={"fields": "images", "access_token": self.token})
-        data = _check_response(resp, f"Get photo CDN URL ({photo_id})")
-        images = data.get("images", [])
-        if not images:
-            raise RuntimeError(f"No images returned for photo {photo_id}")
+        try:
+            resp = self._get(url, params={"fields": "images", "access_token": self.token})
+            data = _check_response(resp, f"Get photo CDN URL ({photo_id})")
+            images = data.get("images", [])
+            if not images:
+                raise RuntimeError(f"No images returned for photo {photo_id}")
+        except (RequestException, RuntimeError):
+            # CDN URLs stay valid for hours, so a recent one beats failing the post
+            stale = None
+            if self.allow_stale and self.cache is not None:
+                stale = self.cache.get("cdn", photo_id, CDN_STALE_TTL)
+            if not stale:
+                raise
+            warnings.warn(f"CDN fetch failed for photo {photo_id}, using stale URL", stacklevel=2)
+            return stale
         # images are sorted largest-first by default
-        return images[0]["source"]
+        cdn_url = images[0]["source"]
+        if self.cache is not None:
+            self.cache.set("cdn", photo_id, cdn_url)
+        return cdn_url
 
     def _upload_unpublished(self, image_path: Path) -> str:
         """Upload a photo to Facebook without publishing it.
 
         Returns the photo ID, which can be used to get a CDN URL for Instagram.
+        Identical image bytes reuse a cached upload for up to a week.
         """
+        _preflight_image(image_path, "instagram")
+        cache_key = None
+        if self.cache is not None:
+            cache_key = f"{self.page_id}:{file_digest(image_path)}"
+            cached = self.cache.get("upload", cache_key, UPLOAD_TTL)
+            if cached:
+                return cached
+            self.cache.check_miss("upload", cache_key)
+
         url = f"{self.api}/{self.page_id}/photos"
-        with open(image_path, "rb") as f:
-            resp = requests.post(
-                url,
-                files={"source": (image_path.name, f, "image/png")},
-                data={
-                    "published": "false",
-                    "access_token": self.token,
-                },
-            )
+        resp = self._post_image(url, image_path, {"published": "false", "access_token": self.token})
         data = _check_response(resp, f"Unpublished upload ({image_path.name})")
+        if cache_key is not None:
+            self.cache.set("upload", cache_key, data["id"])
         return data["id"]
 
     # ------------------------------------------------------------------
@@ -147,8 +358,10 @@ class MetaPoster:
     def _wait_for_container(self, container_id: str) -> None:
         """Poll an Instagram media container until its status is FINISHED."""
         url = f"{self.api}/{container_id}"
-        for _ in range(self.MAX_POLLS):
-            resp = requests.get(
+        delay = self.INITIAL_POLL
+        deadline = time.monotonic() + self.POLL_DEADLINE_S
+        while True:
+            resp = self._get(
                 url,
                 params={"fields": "status_code", "access_token": self.token},
             )
@@ -158,7 +371,11 @@ class MetaPoster:
                 return
             if status == "ERROR":
                 raise RuntimeError(f"Instagram container {container_id} failed: {data}")
-            time.sleep(self.POLL_INTERVAL)
+            if time.monotonic() + delay > deadline:
+                break
+            # Small images finish in well under a second; back off for big ones
+            time.sleep(delay + random.uniform(0, delay * 0.2))
+            delay = min(delay * 2, self.MAX_POLL)
         raise RuntimeError(f"Instagram container {container_id} did not finish in time")
 
     def post_to_instagram(self, image_url: str, caption: str) -> dict:
@@ -172,7 +389,7 @@ class MetaPoster:
         """
         # Step 1: create container
         create_url = f"{self.api}/{self.ig_user_id}/media"
-        resp = requests.post(
+        resp = self._post(
             create_url,
             data={
                 "image_url": image_url,
@@ -188,7 +405,7 @@ class MetaPoster:
 
         # Step 2: publish
         publish_url = f"{self.api}/{self.ig_user_id}/media_publish"
-        resp = requests.post(
+        resp = self._post(
             publish_url,
             data={"creation_id": container_id, "access_token": self.token},
         )
@@ -198,6 +415,18 @@ class MetaPoster:
     # Orchestration
     # ------------------------------------------------------------------
 
+    def _facebook_post(self, image_path: Path, caption: str) -> str:
+        """DAG node ``fb_post``: publish to the Facebook Page."""
+        data = self.post_to_facebook(image_path, caption)
+        print(f"  Facebook: posted {image_path.name} (id={data.get('id', '?')})")
+        return f"posted (id={data.get('id', '?')})"
+
+    def _instagram_publish(self, cdn_url: Future, caption: str) -> str:
+        """DAG node ``ig_publish``: create the container, wait for it, publish."""
+        data = self.post_to_instagram(cdn_url.result(), caption)
+        print(f"  Instagram: posted (id={data.get('id', '?')})")
+        return f"posted (id={data.get('id', '?')})"
+
     def post_folder(
         self,
         folder: Path,
@@ -207,7 +436,16 @@ class MetaPoster:
     ) -> dict[str, str]:
         """Post images from an output folder to the specified platforms.
 
-        Returns a dict mapping platform names to result descriptions.
+        Posting runs as a small task graph on one pool:
+
+        - ``fb_post``: no dependencies
+        - ``ig_upload``: unpublished upload, no dependencies
+        - ``ig_cdn``: depends on ``ig_upload``
+        - ``ig_publish``: depends on ``ig_cdn`` (container wait included)
+
+        Returns a dict mapping platform names to result descriptions. A
+        platform whose pipeline raised is reported as ``"failed: ..."``
+        rather than raising, so the other platform's post is still returned.
         """
         results: dict[str, str] = {}
 
@@ -218,15 +456,19 @@ class MetaPoster:
         else:
             sections = {}
 
+        # Resolve every platform's image and caption before scheduling anything
+        image_paths: dict[str, Path | None] = {}
         for platform in platforms:
             fmt = PLATFORM_FORMAT_MAP.get(platform)
             if not fmt:
                 results[platform] = f"skipped: unknown platform '{platform}'"
                 continue
+            image_paths[platform] = self._find_image(folder, content_type, fmt)
 
-            # Find the image file
-            image_path = self._find_image(folder, content_type, fmt)
+        targets: dict[str, tuple[Path, str]] = {}
+        for platform, image_path in image_paths.items():
             if not image_path:
+                fmt = PLATFORM_FORMAT_MAP[platform]
                 results[platform] = f"skipped: no {content_type}_{fmt}.png found"
                 continue
 
@@ -239,28 +481,158 @@ class MetaPoster:
                 print(f"    Caption: {caption_preview}")
                 continue
 
-            if platform == "facebook":
-                data = self.post_to_facebook(image_path, caption)
-                results["facebook"] = f"posted (id={data.get('id', '?')})"
-                print(f"  Facebook: posted {image_path.name} (id={data.get('id', '?')})")
-
-            elif platform == "instagram":
-                # Instagram needs a public URL — upload to Facebook first
-                if "facebook" in results and "posted" in results.get("facebook", ""):
-                    # Already posted to Facebook; get CDN URL from that photo
-                    fb_photo_id = results["facebook"].split("id=")[1].rstrip(")")
-                    cdn_url = self.get_photo_cdn_url(fb_photo_id)
-                else:
-                    # Upload unpublished to get a CDN URL
-                    ig_image_path = self._find_image(folder, content_type, PLATFORM_FORMAT_MAP["instagram"])
-                    if ig_image_path is None:
-                        ig_image_path = image_path
-                    photo_id = self._upload_unpublished(ig_image_path)
-                    cdn_url = self.get_photo_cdn_url(photo_id)
-
-                data = self.post_to_instagram(cdn_url, caption)
-                results["instagram"] = f"posted (id={data.get('id', '?')})"
+            targets[platform] = (image_path, caption)
+
+        if not targets:
+            return results
+
+        # Sink node for each platform; failures propagate down the edges
+        sinks: dict[str, Future] = {}
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            if "facebook" in targets:
+                sinks["facebook"] = pool.submit(self._facebook_post, *targets["facebook"])
+            if "instagram" in targets:
+                image_path, caption = targets["instagram"]
+                ig_upload = pool.submit(self._upload_unpublished, image_path)
+                ig_cdn = pool.submit(lambda: self.get_photo_cdn_url(ig_upload.result()))
+                sinks["instagram"] = pool.submit(self._instagram_publish, ig_cdn, caption)
+
+            for platform, future in sinks.items():
+                results[platform] = _sink_result(platform, future.result)
+
+        return results
+
+    def post_folder_batched(
+        self,
+        folder: Path,
+        content_type: str,
+        platforms: list[str],
+        dry_run: bool = False,
+    ) -> dict[str, str]:
+        """Like ``post_folder``, but sends the uploads in one Graph API batch.
+
+        The Facebook post, the unpublished Instagram upload, its CDN URL
+        lookup and the Instagram container creation go out as a single
+        ``POST /`` batch, with later operations referencing earlier results
+        via JSONPath. Only the container status polls and the publish call
+        remain separate round-trips.
+
+        As with ``post_folder``, a platform whose operations failed is reported
+        as ``"failed: ..."`` without losing the other platform's result.
+        """
+        if dry_run:
+            return self.post_folder(folder, content_type, platforms, dry_run=True)
+
+        results: dict[str, str] = {}
+        caption_file = folder / "captions.txt"
+        sections = parse_caption_file(caption_file) if caption_file.exists() else {}
+
+        ops: list[dict] = []
+        files: dict[str, tuple] = {}
+        handles = []
+
+        def attach(name: str, path: Path) -> None:
+            f = open(path, "rb")
+            handles.append(f)
+            files[name] = (path.name, f, "image/png")
+
+        images: dict[str, Path] = {}
+        for platform in platforms:
+            fmt = PLATFORM_FORMAT_MAP.get(platform)
+            if not fmt:
+                results[platform] = f"skipped: unknown platform '{platform}'"
+                continue
+            image_path = self._find_image(folder, content_type, fmt)
+            if not image_path:
+                results[platform] = f"skipped: no {content_type}_{fmt}.png found"
+                continue
+            try:
+                _preflight_image(image_path, platform)
+            except ImagePreflightError as e:
+                results[platform] = f"skipped: {e}"
+                continue
+            images[platform] = image_path
+
+        try:
+            if "facebook" in images:
+                caption = get_caption_for_platform(sections, content_type, "facebook") or ""
+                attach("fb_image", images["facebook"])
+                ops.append({
+                    "method": "POST",
+                    "name": "fb",
+                    "relative_url": f"{self.page_id}/photos",
+                    "attached_files": "fb_image",
+                    "body": urlencode({"caption": caption}),
+                    "omit_response_on_success": False,
+                })
+
+            if "instagram" in images:
+                # Instagram gets its own unpublished upload of the post-format
+                # image, as in post_folder, never the 1200x630 Facebook photo
+                attach("ig_image", images["instagram"])
+                ops.append({
+                    "method": "POST",
+                    "name": "ig_upload",
+                    "relative_url": f"{self.page_id}/photos",
+                    "attached_files": "ig_image",
+                    "body": urlencode({"published": "false"}),
+                    "omit_response_on_success": False,
+                })
+                ops.append({
+                    "method": "GET",
+                    "name": "cdn",
+                    "relative_url": "{result=ig_upload:$.id}?fields=images",
+                    "omit_response_on_success": False,
+                })
+                caption = get_caption_for_platform(sections, content_type, "instagram") or ""
+                ops.append({
+                    "method": "POST",
+                    "name": "ig_container",
+                    "relative_url": f"{self.ig_user_id}/media",
+                    "body": "image_url={result=cdn:$.images.0.source}&" + urlencode({"caption": caption}),
+                })
+
+            if not ops:
+                return results
+
+            resp = self._post(
+                f"{self.api}/",
+                data={
+                    "access_token": self.token,
+                    "include_headers": "false",
+                    "batch": json.dumps(ops),
+                },
+                files=files or None,
+            )
+        finally:
+            for f in handles:
+                f.close()
+
+        outcomes = _check_batch_response(resp, [op["name"] for op in ops])
+
+        # Each platform succeeds or fails on its own, as in post_folder: a live
+        # Facebook post is reported even if the Instagram chain failed
+        if "fb" in outcomes:
+            def facebook() -> str:
+                fb_id = _batch_body(outcomes, "fb").get("id", "?")
+                print(f"  Facebook: posted {images['facebook'].name} (id={fb_id})")
+                return f"posted (id={fb_id})"
+
+            results["facebook"] = _sink_result("facebook", facebook)
+
+        if "ig_container" in outcomes:
+            def instagram() -> str:
+                container_id = _batch_body(outcomes, "ig_upload", "cdn", "ig_container")["id"]
+                self._wait_for_container(container_id)
+                resp = self._post(
+                    f"{self.api}/{self.ig_user_id}/media_publish",
+                    data={"creation_id": container_id, "access_token": self.token},
+                )
+                data = _check_response(resp, "Instagram publish")
                 print(f"  Instagram: posted (id={data.get('id', '?')})")
+                return f"posted (id={data.get('id', '?')})"
+
+            results["instagram"] = _sink_result("instagram", instagram)
 
         return results
 
@@ -273,12 +645,36 @@ class MetaPoster:
 
 def list_folders() -> list[Path]:
     """List available output folders in OUTPUT_DIR."""
-    if not OUTPUT_DIR.exists():
+    try:
+        with os.scandir(OUTPUT_DIR) as entries:
+            # DirEntry.is_dir() uses the type from the directory read, no stat
+            folders = [Path(e.path) for e in entries if e.is_dir()]
+    except FileNotFoundError:
         return []
-    return sorted(
-        [p for p in OUTPUT_DIR.iterdir() if p.is_dir()],
-        key=lambda p: p.name,
-    )
+    return sorted(folders, key=lambda p: p.name)
+
+
+def _resolve_folder(name: str) -> Path:
+    """Resolve a folder name (exact or unique partial match) or exit."""
+    folder = OUTPUT_DIR / name
+    if folder.exists():
+        return folder
+    # Try partial match
+    matches = [f for f in list_folders() if name.lower() in f.name.lower()]
+    if len(matches) == 1:
+        print(f"Matched folder: {matches[0].name}")
+        return matches[0]
+    if len(matches) > 1:
+        print(f"Ambiguous folder name '{name}'. Matches:")
+        for m in matches:
+            print(f"  {m.name}")
+    else:
+        print(f"Folder not found: {name}")
+    sys.exit(1)
+
+
+# Folders posted at once in multi-folder runs (the token bucket still paces calls)
+MAX_PARALLEL_FOLDERS = 6
 
 
 def main():
@@ -286,9 +682,10 @@ def main():
         description="Post social media images to Instagram and Facebook",
     )
     parser.add_argument(
-        "folder",
-        nargs="?",
-        help="Folder name within output/social/ (omit to list available folders)",
+        "folders",
+        nargs="*",
+        metavar="folder",
+        help="Folder name(s) within output/social/ (omit to list available folders)",
     )
     parser.add_argument("--dry-run", action="store_true", help="Preview without posting")
     parser.add_argument("--facebook-only", action="store_true", help="Post to Facebook only")
@@ -296,12 +693,33 @@ def main():
     parser.add_argument(
         "--type",
         choices=TEMPLATE_TYPES,
-        help="Content type (auto-detected if omitted)",
+        help="Content type (auto-detected per folder if omitted)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or write the upload/CDN URL cache",
+    )
+    parser.add_argument(
+        "--cache-mode",
+        choices=CACHE_MODES,
+        default="enabled",
+        help="Upload/CDN URL cache behaviour; replay fails on a miss instead of calling the API (default: enabled)",
+    )
+    parser.add_argument(
+        "--no-stale",
+        action="store_true",
+        help="Fail instead of reusing a cached CDN URL when the Graph API lookup fails",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Send uploads as a single Graph API batch request",
     )
     args = parser.parse_args()
 
     # List mode
-    if not args.folder:
+    if not args.folders:
         folders = list_folders()
         if not folders:
             print("No output folders found in output/social/")
@@ -311,26 +729,12 @@ def main():
             print(f"  {f.name}")
         sys.exit(0)
 
-    # Resolve folder
-    folder = OUTPUT_DIR / args.folder
-    if not folder.exists():
-        # Try partial match
-        matches = [f for f in list_folders() if args.folder.lower() in f.name.lower()]
-        if len(matches) == 1:
-            folder = matches[0]
-            print(f"Matched folder: {folder.name}")
-        elif len(matches) > 1:
-            print(f"Ambiguous folder name '{args.folder}'. Matches:")
-            for m in matches:
-                print(f"  {m.name}")
-            sys.exit(1)
-        else:
-            print(f"Folder not found: {args.folder}")
-            sys.exit(1)
+    folders = list(dict.fromkeys(_resolve_folder(name) for name in args.folders))
 
     # Detect content type
-    content_type = args.type or detect_content_type(folder)
-    print(f"Content type: {content_type}")
+    content_types = {folder: args.type or detect_content_type(folder) for folder in folders}
+    for folder in folders:
+        print(f"Folder: {folder.name} (content type: {content_types[folder]})")
 
     # Platforms
     if args.facebook_only:
@@ -341,7 +745,6 @@ def main():
         platforms = ["facebook", "instagram"]
 
     print(f"Platforms: {', '.join(platforms)}")
-    print(f"Folder: {folder.name}")
 
     if args.dry_run:
         print("\n[DRY RUN MODE]")
@@ -350,7 +753,8 @@ def main():
             page_id="DRY_RUN",
             ig_user_id="DRY_RUN",
         )
-        poster.post_folder(folder, content_type, platforms, dry_run=True)
+        for folder in folders:
+            poster.post_folder(folder, content_types[folder], platforms, dry_run=True)
         return
 
     # Load credentials from environment
@@ -366,18 +770,43 @@ def main():
         print("Error: META_IG_USER_ID must be set for Instagram posting")
         sys.exit(1)
 
-    poster = MetaPoster(
+    print(f"\nPosting to {', '.join(platforms)}...")
+    with MetaPoster(
         page_access_token=token,
         page_id=page_id,
         ig_user_id=ig_user_id or "",
-    )
-
-    print(f"\nPosting to {', '.join(platforms)}...")
-    results = poster.post_folder(folder, content_type, platforms)
+        cache=PosterCache(mode="off" if args.no_cache else args.cache_mode),
+        allow_stale=not args.no_stale,
+    ) as poster:
+        post = poster.post_folder_batched if args.batch else poster.post_folder
+        # One session, cache and rate limiter shared by every folder
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_FOLDERS, len(folders))) as pool:
+            futures = {
+                folder: pool.submit(post, folder, content_types[folder], platforms)
+                for folder in folders
+            }
+            # One folder's error must not hide what the others already posted
+            all_results: dict[Path, dict[str, str] | Exception] = {}
+            for folder, future in futures.items():
+                try:
+                    all_results[folder] = future.result()
+                except Exception as e:
+                    all_results[folder] = e
 
     print("\nResults:")
-    for platform, result in results.items():
-        print(f"  {platform}: {result}")
+    failed = False
+    for folder, results in all_results.items():
+        print(f"  {folder.name}")
+        if isinstance(results, Exception):
+            failed = True
+            print(f"    error: {results}")
+            continue
+        for platform, result in results.items():
+            print(f"    {platform}: {result}")
+            failed = failed or result.startswith("failed")
+
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,109 @@
+"""Persistent cache for Meta Graph API results that are safe to reuse.
+
+Only lookups whose results don't depend on when they're made are cached:
+
+- ``upload``: unpublished Facebook photo IDs, keyed by SHA-256 of the PNG bytes,
+  so reprocessing a folder doesn't re-upload identical images.
+- ``cdn``: photo CDN URLs, keyed by photo ID. These are signed and expire, so
+  they are kept for a short time only.
+
+Published posts are never cached — re-running a post must post again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from social.config import CACHE_DIR
+
+CACHE_PATH = CACHE_DIR / "poster_cache.sqlite"
+
+# Seconds each kind of entry stays fresh
+UPLOAD_TTL = 7 * 24 * 3600
+CDN_TTL = 3600
+# How old a CDN URL may be when reused because a fresh lookup failed
+CDN_STALE_TTL = 6 * 3600
+
+# enabled: read + write; replay: read only, and a miss fails instead of
+# calling the API; write-only: refresh without reading
+CACHE_MODES = ("enabled", "replay", "write-only", "off")
+
+
+class CacheMissError(RuntimeError):
+    """A replay-mode lookup wasn't cached, so it would have needed an API call."""
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 hex digest of a file's contents."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class PosterCache:
+    """Small SQLite key/value store shared by the Facebook and Instagram threads."""
+
+    def __init__(self, path: Path = CACHE_PATH, mode: str = "enabled"):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode: {mode} (expected one of {', '.join(CACHE_MODES)})")
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._conn = None
+        if mode != "off":
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "kind TEXT, key TEXT, value TEXT, created_at REAL, "
+                "PRIMARY KEY (kind, key))"
+            )
+            self._conn.commit()
+
+    @property
+    def readable(self) -> bool:
+        return self.mode in ("enabled", "replay")
+
+    @property
+    def writable(self) -> bool:
+        return self.mode in ("enabled", "write-only")
+
+    def get(self, kind: str, key: str, ttl: float) -> str | None:
+        """Return a cached value no older than ttl seconds, or None."""
+        if not self.readable:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM cache WHERE kind = ? AND key = ?",
+                (kind, key),
+            ).fetchone()
+        if row is None or time.time() - row[1] > ttl:
+            return None
+        return row[0]
+
+    def check_miss(self, kind: str, key: str) -> None:
+        """Call on a cache miss before going to the API; replay mode refuses."""
+        if self.mode == "replay":
+            raise CacheMissError(f"{kind} {key} is not in the poster cache (replay mode makes no lookups)")
+
+    def set(self, kind: str, key: str, value: str) -> None:
+        """Store a value, replacing any existing entry."""
+        if not self.writable:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (kind, key, value, created_at) VALUES (?, ?, ?, ?)",
+                (kind, key, value, time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
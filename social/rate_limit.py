@@ -0,0 +1,38 @@
+"""Token-bucket pacing for outbound Meta Graph API calls."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Allow ``rate_per_min`` calls per minute on average, with bursts of up to ``burst``.
+
+    ``acquire()`` blocks until a token is available. Thread-safe, so one bucket
+    can pace every request a MetaPoster makes, across threads.
+    """
+
+    def __init__(self, rate_per_min: float, burst: int):
+        if rate_per_min <= 0 or burst < 1:
+            raise ValueError("rate_per_min must be > 0 and burst >= 1")
+        self.rate = rate_per_min / 60.0  # tokens per second
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
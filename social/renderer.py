@@ -1,20 +1,53 @@
 """Pillow drawing primitives: text wrapping, pill badges, logo compositing, venue photos."""
 
+import hashlib
+import os
+import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from PIL import Image, ImageDraw, ImageFont
-from social.config import COLOR_BG, COLOR_PRIMARY, COLOR_WHITE, COLOR_MUTED, LOGO_PATH, VENUES_DIR, VENUE_FILENAME_MAP, VENUE_CROP_ALIGN, VENUE_CROP_VALIGN
+from social.config import CACHE_DIR, COLOR_BG, COLOR_PRIMARY, COLOR_WHITE, COLOR_MUTED, LOGO_PATH, VENUES_DIR, VENUE_FILENAME_MAP, VENUE_CROP_ALIGN, VENUE_CROP_VALIGN
 
+# Finished venue composites (crop + resize + overlay), keyed by their inputs
+VENUE_CACHE_DIR = CACHE_DIR / "venues"
+# Bump when the composite's pixels change so stale cache files are ignored
+_VENUE_CACHE_VERSION = 2
 
+
+@lru_cache(maxsize=256)
 def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
-    """Convert hex color string to RGB tuple."""
+    """Convert hex color string to RGB tuple (memoized; the palette is small)."""
     h = hex_color.lstrip("#")
     return (int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16))
 
 
+# Brand colors, parsed once
+BG_RGB = hex_to_rgb(COLOR_BG)
+PRIMARY_RGB = hex_to_rgb(COLOR_PRIMARY)
+WHITE_RGB = hex_to_rgb(COLOR_WHITE)
+MUTED_RGB = hex_to_rgb(COLOR_MUTED)
+
+
+@lru_cache(maxsize=8192)
+def text_bbox(font: ImageFont.FreeTypeFont, text: str) -> tuple[int, int, int, int]:
+    """Memoized ``font.getbbox(text)``.
+
+    Fonts come from the cached ``load_font``, so the same object (and cache
+    key) is reused across renders.
+    """
+    return font.getbbox(text)
+
+
+@lru_cache(maxsize=8192)
+def text_length(font: ImageFont.FreeTypeFont, text: str) -> float:
+    """Memoized ``font.getlength(text)`` (advance width, in pixels)."""
+    return font.getlength(text)
+
+
 def create_canvas(width: int, height: int) -> Image.Image:
     """Create a new image with the dark background."""
-    return Image.new("RGB", (width, height), hex_to_rgb(COLOR_BG))
+    return Image.new("RGB", (width, height), BG_RGB)
 
 
 def draw_text(
@@ -28,28 +61,43 @@ def draw_text(
 ) -> int:
     """Draw text and return the height consumed."""
     draw.text((x, y), text, fill=hex_to_rgb(color), font=font, anchor=anchor)
-    bbox = font.getbbox(text)
+    bbox = text_bbox(font, text)
     return bbox[3] - bbox[1]
 
 
 def wrap_text(text: str, font: ImageFont.FreeTypeFont, max_width: int) -> list[str]:
-    """Word-wrap text to fit within max_width pixels."""
-    words = text.split()
+    """Word-wrap text to fit within max_width pixels.
+
+    Each word is measured once and line widths are accumulated, rather than
+    re-measuring the whole line for every added word.
+    """
+    space_w = text_length(font, " ")
     lines = []
-    current_line = ""
-    for word in words:
-        test_line = f"{current_line} {word}".strip()
-        bbox = font.getbbox(test_line)
-        if bbox[2] > max_width and current_line:
-            lines.append(current_line)
-            current_line = word
+    current: list[str] = []
+    current_w = 0.0
+    for word in text.split():
+        word_w = text_length(font, word)
+        if current and current_w + space_w + word_w > max_width:
+            lines.append(" ".join(current))
+            current = [word]
+            current_w = word_w
         else:
-            current_line = test_line
-    if current_line:
-        lines.append(current_line)
+            current_w += space_w + word_w if current else word_w
+            current.append(word)
+    if current:
+        lines.append(" ".join(current))
     return lines
 
 
+@lru_cache(maxsize=512)
+def wrap_lines(text: str, font: ImageFont.FreeTypeFont, max_width: int) -> tuple[str, ...]:
+    """Memoized wrap_text, for text laid out again across formats and templates.
+
+    Fonts come from the load_font cache, so the font object is a stable key.
+    """
+    return tuple(wrap_text(text, font, max_width))
+
+
 def draw_wrapped_text(
     draw: ImageDraw.ImageDraw,
     text: str,
@@ -61,16 +109,66 @@ def draw_wrapped_text(
     line_spacing: int = 8,
 ) -> int:
     """Draw word-wrapped text. Returns total height consumed."""
-    lines = wrap_text(text, font, max_width)
+    lines = wrap_lines(text, font, max_width)
     total_height = 0
     for i, line in enumerate(lines):
         draw_text(draw, line, x, y + total_height, font, color)
-        bbox = font.getbbox(line)
+        bbox = text_bbox(font, line)
         line_h = bbox[3] - bbox[1]
         total_height += line_h + (line_spacing if i < len(lines) - 1 else 0)
     return total_height
 
 
+@lru_cache(maxsize=64)
+def render_text_block(
+    text: str,
+    font: ImageFont.FreeTypeFont,
+    max_width: int,
+    color: str = COLOR_WHITE,
+    line_spacing: int = 8,
+) -> tuple[Optional[Image.Image], int, int, int]:
+    """Rasterize word-wrapped text once onto a transparent tile.
+
+    Returns (tile, dx, dy, height). The tile is cropped to its ink and goes at
+    (x + dx, y + dy); height is what draw_wrapped_text would return. tile is
+    None when there is nothing to draw. Transparent pixels carry the text
+    colour so antialiased edges blend the same as drawing directly.
+    """
+    lines = wrap_lines(text, font, max_width)
+    pad = font.size
+    block = Image.new(
+        "RGBA",
+        (max_width + 2 * pad, len(lines) * (2 * font.size + line_spacing) + 2 * pad),
+        (*hex_to_rgb(color), 0),
+    )
+    height = draw_wrapped_text(ImageDraw.Draw(block), text, pad, pad, font, max_width, color, line_spacing)
+    ink = block.getbbox()
+    if ink is None:
+        return None, 0, 0, height
+    return block.crop(ink), ink[0] - pad, ink[1] - pad, height
+
+
+def paste_wrapped_text(
+    canvas: Image.Image,
+    text: str,
+    x: int,
+    y: int,
+    font: ImageFont.FreeTypeFont,
+    max_width: int,
+    color: str = COLOR_WHITE,
+    line_spacing: int = 8,
+) -> int:
+    """draw_wrapped_text via the render_text_block cache. Returns total height consumed.
+
+    The same event title is drawn by several templates in several formats;
+    after the first, each is a single alpha paste with no FreeType work.
+    """
+    tile, dx, dy, height = render_text_block(text, font, max_width, color, line_spacing)
+    if tile is not None:
+        canvas.paste(tile, (x + dx, y + dy), tile)
+    return height
+
+
 def draw_pill(
     draw: ImageDraw.ImageDraw,
     text: str,
@@ -83,7 +181,7 @@ def draw_pill(
     padding_y: int = 8,
 ) -> int:
     """Draw a rounded-rect pill badge. Returns the pill width."""
-    bbox = font.getbbox(text)
+    bbox = text_bbox(font, text)
     text_w = bbox[2] - bbox[0]
     text_h = bbox[3] - bbox[1]
     pill_w = text_w + padding_x * 2
@@ -117,7 +215,7 @@ def draw_pills_row(
     pill_height = 0
     for label, color in items:
         pw = draw_pill(draw, label, cursor_x, y, font, color, text_color, padding_x, padding_y)
-        bbox = font.getbbox(label)
+        bbox = text_bbox(font, label)
         pill_height = max(pill_height, (bbox[3] - bbox[1]) + padding_y * 2)
         cursor_x += pw + gap
     return cursor_x - x - gap, pill_height
@@ -139,6 +237,30 @@ def draw_accent_line(
     return thickness
 
 
+@lru_cache(maxsize=1)
+def _logo_source() -> Image.Image:
+    """Decode the logo file once per process."""
+    with Image.open(LOGO_PATH) as logo:
+        logo.load()
+        return logo.copy()
+
+
+@lru_cache(maxsize=32)
+def _logo_scaled(max_width: int, max_height: int) -> Image.Image:
+    """Logo resized to fit the box, cached per box size. Treat as read-only."""
+    logo = _logo_source()
+    # Scale to fit within max dimensions while preserving aspect ratio
+    ratio = min(max_width / logo.width, max_height / logo.height)
+    new_w = int(logo.width * ratio)
+    new_h = int(logo.height * ratio)
+    return logo.resize((new_w, new_h), Image.Resampling.LANCZOS)
+
+
+def measure_logo(max_width: int, max_height: int) -> tuple[int, int]:
+    """Return the (width, height) the logo will occupy, without drawing it."""
+    return _logo_scaled(max_width, max_height).size
+
+
 def composite_logo(
     canvas: Image.Image,
     x: int,
@@ -147,14 +269,9 @@ def composite_logo(
     max_height: int,
 ) -> tuple[int, int]:
     """Composite the horizontal dark logo onto the canvas. Returns (width, height) used."""
-    logo = Image.open(LOGO_PATH)
-    # Scale to fit within max dimensions while preserving aspect ratio
-    ratio = min(max_width / logo.width, max_height / logo.height)
-    new_w = int(logo.width * ratio)
-    new_h = int(logo.height * ratio)
-    logo = logo.resize((new_w, new_h), Image.LANCZOS)
+    logo = _logo_scaled(max_width, max_height)
     canvas.paste(logo, (x, y))
-    return new_w, new_h
+    return logo.size
 
 
 def draw_footer(
@@ -165,7 +282,7 @@ def draw_footer(
 ) -> None:
     """Draw the sim.sports URL footer at the bottom center."""
     text = "sim.sports"
-    bbox = font.getbbox(text)
+    bbox = text_bbox(font, text)
     text_w = bbox[2] - bbox[0]
     x = (canvas_width - text_w) // 2
     y = canvas_height - 60
@@ -190,6 +307,66 @@ def _resolve_venue_photo(venue_name: str) -> Optional[Path]:
     return None
 
 
+@lru_cache(maxsize=128)
+def _venue_source(venue_name: str) -> tuple[Optional[Path], float, float]:
+    """Photo path and crop alignment for a venue, resolved once per run.
+
+    Saves the per-render probing of candidate extensions; the photo's mtime
+    is still checked by _venue_cache_path, so an edited file is picked up.
+    """
+    filename = VENUE_FILENAME_MAP.get(venue_name, "")
+    return (
+        _resolve_venue_photo(venue_name),
+        VENUE_CROP_ALIGN.get(filename, 0.5),
+        VENUE_CROP_VALIGN.get(filename, 0.5),
+    )
+
+
+def _vertical_ramp(width: int, height: int, lut) -> Image.Image:
+    """L image whose row values run top-to-bottom through lut(0..255).
+
+    Built from Pillow's C-generated linear_gradient squeezed to one column,
+    mapped through a lookup table, then stretched to full width — no
+    Python work per row or pixel.
+    """
+    column = Image.linear_gradient("L").resize((1, height), Image.Resampling.BILINEAR)
+    return column.point([lut(v) for v in range(256)]).resize((width, height), Image.Resampling.NEAREST)
+
+
+def _venue_cache_path(
+    photo_path: Optional[Path],
+    width: int,
+    height: int,
+    h_align: float,
+    v_align: float,
+) -> Path:
+    """Cache file for a venue composite, keyed by everything that affects its pixels."""
+    if photo_path:
+        source = f"{photo_path}|{photo_path.stat().st_mtime_ns}"
+    else:
+        source = "gradient"
+    key = f"v{_VENUE_CACHE_VERSION}|{source}|{width}x{height}|{h_align}|{v_align}"
+    return VENUE_CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.png"
+
+
+def _write_venue_cache(image: Image.Image, cache_path: Path) -> None:
+    """Save a composite to the cache; a failed write only costs a re-render."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        image.save(tmp_path, "PNG", compress_level=1)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def clear_venue_cache() -> None:
+    """Delete all cached venue composites, on disk and in memory."""
+    _venue_source.cache_clear()
+    _venue_composite.cache_clear()
+    shutil.rmtree(VENUE_CACHE_DIR, ignore_errors=True)
+
+
 def composite_venue_photo(
     canvas: Image.Image,
     x: int,
@@ -202,14 +379,35 @@ def composite_venue_photo(
 
     If no venue photo is found, fills with a subtle dark gradient.
     Adds a dark gradient overlay at the top edge for text readability.
+    The finished composite is cached under VENUE_CACHE_DIR, so later renders
+    of the same venue at the same size skip the decode and resample.
     """
-    photo_path = _resolve_venue_photo(venue_name)
+    photo_path, h_align, v_align = _venue_source(venue_name)
+    cache_path = _venue_cache_path(photo_path, width, height, h_align, v_align)
+    canvas.paste(_venue_composite(cache_path, photo_path, width, height, h_align, v_align), (x, y))
+
+
+@lru_cache(maxsize=32)
+def _venue_composite(
+    cache_path: Path,
+    photo_path: Optional[Path],
+    width: int,
+    height: int,
+    h_align: float,
+    v_align: float,
+) -> Image.Image:
+    """Finished venue composite, kept in memory for the rest of the run.
+
+    Falls back to the on-disk cache, then to building it. Treat as read-only.
+    """
+    if cache_path.exists():
+        with Image.open(cache_path) as cached:
+            cached.load()
+            return cached.copy()
 
     if photo_path:
         photo = Image.open(photo_path).convert("RGB")
         # Crop to fill the target region, with per-venue alignment
-        filename = VENUE_FILENAME_MAP.get(venue_name, "")
-        h_align = VENUE_CROP_ALIGN.get(filename, 0.5)
         src_ratio = photo.width / photo.height
         dst_ratio = width / height
         if src_ratio > dst_ratio:
@@ -222,30 +420,22 @@ def composite_venue_photo(
             # Photo is taller — crop top/bottom
             new_w = photo.width
             new_h = int(new_w / dst_ratio)
-            v_align = VENUE_CROP_VALIGN.get(filename, 0.5)
             top = int((photo.height - new_h) * v_align)
             photo = photo.crop((0, top, new_w, top + new_h))
-        photo = photo.resize((width, height), Image.LANCZOS)
+        photo = photo.resize((width, height), Image.Resampling.LANCZOS)
     else:
         # No photo at all — generate a subtle dark gradient
-        photo = Image.new("RGB", (width, height), hex_to_rgb(COLOR_BG))
-        draw = ImageDraw.Draw(photo)
-        for row in range(height):
-            t = row / height
-            r = int(20 + 25 * t)
-            g = int(20 + 25 * t)
-            b = int(25 + 35 * t)
-            draw.line([(0, row), (width, row)], fill=(r, g, b))
-
-    # Add dark gradient overlay at top edge (for readability where info section meets photo)
-    overlay = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    overlay_draw = ImageDraw.Draw(overlay)
+        red_green = _vertical_ramp(width, height, lambda v: int(20 + 25 * v / 256))
+        blue = _vertical_ramp(width, height, lambda v: int(25 + 35 * v / 256))
+        photo = Image.merge("RGB", (red_green, red_green, blue))
+
+    # Darken the top edge (for readability where info section meets photo).
+    # Blending a solid colour through an alpha mask touches only that band,
+    # with no full-size RGBA overlay or mode round-trip.
     gradient_height = min(height // 3, 200)
-    for row in range(gradient_height):
-        alpha = int(180 * (1 - row / gradient_height))
-        overlay_draw.line([(0, row), (width, row)], fill=(20, 20, 20, alpha))
-
-    # Composite: paste photo, then overlay
-    photo_rgba = photo.convert("RGBA")
-    composited = Image.alpha_composite(photo_rgba, overlay)
-    canvas.paste(composited.convert("RGB"), (x, y))
+    if gradient_height:
+        mask = _vertical_ramp(width, gradient_height, lambda v: int(180 * (1 - v / 256)))
+        photo.paste((20, 20, 20), (0, 0, width, gradient_height), mask)
+
+    _write_venue_cache(photo, cache_path)
+    return photo
@@ -19,158 +19,230 @@ import argparse
 import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 
 from social.config import DATA_DIR, OUTPUT_DIR
 from social.generate import (
+    bucketize_events,
     generate_event_images,
     generate_weekly_images,
     generate_weekend_images,
-    get_pre_race_events,
-    get_race_day_events,
-    get_weekly_events,
-    get_weekend_events,
     load_events,
     _event_folder_name,
 )
 from social.poster import MetaPoster, detect_content_type
 
-POSTING_LOG_PATH = DATA_DIR / "posting_log.json"
+# One JSON object per line, appended as posts are made
+POSTING_LOG_PATH = DATA_DIR / "posting_log.jsonl"
+
+
+def _migrate_legacy_log() -> None:
+    """Convert a ``posting_log.json`` ({"posts": [...]}) into the JSONL log."""
+    legacy_path = POSTING_LOG_PATH.with_suffix(".json")
+    if POSTING_LOG_PATH.exists() or not legacy_path.exists():
+        return
+    with open(legacy_path) as f:
+        save_posting_log(json.load(f))
+    legacy_path.unlink()
+
+
+# Last parse of the log, keyed by (path, mtime_ns, size) so edits invalidate it
+_LOG_CACHE: dict[tuple, list[dict]] = {}
 
 
 def load_posting_log() -> dict:
-    """Read the posting log from disk."""
-    if not POSTING_LOG_PATH.exists():
+    """Read the posting log from disk.
+
+    An unchanged file is parsed once per process; each call gets its own
+    ``posts`` list, so callers may append to it freely.
+    """
+    _migrate_legacy_log()
+    try:
+        st = POSTING_LOG_PATH.stat()
+    except FileNotFoundError:
         return {"posts": []}
-    with open(POSTING_LOG_PATH) as f:
-        return json.load(f)
+    key = (str(POSTING_LOG_PATH), st.st_mtime_ns, st.st_size)
+    if key not in _LOG_CACHE:
+        with open(POSTING_LOG_PATH) as f:
+            posts = [json.loads(line) for line in f if line.strip()]
+        _LOG_CACHE.clear()
+        _LOG_CACHE[key] = posts
+    return {"posts": list(_LOG_CACHE[key])}
 
 
 def save_posting_log(log: dict) -> None:
-    """Write the posting log to disk."""
-    with open(POSTING_LOG_PATH, "w") as f:
-        json.dump(log, f, indent=2)
-        f.write("\n")
+    """Rewrite the whole posting log.
+
+    Writes a temp file and renames it over the log, so a crash mid-write
+    leaves the previous log intact. Use ``append_post`` to add one entry.
+    """
+    tmp_path = POSTING_LOG_PATH.with_suffix(".jsonl.tmp")
+    with open(tmp_path, "w") as f:
+        # One buffered write instead of many small ones
+        f.write("".join(json.dumps(entry) + "\n" for entry in log.get("posts", [])))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, POSTING_LOG_PATH)
+
+
+def append_post(entry: dict) -> None:
+    """Append one entry to the posting log; cost doesn't grow with the log."""
+    with open(POSTING_LOG_PATH, "a") as f:
+        f.write(json.dumps(entry) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def posted_keys(log: dict) -> set[str]:
+    """Return the set of keys in the posting log, for O(1) membership checks."""
+    return {entry["key"] for entry in log.get("posts", [])}
 
 
 def is_posted(log: dict, key: str) -> bool:
-    """Check if a key exists in the posting log."""
+    """Check if a key exists in the posting log.
+
+    Scans the whole log; callers checking many keys should build
+    ``posted_keys(log)`` once instead.
+    """
     return any(entry["key"] == key for entry in log.get("posts", []))
 
 
-def get_todays_tasks(events: list[dict], log: dict, ref_date: date | None = None) -> list[dict]:
-    """Return list of task dicts based on day-of-week and event dates.
+@dataclass(slots=True, frozen=True)
+class Task:
+    """One scheduled post: what to render and the posting-log key it records."""
 
-    Each task dict has: type, key, identifier, and relevant events/event data.
-    """
+    type: str
+    key: str
+    identifier: str
+    event: dict | None = None
+    events: list[dict] | None = None
+
+
+def get_todays_tasks(events: list[dict], log: dict, ref_date: date | None = None) -> list[Task]:
+    """Return the tasks due today based on day-of-week and event dates."""
     today = ref_date or date.today()
-    tasks = []
+    posted = posted_keys(log)
+    buckets = bucketize_events(events, ref_date=today)
+    tasks: list[Task] = []
+    add_task = tasks.append
 
     # Monday: weekly preview
     if today.weekday() == 0:  # Monday
         key = f"weekly_preview:{today.isoformat()}"
-        if not is_posted(log, key):
-            weekly = get_weekly_events(events)
+        if key not in posted:
+            weekly = buckets["this_week"]
             if weekly:
-                tasks.append({
-                    "type": "weekly_preview",
-                    "key": key,
-                    "identifier": today.isoformat(),
-                    "events": weekly,
-                })
+                add_task(Task("weekly_preview", key, today.isoformat(), events=weekly))
 
     # Thursday: weekend preview
     if today.weekday() == 3:  # Thursday
         friday = today + timedelta(days=1)
         key = f"weekend_preview:{friday.isoformat()}"
-        if not is_posted(log, key):
-            weekend = get_weekend_events(events)
+        if key not in posted:
+            weekend = buckets["this_weekend"]
             if weekend:
-                tasks.append({
-                    "type": "weekend_preview",
-                    "key": key,
-                    "identifier": friday.isoformat(),
-                    "events": weekend,
-                })
+                add_task(Task("weekend_preview", key, friday.isoformat(), events=weekend))
 
     # Every day: pre-race (events starting in 2 days)
-    pre_race = get_pre_race_events(events, days_ahead=2, ref_date=today)
-    for event in pre_race:
+    for event in buckets["in_2_days"]:
         key = f"pre_race:{event['id']}"
-        if not is_posted(log, key):
-            tasks.append({
-                "type": "pre_race",
-                "key": key,
-                "identifier": event["id"],
-                "event": event,
-            })
+        if key not in posted:
+            add_task(Task("pre_race", key, event["id"], event=event))
 
     # Every day: race day (events starting today)
-    race_day = get_race_day_events(events, ref_date=today)
-    for event in race_day:
+    for event in buckets["today"]:
         key = f"race_day:{event['id']}"
-        if not is_posted(log, key):
-            tasks.append({
-                "type": "race_day",
-                "key": key,
-                "identifier": event["id"],
-                "event": event,
-            })
+        if key not in posted:
+            add_task(Task("race_day", key, event["id"], event=event))
 
     return tasks
 
 
-def execute_tasks(tasks: list[dict], all_events: list[dict], dry_run: bool = False) -> None:
-    """Execute posting tasks: generate images, post, and log results."""
-    if not tasks:
-        print("No tasks to execute.")
-        return
+TASK_TYPES = ("weekly_preview", "weekend_preview", "pre_race", "race_day")
+
+# Where scheduled posts go, and the image formats rendered for them
+_PLATFORMS = ["facebook", "instagram"]
+_FORMATS = ["post", "facebook"]
+
 
-    # Build poster
+def build_poster(dry_run: bool) -> MetaPoster:
+    """Build the MetaPoster for a run, checking credentials unless dry_run."""
     if dry_run:
-        poster = MetaPoster(
+        return MetaPoster(
             page_access_token="DRY_RUN",
             page_id="DRY_RUN",
             ig_user_id="DRY_RUN",
         )
-    else:
-        token = os.environ.get("META_PAGE_ACCESS_TOKEN")
-        page_id = os.environ.get("META_PAGE_ID")
-        ig_user_id = os.environ.get("META_IG_USER_ID")
-        if not token or not page_id:
-            print("Error: META_PAGE_ACCESS_TOKEN and META_PAGE_ID must be set")
-            sys.exit(1)
-        if not ig_user_id:
-            print("Error: META_IG_USER_ID must be set")
-            sys.exit(1)
-        poster = MetaPoster(
-            page_access_token=token,
-            page_id=page_id,
-            ig_user_id=ig_user_id,
-        )
+    token = os.environ.get("META_PAGE_ACCESS_TOKEN")
+    page_id = os.environ.get("META_PAGE_ID")
+    ig_user_id = os.environ.get("META_IG_USER_ID")
+    if not token or not page_id:
+        print("Error: META_PAGE_ACCESS_TOKEN and META_PAGE_ID must be set")
+        sys.exit(1)
+    if not ig_user_id:
+        print("Error: META_IG_USER_ID must be set")
+        sys.exit(1)
+    return MetaPoster(
+        page_access_token=token,
+        page_id=page_id,
+        ig_user_id=ig_user_id,
+    )
+
+
+def _generate_task(task: Task, all_events: list[dict], formats: list[str]) -> list[Path]:
+    """Render the images for one task. Module-level so worker processes can run it."""
+    if task.type == "weekly_preview":
+        return generate_weekly_images(task.events, formats)
+    if task.type == "weekend_preview":
+        return generate_weekend_images(task.events, formats)
+    return generate_event_images(task.event, [task.type], formats, all_events=all_events)
+
+
+def execute_tasks(
+    tasks: list[Task],
+    all_events: list[dict],
+    dry_run: bool = False,
+    *,
+    log: dict | None = None,
+) -> None:
+    """Execute posting tasks: generate images, post, and log results.
+
+    ``log`` is the posting log if the caller has already loaded it (otherwise
+    it is read here); each new entry is appended to the file and to ``log``.
+    """
+    if not tasks:
+        print("No tasks to execute.")
+        return
 
-    log = load_posting_log()
-    platforms = ["facebook", "instagram"]
-    formats = ["post", "facebook"]
+    if log is None:
+        log = load_posting_log()
 
+    poster = build_poster(dry_run)
+
+    # Phase 1: render every task's images. Rendering is CPU-bound and tasks
+    # share nothing, so they run in separate processes.
+    runnable = []
     for task in tasks:
-        task_type = task["type"]
-        print(f"\n--- {task_type}: {task['identifier']} ---")
+        if task.type in TASK_TYPES:
+            runnable.append(task)
+        else:
+            print(f"\n--- {task.type}: {task.identifier} ---")
+            print(f"  Unknown task type: {task.type}")
+
+    # A single task isn't worth starting worker processes for
+    pool_cls = ProcessPoolExecutor if len(runnable) > 1 else ThreadPoolExecutor
+    with pool_cls(max_workers=max(1, min(len(runnable), os.cpu_count() or 1))) as pool:
+        futures = [pool.submit(_generate_task, task, all_events, _FORMATS) for task in runnable]
+
+    # Phase 2: post one task at a time to stay within Meta's rate limits
+    for task, future in zip(runnable, futures):
+        print(f"\n--- {task.type}: {task.identifier} ---")
 
         try:
-            # Generate images
-            if task_type == "weekly_preview":
-                outputs = generate_weekly_images(task["events"], formats)
-            elif task_type == "weekend_preview":
-                outputs = generate_weekend_images(task["events"], formats)
-            elif task_type in ("pre_race", "race_day"):
-                outputs = generate_event_images(
-                    task["event"], [task_type], formats, all_events=all_events,
-                )
-            else:
-                print(f"  Unknown task type: {task_type}")
-                continue
+            outputs = future.result()
 
             if not outputs:
                 print("  No images generated, skipping.")
@@ -184,21 +256,22 @@ def execute_tasks(tasks: list[dict], all_events: list[dict], dry_run: bool = Fal
             print(f"  Content type: {content_type}")
 
             # Post
-            results = poster.post_folder(folder, content_type, platforms, dry_run=dry_run)
+            results = poster.post_folder(folder, content_type, _PLATFORMS, dry_run=dry_run)
 
             # Log success (only if not dry run and at least one platform posted)
-            posted_platforms = [p for p, r in results.items() if "posted" in r]
+            posted_platforms = [p for p, r in results.items() if r.startswith("posted")]
             if not dry_run and posted_platforms:
-                log["posts"].append({
-                    "key": task["key"],
-                    "content_type": task_type,
-                    "identifier": task["identifier"],
-                    "posted_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                entry = {
+                    "key": task.key,
+                    "content_type": task.type,
+                    "identifier": task.identifier,
+                    "posted_at": datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
                     "folder": folder.name,
                     "platforms": posted_platforms,
-                })
-                save_posting_log(log)
-                print(f"  Logged: {task['key']}")
+                }
+                append_post(entry)
+                log["posts"].append(entry)
+                print(f"  Logged: {task.key}")
 
         except Exception as e:
             print(f"  Error: {e}")
@@ -234,12 +307,13 @@ def main():
         return
 
     print(f"\nTasks for today ({len(tasks)}):")
+    posted = posted_keys(log)
     for task in tasks:
-        status = "ALREADY POSTED" if is_posted(log, task["key"]) else "pending"
-        print(f"  [{status}] {task['type']}: {task['identifier']} (key={task['key']})")
+        status = "ALREADY POSTED" if task.key in posted else "pending"
+        print(f"  [{status}] {task.type}: {task.identifier} (key={task.key})")
 
     if args.execute or args.dry_run:
-        execute_tasks(tasks, all_events=events, dry_run=args.dry_run)
+        execute_tasks(tasks, all_events=events, log=log, dry_run=args.dry_run)
     else:
         print("\nRun with --execute to post, or --dry-run to preview.")
 
@@ -1,10 +1,11 @@
 """Base template class with shared header/footer/venue rendering."""
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
 from PIL import Image, ImageDraw
 
-from social.config import FORMATS, COLOR_PRIMARY, COLOR_WHITE, COLOR_MUTED
+from social.config import FORMATS, COLOR_PRIMARY, COLOR_WHITE, COLOR_MUTED, DISCIPLINE_COLORS
 from social.font_loader import load_font
 from social.renderer import (
     create_canvas,
@@ -13,9 +14,75 @@ from social.renderer import (
     draw_accent_line,
     draw_footer,
     draw_text,
+    measure_logo,
+    text_bbox,
 )
 
 
+TAGLINE_TEXT = "INDOOR SKI + GOLF"
+
+
+def _scale_for_width(base_size: int, width: int) -> int:
+    """Scale a font size relative to story format (1080 width)."""
+    return max(10, int(base_size * (width / 1080)))
+
+
+def _build_layout(fmt: str) -> dict:
+    """Header geometry for one format; depends only on the format's size."""
+    width, _ = FORMATS[fmt]
+    margin = int(width * 0.07)
+    if fmt == "facebook":
+        logo_max_w, logo_max_h = int(width * 0.13), 26
+    elif fmt == "post":
+        logo_max_w, logo_max_h = int(width * 0.28), 58
+    else:  # story, reel
+        logo_max_w, logo_max_h = int(width * 0.33), 68
+    return {
+        "margin": margin,
+        "content_width": width - margin * 2,
+        "logo_max_w": logo_max_w,
+        "logo_max_h": logo_max_h,
+        "tagline_size": _scale_for_width(12 if fmt == "facebook" else 22, width),
+    }
+
+
+# Computed once at import rather than on every template instance
+_LAYOUT = {fmt: _build_layout(fmt) for fmt in FORMATS}
+
+
+AGE_GROUP_PILL_COLOR = "#475569"
+
+
+@lru_cache(maxsize=256)
+def _pill_items(disciplines: tuple[str, ...], age_groups: tuple[str, ...]) -> tuple[tuple, tuple]:
+    discipline_items = tuple((d, DISCIPLINE_COLORS.get(d, COLOR_PRIMARY)) for d in disciplines)
+    age_items = tuple((ag, AGE_GROUP_PILL_COLOR) for ag in age_groups)
+    return discipline_items, age_items
+
+
+def pill_items_for(event: dict) -> tuple[tuple, tuple]:
+    """Return (discipline_items, age_items) pill rows for an event.
+
+    Keyed on the discipline and age-group values, so the pre-race, race-day
+    and weekly templates share one build per event across all formats.
+    """
+    return _pill_items(tuple(event.get("disciplines") or ()), tuple(event.get("age_groups") or ()))
+
+
+def format_event_header(event: dict) -> tuple[str, str, str]:
+    """Return (venue_text, date_display, detail_text) for an event's info line.
+
+    venue_text is "Venue, ST"; detail_text is "Venue, ST  |  <date display>",
+    or venue_text alone when the event has no date display.
+    """
+    venue = event.get("venue", "TBD")
+    state = event.get("state", "")
+    venue_text = f"{venue}, {state}" if state else venue
+    date_display = event.get("dates", {}).get("display", "")
+    detail_text = f"{venue_text}  |  {date_display}" if date_display else venue_text
+    return venue_text, date_display, detail_text
+
+
 class BaseTemplate(ABC):
     """Base class for all social image templates."""
 
@@ -24,9 +91,10 @@ class BaseTemplate(ABC):
         self.width, self.height = FORMATS[fmt]
         self.canvas = create_canvas(self.width, self.height)
         self.draw = ImageDraw.Draw(self.canvas)
+        self.layout = _LAYOUT[fmt]
         # Standard margins scale with image width
-        self.margin = int(self.width * 0.07)
-        self.content_width = self.width - self.margin * 2
+        self.margin = self.layout["margin"]
+        self.content_width = self.layout["content_width"]
 
     def draw_header(self) -> int:
         """Draw the logo + tagline below + blue accent line. Returns y position after header."""
@@ -34,33 +102,19 @@ class BaseTemplate(ABC):
         y = int(self.margin * 0.35) if is_fb else self.margin
 
         # Logo sizing based on format
-        if is_fb:
-            logo_max_w = int(self.width * 0.13)
-            logo_max_h = 26
-        elif self.fmt == "post":
-            logo_max_w = int(self.width * 0.28)
-            logo_max_h = 58
-        else:  # story, reel
-            logo_max_w = int(self.width * 0.33)
-            logo_max_h = 68
-
-        # First pass: composite at 0,0 area to get actual size
-        logo_w, logo_h = composite_logo(
-            self.canvas, 0, y, logo_max_w, logo_max_h
-        )
-        # Clear that area and re-composite centered
-        from social.renderer import hex_to_rgb
-        from social.config import COLOR_BG
-        self.draw.rectangle([0, y, logo_w, y + logo_h], fill=hex_to_rgb(COLOR_BG))
+        logo_max_w = self.layout["logo_max_w"]
+        logo_max_h = self.layout["logo_max_h"]
+
+        # Measure first so the logo is composited once, already centered
+        logo_w, logo_h = measure_logo(logo_max_w, logo_max_h)
         logo_x = (self.width - logo_w) // 2
         composite_logo(self.canvas, logo_x, y, logo_max_w, logo_max_h)
         y += logo_h + (4 if is_fb else 10)
 
         # Tagline below logo — white, bold, centered
-        tagline_size = self._scale_font(12 if is_fb else 22)
-        tagline_font = load_font("Bold", tagline_size)
-        tagline_text = "INDOOR SKI + GOLF"
-        tagline_bbox = tagline_font.getbbox(tagline_text)
+        tagline_font = load_font("Bold", self.layout["tagline_size"])
+        tagline_text = TAGLINE_TEXT
+        tagline_bbox = text_bbox(tagline_font, tagline_text)
         tagline_w = tagline_bbox[2] - tagline_bbox[0]
         tagline_x = (self.width - tagline_w) // 2
         draw_text(
@@ -101,14 +155,21 @@ class BaseTemplate(ABC):
 
     def _scale_font(self, base_size: int) -> int:
         """Scale font size relative to story format (1080 width)."""
-        return max(10, int(base_size * (self.width / 1080)))
+        return _scale_for_width(base_size, self.width)
 
     @abstractmethod
     def render(self, **kwargs) -> Image.Image:
         """Render the template with given data. Returns the PIL Image."""
 
-    def save(self, path: Path) -> None:
-        """Save the rendered image to disk."""
+    def save(self, path: Path, create_parent: bool = True) -> None:
+        """Save the rendered image to disk.
+
+        Callers that write several formats into one directory can create it
+        up front and pass ``create_parent=False`` to skip the per-save mkdir.
+        """
         path = Path(path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        self.canvas.save(str(path), "PNG", quality=95)
+        if create_parent:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        # quality= is a JPEG option and was ignored for PNG; fast zlib instead
+        # of the default level 6 trades a little file size for encode time
+        self.canvas.save(str(path), "PNG", compress_level=1)
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import calendar
+from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
 
 from PIL import Image
 
 from social.config import (
+    FORMATS,
     COLOR_PRIMARY,
     COLOR_WHITE,
     COLOR_MUTED,
@@ -15,56 +18,75 @@ from social.config import (
 )
 from social.font_loader import load_font
 from social.renderer import (
+    BG_RGB,
+    PRIMARY_RGB,
     composite_logo,
     draw_text,
     draw_accent_line,
     hex_to_rgb,
+    text_bbox,
 )
-from social.templates.base import BaseTemplate
+from social.templates.base import TAGLINE_TEXT, BaseTemplate, _scale_for_width
+
+
+@dataclass(frozen=True, slots=True)
+class FormatConsts:
+    """Calendar sizes for one output format (font sizes are pre-scaling)."""
+
+    bar_height: int
+    day_num_font: int
+    bar_label_font: int
+    dow_header_font: int
+    title_font: int
+    cell_gap: int
+    max_lanes: int
 
 
 # Format-adaptive constants keyed by format name
 _FORMAT_CONSTANTS = {
-    "story": {
-        "bar_height": 28,
-        "day_num_font": 16,
-        "bar_label_font": 14,
-        "dow_header_font": 16,
-        "title_font": 36,
-        "cell_gap": 2,
-        "max_lanes": 4,
-    },
-    "reel": {
-        "bar_height": 28,
-        "day_num_font": 16,
-        "bar_label_font": 14,
-        "dow_header_font": 16,
-        "title_font": 36,
-        "cell_gap": 2,
-        "max_lanes": 4,
-    },
-    "post": {
-        "bar_height": 22,
-        "day_num_font": 14,
-        "bar_label_font": 12,
-        "dow_header_font": 14,
-        "title_font": 28,
-        "cell_gap": 2,
-        "max_lanes": 3,
-    },
-    "facebook": {
-        "bar_height": 18,
-        "day_num_font": 12,
-        "bar_label_font": 10,
-        "dow_header_font": 12,
-        "title_font": 22,
-        "cell_gap": 1,
-        "max_lanes": 2,
-    },
+    "story": FormatConsts(
+        bar_height=28,
+        day_num_font=16,
+        bar_label_font=14,
+        dow_header_font=16,
+        title_font=36,
+        cell_gap=2,
+        max_lanes=4,
+    ),
+    "reel": FormatConsts(
+        bar_height=28,
+        day_num_font=16,
+        bar_label_font=14,
+        dow_header_font=16,
+        title_font=36,
+        cell_gap=2,
+        max_lanes=4,
+    ),
+    "post": FormatConsts(
+        bar_height=22,
+        day_num_font=14,
+        bar_label_font=12,
+        dow_header_font=14,
+        title_font=28,
+        cell_gap=2,
+        max_lanes=3,
+    ),
+    "facebook": FormatConsts(
+        bar_height=18,
+        day_num_font=12,
+        bar_label_font=10,
+        dow_header_font=12,
+        title_font=22,
+        cell_gap=1,
+        max_lanes=2,
+    ),
 }
 
 _DOW_HEADERS = ["MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN"]
 
+# Day-number strings indexed by day of month (index 0 unused)
+_DAY_STRS = [""] + [str(d) for d in range(1, 32)]
+
 _GRID_LINE_COLOR = "#333333"
 _CELL_BG_COLOR = "#1E1E1E"
 
@@ -95,6 +117,46 @@ VENUE_COLORS = {
     "Big Sky": "#38BDF8",         # light blue
 }
 
+# Parsed once at import so the draw loops never touch hex strings
+VENUE_COLORS_RGB = {venue: hex_to_rgb(color) for venue, color in VENUE_COLORS.items()}
+_GRID_LINE_RGB = hex_to_rgb(_GRID_LINE_COLOR)
+_CELL_BG_RGB = hex_to_rgb(_CELL_BG_COLOR)
+
+
+_CAL_TITLE_TEXT = "Youth Ski Race Calendar"
+
+
+@lru_cache(maxsize=None)
+def _header_metrics(fmt: str) -> dict:
+    """Logo box, header fonts and their text bboxes for one format.
+
+    Everything here depends only on the format, so it is measured on the
+    first render of each format and reused afterwards.
+    """
+    width, _ = FORMATS[fmt]
+    if fmt == "facebook":
+        logo_max_w, logo_max_h = int(width * 0.15), 36
+    elif fmt == "post":
+        logo_max_w, logo_max_h = int(width * 0.22), 48
+    else:  # story, reel
+        logo_max_w, logo_max_h = int(width * 0.25), 56
+    tagline_font = load_font("Bold", _scale_for_width(14 if fmt == "facebook" else 18, width))
+    cal_title_font = load_font("Bold", _scale_for_width(18 if fmt == "facebook" else 24, width))
+    return {
+        "logo_max_w": logo_max_w,
+        "logo_max_h": logo_max_h,
+        "tagline_font": tagline_font,
+        "tagline_bbox": tagline_font.getbbox(TAGLINE_TEXT),
+        "cal_title_font": cal_title_font,
+        "cal_title_bbox": cal_title_font.getbbox(_CAL_TITLE_TEXT),
+    }
+
+
+@lru_cache(maxsize=32)
+def _dow_header_widths(font) -> tuple[int, ...]:
+    """Widths of the seven day-of-week headers in a (load_font-cached) font."""
+    return tuple(bbox[2] - bbox[0] for bbox in (font.getbbox(dow) for dow in _DOW_HEADERS))
+
 
 class MonthlyCalendarTemplate(BaseTemplate):
     """Visual monthly calendar grid with venue-colored event bars."""
@@ -102,44 +164,28 @@ class MonthlyCalendarTemplate(BaseTemplate):
     def draw_header(self) -> int:
         """Draw header: logo + tagline left-aligned, 'Youth Ski Race Calendar' right-aligned."""
         y = self.margin
-
-        # Logo sizing
-        if self.fmt == "facebook":
-            logo_max_w = int(self.width * 0.15)
-            logo_max_h = 36
-        elif self.fmt == "post":
-            logo_max_w = int(self.width * 0.22)
-            logo_max_h = 48
-        else:  # story, reel
-            logo_max_w = int(self.width * 0.25)
-            logo_max_h = 56
+        metrics = _header_metrics(self.fmt)
 
         # Logo left-aligned
         logo_w, logo_h = composite_logo(
-            self.canvas, self.margin, y, logo_max_w, logo_max_h
+            self.canvas, self.margin, y, metrics["logo_max_w"], metrics["logo_max_h"]
         )
 
         # Tagline below logo, left-aligned
-        tagline_size = self._scale_font(14 if self.fmt == "facebook" else 18)
-        tagline_font = load_font("Bold", tagline_size)
-        tagline_text = "INDOOR SKI + GOLF"
+        tagline_bbox = metrics["tagline_bbox"]
         tagline_y = y + logo_h + 6
-        draw_text(self.draw, tagline_text, self.margin, tagline_y, tagline_font, COLOR_WHITE)
-        tagline_bbox = tagline_font.getbbox(tagline_text)
+        draw_text(self.draw, TAGLINE_TEXT, self.margin, tagline_y, metrics["tagline_font"], COLOR_WHITE)
         left_bottom = tagline_y + (tagline_bbox[3] - tagline_bbox[1])
 
         # "Youth Ski Race Calendar" right-aligned, vertically centered with logo block
-        cal_title_size = self._scale_font(18 if self.fmt == "facebook" else 24)
-        cal_title_font = load_font("Bold", cal_title_size)
-        cal_title_text = "Youth Ski Race Calendar"
-        cal_bbox = cal_title_font.getbbox(cal_title_text)
+        cal_bbox = metrics["cal_title_bbox"]
         cal_w = cal_bbox[2] - cal_bbox[0]
         cal_h = cal_bbox[3] - cal_bbox[1]
         cal_x = self.margin + self.content_width - cal_w
         # Vertically center within the logo+tagline block
         block_h = left_bottom - y
         cal_y = y + (block_h - cal_h) // 2
-        draw_text(self.draw, cal_title_text, cal_x, cal_y, cal_title_font, COLOR_PRIMARY)
+        draw_text(self.draw, _CAL_TITLE_TEXT, cal_x, cal_y, metrics["cal_title_font"], COLOR_PRIMARY)
 
         y = left_bottom + 12
 
@@ -156,14 +202,14 @@ class MonthlyCalendarTemplate(BaseTemplate):
         y = self.draw_header()
 
         # Month title
-        title_font = load_font("Bold", self._scale_font(consts["title_font"]))
+        title_font = load_font("Bold", self._scale_font(consts.title_font))
         month_name = calendar.month_name[month].upper()
         title_text = f"{month_name} {year}"
-        title_bbox = title_font.getbbox(title_text)
+        title_bbox = text_bbox(title_font, title_text)
         title_w = title_bbox[2] - title_bbox[0]
         title_x = (self.width - title_w) // 2
-        draw_text(self.draw, title_text, title_x, y, title_font, COLOR_WHITE)
-        y += (title_bbox[3] - title_bbox[1]) + 12
+        h = draw_text(self.draw, title_text, title_x, y, title_font, COLOR_WHITE)
+        y += h + 12
 
         # Accent line below title
         draw_accent_line(self.draw, self.margin, y, self.content_width)
@@ -173,12 +219,18 @@ class MonthlyCalendarTemplate(BaseTemplate):
         weeks = self._build_calendar_grid(year, month)
         month_events = self._filter_month_events(events, year, month)
         events_with_lanes = self._allocate_lanes(month_events, weeks, year, month)
+        segments_by_week = _segments_by_week(events_with_lanes, len(weeks))
+
+        # Resolve the grid fonts once; the legend shares the bar label font
+        dow_font = load_font("Bold", self._scale_font(consts.dow_header_font))
+        day_font = load_font("Regular", self._scale_font(consts.day_num_font))
+        bar_font = load_font("Regular", self._scale_font(consts.bar_label_font))
 
         # Draw the grid
-        y = self._draw_grid(y, weeks, events_with_lanes, consts)
+        y = self._draw_grid(y, weeks, segments_by_week, consts, dow_font, day_font, bar_font)
 
         # Color key legend
-        y = self._draw_legend(y, month_events, consts)
+        y = self._draw_legend(y, month_events, consts, bar_font)
 
         # Footer
         self.draw_footer_section()
@@ -188,12 +240,9 @@ class MonthlyCalendarTemplate(BaseTemplate):
         self, events: list[dict], year: int, month: int
     ) -> list[dict]:
         """Filter to events whose date range overlaps the target month."""
-        month_start = date(year, month, 1)
-        if month == 12:
-            month_end = date(year + 1, 1, 1)
-        else:
-            month_end = date(year, month + 1, 1)
-        # month_end is exclusive (first day of next month)
+        month_start = date(year, month, 1).toordinal()
+        # Exclusive: ordinal of the first day of next month
+        month_end = month_start + calendar.monthrange(year, month)[1]
 
         filtered = []
         for event in events:
@@ -202,9 +251,11 @@ class MonthlyCalendarTemplate(BaseTemplate):
             end_str = dates.get("end", "")
             if not start_str or not end_str:
                 continue
+            # Parsed ordinals come from the _iso_ordinal cache, so a run that
+            # renders many months parses each date once, without tagging events
             try:
-                ev_start = date.fromisoformat(start_str)
-                ev_end = date.fromisoformat(end_str)
+                ev_start = _iso_ordinal(start_str)
+                ev_end = _iso_ordinal(end_str)
             except ValueError:
                 continue
             # Overlaps if event starts before month ends AND event ends on/after month start
@@ -248,95 +299,67 @@ class MonthlyCalendarTemplate(BaseTemplate):
             "end_col": end column (0-6),
             "lane": lane number (0-based),
             "color": hex color for the bar,
+            "color_rgb": the same color as an RGB tuple,
             "label": display label,
         }
         """
-        max_lanes = self._consts["max_lanes"]
+        max_lanes = self._consts.max_lanes
         segments = []
 
+        # Grid position of a date is (ordinal - month_first + first_weekday) // 7, % 7
+        month_first = date(year, month, 1).toordinal()
+        month_last = month_first + calendar.monthrange(year, month)[1] - 1
+        grid_offset = date(year, month, 1).weekday() - month_first
+
         for event in events:
             dates = event.get("dates", {})
-            ev_start = date.fromisoformat(dates["start"])
-            ev_end = date.fromisoformat(dates["end"])
             venue = event.get("venue", "")
             color = VENUE_COLORS.get(venue, COLOR_PRIMARY)
+            color_rgb = VENUE_COLORS_RGB.get(venue, PRIMARY_RGB)
+
+            # Clip to the month; the grid only has cells for its days
+            first = max(_iso_ordinal(dates["start"]), month_first)
+            last = min(_iso_ordinal(dates["end"]), month_last)
+            if first > last:
+                continue
 
             # Build a short label
             label = self._short_label(event)
 
-            for week_idx, week in enumerate(weeks):
-                # Find columns this event spans in this week
-                start_col = None
-                end_col = None
-                for col, day in enumerate(week):
-                    if day is None:
-                        continue
-                    cell_date = date(year, month, day)
-                    if ev_start <= cell_date <= ev_end:
-                        if start_col is None:
-                            start_col = col
-                        end_col = col
-
-                if start_col is not None:
-                    segments.append({
-                        "event": event,
-                        "week_idx": week_idx,
-                        "start_col": start_col,
-                        "end_col": end_col,
-                        "lane": -1,  # assigned below
-                        "color": color,
-                        "label": label,
-                    })
+            start_idx = first + grid_offset
+            end_idx = last + grid_offset
+            first_week, last_week = start_idx // 7, end_idx // 7
+            for week_idx in range(first_week, last_week + 1):
+                segments.append({
+                    "event": event,
+                    "week_idx": week_idx,
+                    "start_col": start_idx % 7 if week_idx == first_week else 0,
+                    "end_col": end_idx % 7 if week_idx == last_week else 6,
+                    "lane": -1,  # assigned below
+                    "color": color,
+                    "color_rgb": color_rgb,
+                    "label": label,
+                })
 
         # Assign lanes per week row
-        for week_idx in range(len(weeks)):
-            week_segs = [s for s in segments if s["week_idx"] == week_idx]
-            # Sort by start column, then by span width (wider first)
-            week_segs.sort(key=lambda s: (s["start_col"], -(s["end_col"] - s["start_col"])))
-            # Track which columns are occupied per lane
-            lane_occupancy: list[list[bool]] = []  # lane -> [col occupied]
-            for seg in week_segs:
-                placed = False
-                for lane_idx in range(max_lanes):
-                    if lane_idx >= len(lane_occupancy):
-                        lane_occupancy.append([False] * 7)
-                    # Check if this lane has room
-                    conflict = False
-                    for col in range(seg["start_col"], seg["end_col"] + 1):
-                        if lane_occupancy[lane_idx][col]:
-                            conflict = True
-                            break
-                    if not conflict:
-                        # Place in this lane
-                        for col in range(seg["start_col"], seg["end_col"] + 1):
-                            lane_occupancy[lane_idx][col] = True
-                        seg["lane"] = lane_idx
-                        placed = True
-                        break
-                if not placed:
-                    # Overflow — place in last lane (may overlap)
-                    seg["lane"] = max_lanes - 1
+        for week_segs in _segments_by_week(segments, len(weeks)):
+            lanes = _assign_lanes(
+                [seg["start_col"] for seg in week_segs],
+                [seg["end_col"] for seg in week_segs],
+                max_lanes,
+            )
+            for seg, lane in zip(week_segs, lanes):
+                seg["lane"] = lane
 
         return segments
 
     def _short_label(self, event: dict) -> str:
         """Create a short label for event bars."""
-        disciplines = event.get("disciplines", [])
-        venue = event.get("venue", "")
-        age_groups = event.get("age_groups", [])
-        disc_str = "/".join(disciplines) if disciplines else ""
-        age_str = " ".join(age_groups) if age_groups else ""
-
-        parts = []
-        if disc_str:
-            parts.append(disc_str)
-        if venue:
-            parts.append(venue)
-        if age_str:
-            parts.append(age_str)
-
-        if parts:
-            return " ".join(parts)
+        disc_str = "/".join(event.get("disciplines") or ())
+        age_str = " ".join(event.get("age_groups") or ())
+        label = " ".join(filter(None, (disc_str, event.get("venue", ""), age_str)))
+        if label:
+            return label
         # Fallback: use event name (strip venue suffix if present)
         name = event.get("name", "Event")
         return name[:30]
@@ -345,20 +368,17 @@ class MonthlyCalendarTemplate(BaseTemplate):
         self,
         y_start: int,
         weeks: list[list[int | None]],
-        segments: list[dict],
-        consts: dict,
+        segments_by_week: list[list[dict]],
+        consts: FormatConsts,
+        dow_font,
+        day_font,
+        bar_font,
     ) -> int:
         """Draw day-of-week headers, cells, day numbers, and event bars."""
-        cell_gap = consts["cell_gap"]
-        bar_height = consts["bar_height"]
-        max_lanes = consts["max_lanes"]
-        dow_font_size = self._scale_font(consts["dow_header_font"])
-        day_font_size = self._scale_font(consts["day_num_font"])
-        bar_font_size = self._scale_font(consts["bar_label_font"])
-
-        dow_font = load_font("Bold", dow_font_size)
-        day_font = load_font("Regular", day_font_size)
-        bar_font = load_font("Regular", bar_font_size)
+        cell_gap = consts.cell_gap
+        bar_height = consts.bar_height
+        max_lanes = consts.max_lanes
+        bar_font_size = bar_font.size
 
         grid_left = self.margin
         grid_width = self.content_width
@@ -366,19 +386,29 @@ class MonthlyCalendarTemplate(BaseTemplate):
 
         y = y_start
 
+        # Left edge of each column, and bar x / width by start column / span
+        col_x = [grid_left + c * col_width for c in range(7)]
+        bar_x_by_col = [x + 2 for x in col_x]
+        bar_w_by_span = [(span + 1) * col_width - 4 for span in range(7)]
+
         # Day-of-week headers
+        dow_widths = _dow_header_widths(dow_font)
         for col, dow in enumerate(_DOW_HEADERS):
-            x = grid_left + col * col_width
-            bbox = dow_font.getbbox(dow)
-            text_w = bbox[2] - bbox[0]
-            text_x = x + (col_width - text_w) // 2
+            text_x = col_x[col] + (col_width - dow_widths[col]) // 2
             draw_text(self.draw, dow, text_x, y, dow_font, COLOR_MUTED)
 
-        dow_bbox = dow_font.getbbox("MON")
+        dow_bbox = text_bbox(dow_font, "MON")
         y += (dow_bbox[3] - dow_bbox[1]) + 8
 
         # Calculate row height: day number + lanes area + padding
-        day_num_h = day_font.getbbox("31")[3] - day_font.getbbox("31")[1]
+        day_num_bbox = text_bbox(day_font, "31")
+        day_num_h = day_num_bbox[3] - day_num_bbox[1]
+
+        # Day-number widths by day; text_bbox is memoized, so after the
+        # first render of a format this is 31 dict hits
+        day_widths = [0] + [
+            bbox[2] - bbox[0] for bbox in (text_bbox(day_font, d) for d in _DAY_STRS[1:])
+        ]
         row_content_h = day_num_h + 4 + max_lanes * (bar_height + 2)
         row_height = row_content_h + cell_gap * 2
 
@@ -394,34 +424,38 @@ class MonthlyCalendarTemplate(BaseTemplate):
             bar_area = row_content_h - day_num_h - 4
             bar_height = max(10, (bar_area // max_lanes) - 2)
 
-        grid_line_rgb = hex_to_rgb(_GRID_LINE_COLOR)
-        cell_bg_rgb = hex_to_rgb(_CELL_BG_COLOR)
+        # Cell backgrounds: one fill for the whole grid, then the gaps between
+        # cells cut back out in the page background (gaps are cell_gap - 1 px)
+        cell_w = col_width - cell_gap
+        cell_h = row_height - cell_gap
+        if weeks:
+            grid_right = grid_left + 6 * col_width + cell_w
+            grid_bottom = y + (len(weeks) - 1) * row_height + cell_h
+            self.draw.rectangle([grid_left, y, grid_right, grid_bottom], fill=_CELL_BG_RGB)
+            if cell_gap > 1:
+                for col in range(6):
+                    gap_x = col_x[col] + cell_w + 1
+                    self.draw.rectangle(
+                        [gap_x, y, gap_x + cell_gap - 2, grid_bottom], fill=BG_RGB,
+                    )
+                for week_idx in range(len(weeks) - 1):
+                    gap_y = y + week_idx * row_height + cell_h + 1
+                    self.draw.rectangle(
+                        [grid_left, gap_y, grid_right, gap_y + cell_gap - 2], fill=BG_RGB,
+                    )
+
+        row_ys = [y + w * row_height for w in range(len(weeks))]
+        # Day numbers sit in the top-right of each cell
+        day_right = [x + cell_w - 4 for x in col_x]
 
         for week_idx, week in enumerate(weeks):
-            row_y = y + week_idx * row_height
+            row_y = row_ys[week_idx]
 
-            # Draw cell backgrounds and day numbers
+            # Day numbers
             for col, day in enumerate(week):
-                cell_x = grid_left + col * col_width
-                cell_y = row_y
-                cell_w = col_width - cell_gap
-                cell_h = row_height - cell_gap
-
-                # Cell background
-                self.draw.rectangle(
-                    [cell_x, cell_y, cell_x + cell_w, cell_y + cell_h],
-                    fill=cell_bg_rgb,
-                )
-
                 if day is not None:
-                    # Day number in top-right of cell
-                    day_str = str(day)
-                    day_bbox = day_font.getbbox(day_str)
-                    day_text_w = day_bbox[2] - day_bbox[0]
-                    day_x = cell_x + cell_w - day_text_w - 4
-                    day_y = cell_y + 3
                     draw_text(
-                        self.draw, day_str, day_x, day_y,
+                        self.draw, _DAY_STRS[day], day_right[col] - day_widths[day], row_y + 3,
                         day_font, COLOR_MUTED,
                     )
 
@@ -429,12 +463,12 @@ class MonthlyCalendarTemplate(BaseTemplate):
             line_y = row_y + row_height - cell_gap
             self.draw.line(
                 [(grid_left, line_y), (grid_left + grid_width, line_y)],
-                fill=grid_line_rgb,
+                fill=_GRID_LINE_RGB,
                 width=1,
             )
 
             # Draw event bars for this week
-            week_segments = [s for s in segments if s["week_idx"] == week_idx]
+            week_segments = segments_by_week[week_idx]
             bar_area_y = row_y + day_num_h + 6  # below day numbers
 
             for seg in week_segments:
@@ -445,15 +479,13 @@ class MonthlyCalendarTemplate(BaseTemplate):
                 if bar_y + bar_height > row_y + row_height - cell_gap:
                     continue
 
-                bar_x = grid_left + seg["start_col"] * col_width + 2
-                bar_w = (seg["end_col"] - seg["start_col"] + 1) * col_width - 4
-                bar_color = hex_to_rgb(seg["color"])
-
+                bar_x = bar_x_by_col[seg["start_col"]]
+                bar_w = bar_w_by_span[seg["end_col"] - seg["start_col"]]
                 # Draw rounded rect bar
                 self.draw.rounded_rectangle(
                     [bar_x, bar_y, bar_x + bar_w, bar_y + bar_height],
                     radius=4,
-                    fill=bar_color,
+                    fill=seg["color_rgb"],
                 )
 
                 # Label inside bar
@@ -471,7 +503,7 @@ class MonthlyCalendarTemplate(BaseTemplate):
         return y
 
     def _draw_legend(
-        self, y_start: int, month_events: list[dict], consts: dict
+        self, y_start: int, month_events: list[dict], consts: FormatConsts, label_font
     ) -> int:
         """Draw a color key legend showing venue colors used this month."""
         # Collect unique venues in display order (order of first appearance)
@@ -479,12 +511,11 @@ class MonthlyCalendarTemplate(BaseTemplate):
         for event in month_events:
             venue = event.get("venue", "")
             if venue and venue not in seen:
-                seen[venue] = VENUE_COLORS.get(venue, COLOR_PRIMARY)
+                seen[venue] = VENUE_COLORS_RGB.get(venue, PRIMARY_RGB)
         if not seen:
             return y_start
 
-        label_font_size = self._scale_font(consts["bar_label_font"])
-        label_font = load_font("Regular", label_font_size)
+        label_font_size = label_font.size
         swatch_size = label_font_size + 2
         item_gap = 12
         row_gap = 6
@@ -495,7 +526,7 @@ class MonthlyCalendarTemplate(BaseTemplate):
         row_height = swatch_size + row_gap
 
         for venue, color in seen.items():
-            bbox = label_font.getbbox(venue)
+            bbox = text_bbox(label_font, venue)
             text_w = bbox[2] - bbox[0]
             item_w = swatch_size + 5 + text_w + item_gap
 
@@ -508,7 +539,7 @@ class MonthlyCalendarTemplate(BaseTemplate):
             self.draw.rounded_rectangle(
                 [x, y, x + swatch_size, y + swatch_size],
                 radius=3,
-                fill=hex_to_rgb(color),
+                fill=color,
             )
             # Draw venue label
             draw_text(
@@ -525,15 +556,65 @@ class MonthlyCalendarTemplate(BaseTemplate):
         self, name: str, max_width: int, font
     ) -> str:
         """Truncate event name to fit within max_width pixels, adding '...' if needed."""
-        if max_width <= 0:
-            return ""
-        bbox = font.getbbox(name)
-        if (bbox[2] - bbox[0]) <= max_width:
-            return name
-        # Truncate with ellipsis
-        for end in range(len(name), 0, -1):
-            truncated = name[:end] + "..."
-            bbox = font.getbbox(truncated)
-            if (bbox[2] - bbox[0]) <= max_width:
-                return truncated
+        return _abbreviate(name, max_width, font)
+
+
+@lru_cache(maxsize=4096)
+def _iso_ordinal(iso_date: str) -> int:
+    """Proleptic ordinal of a YYYY-MM-DD string, parsed once per distinct date."""
+    return date.fromisoformat(iso_date).toordinal()
+
+
+def _assign_lanes(starts: list[int], ends: list[int], max_lanes: int) -> list[int]:
+    """Greedy lane assignment for one week row, on parallel column lists.
+
+    Bars are placed by start column, wider first, into the lowest lane whose
+    7-bit column mask they don't overlap; bars that fit nowhere overflow into
+    the last lane. Returns the lane for each bar, in input order.
+    """
+    # Sort plain tuples rather than dicts; the index keeps the sort stable
+    order = sorted((start, start - end, i) for i, (start, end) in enumerate(zip(starts, ends)))
+    lanes = [max_lanes - 1] * len(starts)
+    lane_masks = [0] * max_lanes
+    for start, neg_width, i in order:
+        span = ((1 << (1 - neg_width)) - 1) << start
+        for lane_idx, mask in enumerate(lane_masks):
+            if not mask & span:
+                lane_masks[lane_idx] = mask | span
+                lanes[i] = lane_idx
+                break
+    return lanes
+
+
+def _segments_by_week(segments: list[dict], n_weeks: int) -> list[list[dict]]:
+    """Bucket segments by week row in one pass, keeping their order."""
+    by_week: list[list[dict]] = [[] for _ in range(n_weeks)]
+    for seg in segments:
+        by_week[seg["week_idx"]].append(seg)
+    return by_week
+
+
+@lru_cache(maxsize=2048)
+def _abbreviate(name: str, max_width: int, font) -> str:
+    """Cached body of MonthlyCalendarTemplate._abbreviate_name.
+
+    Multi-week events repeat the same label at the same width, and fonts come
+    from the load_font cache, so the font object itself is a stable key.
+    """
+    if max_width <= 0:
         return ""
+    bbox = text_bbox(font, name)
+    if (bbox[2] - bbox[0]) <= max_width:
+        return name
+    # Binary-search the longest prefix that fits with an ellipsis; width
+    # grows with prefix length, so ~log2(len) measurements instead of len
+    lo, hi, best = 1, len(name), 0
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        bbox = font.getbbox(name[:mid] + "...")
+        if (bbox[2] - bbox[0]) <= max_width:
+            best = mid
+            lo = mid + 1
+        else:
+            hi = mid - 1
+    return name[:best] + "..." if best else ""
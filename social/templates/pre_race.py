@@ -3,20 +3,15 @@
 from PIL import Image
 
 from social.captions import display_title
-from social.config import (
-    COLOR_PRIMARY,
-    COLOR_WHITE,
-    COLOR_MUTED,
-    DISCIPLINE_COLORS,
-)
+from social.config import COLOR_WHITE, COLOR_MUTED
 from social.font_loader import load_font
 from social.renderer import (
     draw_text,
-    draw_wrapped_text,
+    paste_wrapped_text,
     draw_pills_row,
     draw_accent_line,
 )
-from social.templates.base import BaseTemplate
+from social.templates.base import BaseTemplate, format_event_header, pill_items_for
 
 
 class PreRaceTemplate(BaseTemplate):
@@ -31,22 +26,18 @@ class PreRaceTemplate(BaseTemplate):
         # Event name as main title (word-wrapped)
         name_size = self._scale_font(28 if is_compact else 38)
         name_font = load_font("Bold", name_size)
-        h = draw_wrapped_text(
-            self.draw, display_title(event), self.margin, y,
+        h = paste_wrapped_text(
+            self.canvas, display_title(event), self.margin, y,
             name_font, self.content_width, COLOR_WHITE,
         )
         y += h + spacing
 
         # Discipline + age group pills
-        disciplines = event.get("disciplines", [])
-        age_groups = event.get("age_groups", [])
+        items, age_items = pill_items_for(event)
 
         if self.fmt == "facebook":
             # Combined single row for facebook
-            all_items = [
-                (d, DISCIPLINE_COLORS.get(d, COLOR_PRIMARY))
-                for d in disciplines
-            ] + [(ag, "#475569") for ag in age_groups]
+            all_items = items + age_items
             if all_items:
                 pill_font = load_font("Bold", self._scale_font(16))
                 _, pill_h = draw_pills_row(
@@ -55,20 +46,15 @@ class PreRaceTemplate(BaseTemplate):
                 )
                 y += pill_h + spacing
         else:
-            if disciplines:
+            if items:
                 pill_font = load_font("Bold", self._scale_font(18 if is_compact else 22))
-                items = [
-                    (d, DISCIPLINE_COLORS.get(d, COLOR_PRIMARY))
-                    for d in disciplines
-                ]
                 _, pill_h = draw_pills_row(
                     self.draw, items, self.margin, y, pill_font,
                 )
                 y += pill_h + spacing
 
-            if age_groups:
+            if age_items:
                 age_font = load_font("SemiBold", self._scale_font(14 if is_compact else 16))
-                age_items = [(ag, "#475569") for ag in age_groups]
                 _, age_h = draw_pills_row(
                     self.draw, age_items, self.margin, y, age_font,
                     padding_x=12, padding_y=6,
@@ -77,10 +63,7 @@ class PreRaceTemplate(BaseTemplate):
 
         # Date + venue on one line (or two short lines for compact)
         detail_font = load_font("SemiBold", self._scale_font(16 if is_compact else 22))
-        venue = event.get("venue", "TBD")
-        state = event.get("state", "")
-        venue_text = f"{venue}, {state}" if state else venue
-        date_display = event.get("dates", {}).get("display", "")
+        venue_text, date_display, _ = format_event_header(event)
 
         if date_display:
             detail_line = f"{date_display}  \u2022  {venue_text}"
@@ -90,6 +73,6 @@ class PreRaceTemplate(BaseTemplate):
         y += h
 
         # Venue photo from below content to bottom
-        self.draw_venue_section(venue, y)
+        self.draw_venue_section(event.get("venue", "TBD"), y)
         self.draw_footer_section()
         return self.canvas
@@ -1,23 +1,55 @@
 """Weekly preview 'THIS WEEK IN PC SKI RACING' template."""
 
+from functools import lru_cache
+
 from PIL import Image
 
 from social.config import (
+    FORMATS,
     COLOR_PRIMARY,
     COLOR_WHITE,
     COLOR_MUTED,
-    DISCIPLINE_COLORS,
 )
 from social.font_loader import load_font
 from social.renderer import (
     composite_venue_photo,
     draw_text,
-    draw_wrapped_text,
+    paste_wrapped_text,
     draw_pills_row,
     draw_accent_line,
     hex_to_rgb,
+    text_bbox,
 )
-from social.templates.base import BaseTemplate
+from social.templates.base import BaseTemplate, _scale_for_width, format_event_header, pill_items_for
+
+
+@lru_cache(maxsize=None)
+def _weekly_fonts(fmt: str) -> dict:
+    """Title, event-card and Facebook-column fonts for one format.
+
+    They depend only on the format, so they are resolved on the first
+    render of each format and reused afterwards.
+    """
+    width, _ = FORMATS[fmt]
+    is_compact = fmt in ("facebook", "post")
+
+    def scaled(base_size: int) -> int:
+        return _scale_for_width(base_size, width)
+
+    return {
+        "title": load_font("Bold", scaled(28 if is_compact else 36)),
+        # (name, detail, pill)
+        "card": (
+            load_font("Bold", scaled(18 if is_compact else 24)),
+            load_font("SemiBold", scaled(16 if is_compact else 20)),
+            load_font("Bold", scaled(12 if is_compact else 15)),
+        ),
+        # (name, detail)
+        "facebook": (
+            load_font("Bold", scaled(16)),
+            load_font("SemiBold", scaled(13)),
+        ),
+    }
 
 
 class WeeklyPreviewTemplate(BaseTemplate):
@@ -36,9 +68,10 @@ class WeeklyPreviewTemplate(BaseTemplate):
             y -= 15  # Tighten gap between header and title
         spacing = 10 if is_facebook else (15 if is_compact else 20)
 
+        fonts = _weekly_fonts(self.fmt)
+
         # Title
-        title_size = self._scale_font(28 if is_compact else 36)
-        title_font = load_font("Bold", title_size)
+        title_font = fonts["title"]
         h = draw_text(
             self.draw, self.TITLE_LINE_1, self.margin, y,
             title_font, COLOR_PRIMARY,
@@ -57,11 +90,12 @@ class WeeklyPreviewTemplate(BaseTemplate):
         # Calculate available space for event cards
         footer_reserved = 40 if is_facebook else 80
         available_height = self.height - y - footer_reserved
-        num_events = min(len(events), self.MAX_EVENTS)
+        displayed = events[:self.MAX_EVENTS]
+        num_events = len(displayed)
 
         if is_facebook and num_events > 0:
             # Facebook: side-by-side venue photos with text overlay
-            y = self._draw_facebook_layout(events[:self.MAX_EVENTS], y, available_height)
+            y = self._draw_facebook_layout(displayed, y, available_height)
         else:
             # Dynamic card height based on event count
             card_height = min(
@@ -69,8 +103,8 @@ class WeeklyPreviewTemplate(BaseTemplate):
                 700 if not is_compact else 350,
             )
 
-            for i, event in enumerate(events[:self.MAX_EVENTS]):
-                y = self._draw_event_card(event, y, card_height, is_compact)
+            for i, event in enumerate(displayed):
+                y = self._draw_event_card(event, y, card_height, is_compact, fonts["card"])
                 if i < num_events - 1:
                     # Separator line
                     sep_y = y + 5
@@ -93,8 +127,7 @@ class WeeklyPreviewTemplate(BaseTemplate):
         col_width = (self.content_width - gap * (num - 1)) // num
         photo_h = available_height
 
-        name_font = load_font("Bold", self._scale_font(16))
-        detail_font = load_font("SemiBold", self._scale_font(13))
+        name_font, detail_font = _weekly_fonts(self.fmt)["facebook"]
 
         for i, event in enumerate(events):
             x = self.margin + i * (col_width + gap)
@@ -105,35 +138,30 @@ class WeeklyPreviewTemplate(BaseTemplate):
 
             # Draw event text at bottom of photo with dark scrim
             text_y = y + photo_h
-            venue = event.get("venue", "TBD")
-            state = event.get("state", "")
-            venue_text = f"{venue}, {state}" if state else venue
-            date_display = event.get("dates", {}).get("display", "")
-            detail_text = f"{venue_text}  |  {date_display}" if date_display else venue_text
+            _, _, detail_text = format_event_header(event)
 
             # Measure text heights
-            name_bbox = name_font.getbbox(event["name"])
+            name_bbox = text_bbox(name_font, event["name"])
             name_h = name_bbox[3] - name_bbox[1]
-            detail_bbox = detail_font.getbbox(detail_text)
+            detail_bbox = text_bbox(detail_font, detail_text)
             detail_h = detail_bbox[3] - detail_bbox[1]
             text_block_h = name_h + detail_h + 16  # padding
 
-            # Dark scrim at bottom of photo
+            # Dark scrim at bottom of photo. The canvas is RGB, so drawing
+            # ignores alpha and the scrim is solid black; one rectangle
+            # covers the same rows as a per-scanline loop.
             scrim_y = y + photo_h - text_block_h - 8
-            for row in range(scrim_y, y + photo_h):
-                t = (row - scrim_y) / (text_block_h + 8)
-                alpha = int(160 + 60 * t)
-                self.draw.line(
-                    [(x, row), (x + col_width, row)],
-                    fill=(0, 0, 0, min(alpha, 220)),
-                )
+            self.draw.rectangle(
+                [x, scrim_y, x + col_width, y + photo_h - 1],
+                fill=(0, 0, 0),
+            )
 
             # Draw text over scrim
             text_x = x + 10
             text_y = scrim_y + 8
             # Use wrapped text for name in case it's long
-            draw_wrapped_text(
-                self.draw, event["name"], text_x, text_y,
+            paste_wrapped_text(
+                self.canvas, event["name"], text_x, text_y,
                 name_font, col_width - 20, COLOR_WHITE, line_spacing=2,
             )
             draw_text(
@@ -144,31 +172,28 @@ class WeeklyPreviewTemplate(BaseTemplate):
         return y + photo_h
 
     def _draw_event_card(
-        self, event: dict, y: int, max_height: int, is_compact: bool
+        self, event: dict, y: int, max_height: int, is_compact: bool, fonts: tuple
     ) -> int:
-        """Draw a single event card. Returns y position after card."""
+        """Draw a single event card. Returns y position after card.
+
+        ``fonts`` is the (name, detail, pill) fonts for this format.
+        """
         card_start = y
         spacing = 8 if is_compact else 12
+        name_font, detail_font, pill_font = fonts
 
         # Event name
-        name_size = self._scale_font(18 if is_compact else 24)
-        name_font = load_font("Bold", name_size)
-        h = draw_wrapped_text(
-            self.draw, event["name"], self.margin, y,
+        h = paste_wrapped_text(
+            self.canvas, event["name"], self.margin, y,
             name_font, self.content_width, COLOR_WHITE,
             line_spacing=4,
         )
         y += h + spacing
 
         # Venue + date on one line for compact, separate for tall
-        detail_font = load_font("SemiBold", self._scale_font(16 if is_compact else 20))
-        venue = event.get("venue", "TBD")
-        state = event.get("state", "")
-        venue_text = f"{venue}, {state}" if state else venue
-        date_display = event.get("dates", {}).get("display", "")
+        venue_text, date_display, detail_text = format_event_header(event)
 
         if is_compact:
-            detail_text = f"{venue_text}  |  {date_display}" if date_display else venue_text
             h = draw_text(self.draw, detail_text, self.margin, y, detail_font, COLOR_WHITE)
             y += h + spacing
         else:
@@ -179,13 +204,8 @@ class WeeklyPreviewTemplate(BaseTemplate):
                 y += h + spacing
 
         # Discipline pills (skip on facebook to save space)
-        disciplines = event.get("disciplines", [])
-        if disciplines and self.fmt != "facebook":
-            pill_font = load_font("Bold", self._scale_font(12 if is_compact else 15))
-            items = [
-                (d, DISCIPLINE_COLORS.get(d, COLOR_PRIMARY))
-                for d in disciplines
-            ]
+        items, _ = pill_items_for(event)
+        if items and self.fmt != "facebook":
             _, pill_h = draw_pills_row(
                 self.draw, items, self.margin, y, pill_font,
                 padding_x=10, padding_y=5,
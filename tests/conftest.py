@@ -0,0 +1,23 @@
+"""Shared test setup."""
+
+import pytest
+
+
+def pytest_collection_modifyitems(items):
+    """Mark tests that render full-size images, so -m "not slow" skips only those."""
+    for item in items:
+        if "render_size" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.slow)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def venue_cache_dir(tmp_path_factory):
+    """Keep venue composites rendered by tests out of the real output/.cache.
+
+    Every session starts with an empty cache, so template and generate tests
+    run the compositing code rather than reading composites from earlier runs.
+    """
+    path = tmp_path_factory.mktemp("venue_cache")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("social.renderer.VENUE_CACHE_DIR", path)
+        yield path
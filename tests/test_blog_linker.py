@@ -3,18 +3,22 @@
 Run: python3 -m pytest tests/test_blog_linker.py -v
 """
 
+import io
 import json
 from datetime import date
 from unittest.mock import patch, MagicMock
 
 import pytest
+import urllib3
 
 from ingestion.blog_linker import (
     _build_venue_slug_map,
     _clean_title,
     _extract_venue_from_slug,
     _fetch_rss_items,
+    _index_events_by_venue,
     _match_blog_to_event,
+    _parse_pub_date,
     discover_blog_links,
 )
 
@@ -65,54 +69,67 @@ class TestBuildVenueSlugMap:
 
 # --- Venue Extraction from Slug ---
 
-class TestExtractVenueFromSlug:
-    def setup_method(self):
-        self.slug_map = _build_venue_slug_map()
+    def test_built_once_and_read_only(self):
+        slug_map = _build_venue_slug_map()
+        assert _build_venue_slug_map() is slug_map
+        with pytest.raises(TypeError):
+            slug_map["new-venue"] = "New Venue"
+
+
+@pytest.fixture(scope="module")
+def slug_map():
+    """The production slug map, built once for the module."""
+    return _build_venue_slug_map()
 
-    def test_snowbird(self):
+
+class TestExtractVenueFromSlug:
+    def test_snowbird(self, slug_map):
         venue = _extract_venue_from_slug(
-            "hartlauer-memorial-south-series-gs-at-snowbird", self.slug_map
+            "hartlauer-memorial-south-series-gs-at-snowbird", slug_map
         )
         assert venue == "Snowbird"
 
-    def test_uop_alias(self):
+    def test_uop_alias(self, slug_map):
         venue = _extract_venue_from_slug(
-            "nolan-morris-takes-3rd-at-ysl-kombi-uop", self.slug_map
+            "nolan-morris-takes-3rd-at-ysl-kombi-uop", slug_map
         )
         assert venue == "Utah Olympic Park"
 
-    def test_sun_valley(self):
+    def test_sun_valley(self, slug_map):
         venue = _extract_venue_from_slug(
-            "race-recap-sun-valley-gs", self.slug_map
+            "race-recap-sun-valley-gs", slug_map
         )
         assert venue == "Sun Valley"
 
-    def test_no_venue(self):
+    def test_no_venue(self, slug_map):
         venue = _extract_venue_from_slug(
-            "general-skiing-news-update", self.slug_map
+            "general-skiing-news-update", slug_map
         )
         assert venue is None
 
-    def test_longest_match(self):
+    def test_longest_match(self, slug_map):
         """'utah-olympic-park' should match before 'park' (from Park City)."""
         venue = _extract_venue_from_slug(
-            "race-at-utah-olympic-park-results", self.slug_map
+            "race-at-utah-olympic-park-results", slug_map
         )
         assert venue == "Utah Olympic Park"
 
-    def test_empty_slug(self):
-        assert _extract_venue_from_slug("", self.slug_map) is None
+    def test_longest_match_overlapping_earlier_match(self):
+        """A longer fragment starting inside a shorter, earlier match still wins."""
+        fragments = {"a-b": "Short", "b-c-d": "Long"}
+        assert _extract_venue_from_slug("x-a-b-c-d", fragments) == "Long"
+        assert _extract_venue_from_slug("xa-b", fragments) is None
 
-    def test_none_slug(self):
-        assert _extract_venue_from_slug(None, self.slug_map) is None
+    def test_empty_slug(self, slug_map):
+        assert _extract_venue_from_slug("", slug_map) is None
+
+    def test_none_slug(self, slug_map):
+        assert _extract_venue_from_slug(None, slug_map) is None
 
 
 # --- Event Matching ---
 
 class TestMatchBlogToEvent:
-    def setup_method(self):
-        self.slug_map = _build_venue_slug_map()
-
     def _make_event(self, eid, venue, start, end, status="completed"):
         return {
             "id": eid,
@@ -121,7 +138,7 @@ class TestMatchBlogToEvent:
             "status": status,
         }
 
-    def test_venue_and_date_match(self):
+    def test_venue_and_date_match(self, slug_map):
         events = [
             self._make_event("imd-100", "Snowbird", "2026-02-08", "2026-02-09"),
         ]
@@ -131,11 +148,11 @@ class TestMatchBlogToEvent:
             "slug": "gs-at-snowbird",
             "pub_date": date(2026, 2, 10),
         }
-        eid, venue = _match_blog_to_event(item, events, self.slug_map)
+        eid, venue = _match_blog_to_event(item, events, slug_map)
         assert eid == "imd-100"
         assert venue == "Snowbird"
 
-    def test_wrong_venue(self):
+    def test_wrong_venue(self, slug_map):
         events = [
             self._make_event("imd-100", "Bogus Basin", "2026-02-08", "2026-02-09"),
         ]
@@ -145,10 +162,10 @@ class TestMatchBlogToEvent:
             "slug": "gs-at-snowbird",
             "pub_date": date(2026, 2, 10),
         }
-        eid, venue = _match_blog_to_event(item, events, self.slug_map)
+        eid, venue = _match_blog_to_event(item, events, slug_map)
         assert eid is None
 
-    def test_outside_lookback_window(self):
+    def test_outside_lookback_window(self, slug_map):
         events = [
             self._make_event("imd-100", "Snowbird", "2026-01-01", "2026-01-02"),
         ]
@@ -158,10 +175,10 @@ class TestMatchBlogToEvent:
             "slug": "gs-at-snowbird",
             "pub_date": date(2026, 2, 10),  # ~39 days after event
         }
-        eid, venue = _match_blog_to_event(item, events, self.slug_map)
+        eid, venue = _match_blog_to_event(item, events, slug_map)
         assert eid is None
 
-    def test_skip_upcoming(self):
+    def test_skip_upcoming(self, slug_map):
         events = [
             self._make_event("imd-100", "Snowbird", "2026-03-01", "2026-03-02", status="upcoming"),
         ]
@@ -171,10 +188,10 @@ class TestMatchBlogToEvent:
             "slug": "preview-at-snowbird",
             "pub_date": date(2026, 2, 10),
         }
-        eid, venue = _match_blog_to_event(item, events, self.slug_map)
+        eid, venue = _match_blog_to_event(item, events, slug_map)
         assert eid is None
 
-    def test_prefer_most_recent(self):
+    def test_prefer_most_recent(self, slug_map):
         events = [
             self._make_event("imd-100", "Snowbird", "2026-01-28", "2026-01-29"),
             self._make_event("imd-200", "Snowbird", "2026-02-05", "2026-02-06"),
@@ -185,10 +202,10 @@ class TestMatchBlogToEvent:
             "slug": "gs-at-snowbird",
             "pub_date": date(2026, 2, 10),
         }
-        eid, venue = _match_blog_to_event(item, events, self.slug_map)
+        eid, venue = _match_blog_to_event(item, events, slug_map)
         assert eid == "imd-200"
 
-    def test_no_pub_date(self):
+    def test_no_pub_date(self, slug_map):
         events = [
             self._make_event("imd-100", "Snowbird", "2026-02-08", "2026-02-09"),
         ]
@@ -198,9 +215,24 @@ class TestMatchBlogToEvent:
             "slug": "gs-at-snowbird",
             "pub_date": None,
         }
-        eid, venue = _match_blog_to_event(item, events, self.slug_map)
+        eid, venue = _match_blog_to_event(item, events, slug_map)
         assert eid is None
 
+    def test_prebuilt_venue_index(self, slug_map):
+        """A shared index gives the same matches, including the first of same-day ties."""
+        events = [
+            self._make_event("imd-100", "Snowbird", "2026-02-05", "2026-02-06"),
+            self._make_event("imd-200", "Snowbird Resort", "2026-02-05", "2026-02-06"),
+            self._make_event("imd-300", "Snowbird", "2026-02-20", "2026-02-21"),
+            self._make_event("imd-400", "Park City", "2026-02-08", "2026-02-09"),
+        ]
+        index = _index_events_by_venue(events)
+        item = {"slug": "gs-at-snowbird", "pub_date": date(2026, 2, 10)}
+        assert _match_blog_to_event(item, events, slug_map, venue_index=index) == (
+            "imd-100", "Snowbird"
+        )
+        assert _match_blog_to_event(item, events, slug_map) == ("imd-100", "Snowbird")
+
 
 # --- RSS Fetch ---
 
@@ -224,14 +256,26 @@ SAMPLE_RSS = """\
 """
 
 
-class TestFetchRSSItems:
-    def test_parse_rss(self):
-        mock_resp = MagicMock()
-        mock_resp.text = SAMPLE_RSS
-        mock_resp.raise_for_status = MagicMock()
+@pytest.fixture
+def rss_response(monkeypatch):
+    """Patch requests.get to return SAMPLE_RSS; tests may replace ``.raw``."""
+    mock_resp = MagicMock()
+    mock_resp.raw = io.BytesIO(SAMPLE_RSS.encode())
+    monkeypatch.setattr("ingestion.blog_linker.requests.get", lambda *a, **kw: mock_resp)
+    return mock_resp
+
+
+@pytest.fixture
+def blog_links_path(tmp_path, monkeypatch):
+    """Point BLOG_LINKS_PATH at a temp file."""
+    path = tmp_path / "blog_links.json"
+    monkeypatch.setattr("ingestion.blog_linker.BLOG_LINKS_PATH", path)
+    return path
 
-        with patch("ingestion.blog_linker.requests.get", return_value=mock_resp):
-            items = _fetch_rss_items("https://example.com/feed.xml")
+
+class TestFetchRSSItems:
+    def test_parse_rss(self, rss_response):
+        items = _fetch_rss_items("https://example.com/feed.xml")
 
         assert len(items) == 2
         assert items[0]["title"] == "GS at Snowbird"
@@ -246,22 +290,41 @@ class TestFetchRSSItems:
             items = _fetch_rss_items("https://example.com/feed.xml")
         assert items == []
 
-    def test_malformed_xml(self):
-        mock_resp = MagicMock()
-        mock_resp.text = "not xml at all"
-        mock_resp.raise_for_status = MagicMock()
+    def test_malformed_xml(self, rss_response):
+        rss_response.raw = io.BytesIO(b"not xml at all")
+        assert _fetch_rss_items("https://example.com/feed.xml") == []
 
-        with patch("ingestion.blog_linker.requests.get", return_value=mock_resp):
-            items = _fetch_rss_items("https://example.com/feed.xml")
-        assert items == []
+    def test_connection_lost_mid_feed(self, rss_response):
+        class DroppedStream(io.BytesIO):
+            def read(self, *args):
+                raise urllib3.exceptions.ProtocolError("Connection reset by peer")
+
+        rss_response.raw = DroppedStream()
+        assert _fetch_rss_items("https://example.com/feed.xml") == []
+
+    def test_parse_pub_date_formats(self):
+        assert _parse_pub_date("Mon, 10 Feb 2026 00:00:00 GMT") == date(2026, 2, 10)
+        assert _parse_pub_date("Tue, 10 Feb 2026 08:30:00 +0000") == date(2026, 2, 10)
+        assert _parse_pub_date("2026-02-10T08:30:00Z") == date(2026, 2, 10)
+        assert _parse_pub_date("soon") is None
+        assert _parse_pub_date(None) is None
 
 
 # --- End-to-end discover ---
 
+SNOWBIRD_EVENTS = [
+    {
+        "id": "imd-100",
+        "venue": "Snowbird",
+        "dates": {"start": "2026-02-08", "end": "2026-02-09"},
+        "status": "completed",
+    },
+]
+
+
 class TestDiscoverBlogLinks:
-    def test_preserves_manual_entries(self, tmp_path):
+    def test_preserves_manual_entries(self, rss_response, blog_links_path):
         """Manual entries in blog_links.json should not be overwritten."""
-        blog_links_path = tmp_path / "blog_links.json"
         manual_entry = {
             "imd-100": [
                 {"date": "2026-02-09", "title": "Manual Post", "url": "https://example.com/manual"}
@@ -269,22 +332,7 @@ class TestDiscoverBlogLinks:
         }
         blog_links_path.write_text(json.dumps(manual_entry))
 
-        events = [
-            {
-                "id": "imd-100",
-                "venue": "Snowbird",
-                "dates": {"start": "2026-02-08", "end": "2026-02-09"},
-                "status": "completed",
-            },
-        ]
-
-        mock_resp = MagicMock()
-        mock_resp.text = SAMPLE_RSS
-        mock_resp.raise_for_status = MagicMock()
-
-        with patch("ingestion.blog_linker.requests.get", return_value=mock_resp), \
-             patch("ingestion.blog_linker.BLOG_LINKS_PATH", blog_links_path):
-            result = discover_blog_links(events)
+        result = discover_blog_links(SNOWBIRD_EVENTS)
 
         # Manual entry preserved
         urls = [e["url"] for e in result["imd-100"]]
@@ -292,9 +340,8 @@ class TestDiscoverBlogLinks:
         # New entry added
         assert "https://www.example.com/post/gs-at-snowbird" in urls
 
-    def test_no_duplicate_urls(self, tmp_path):
+    def test_no_duplicate_urls(self, rss_response, blog_links_path):
         """Same URL should not be added twice."""
-        blog_links_path = tmp_path / "blog_links.json"
         existing = {
             "imd-100": [
                 {
@@ -306,22 +353,7 @@ class TestDiscoverBlogLinks:
         }
         blog_links_path.write_text(json.dumps(existing))
 
-        events = [
-            {
-                "id": "imd-100",
-                "venue": "Snowbird",
-                "dates": {"start": "2026-02-08", "end": "2026-02-09"},
-                "status": "completed",
-            },
-        ]
-
-        mock_resp = MagicMock()
-        mock_resp.text = SAMPLE_RSS
-        mock_resp.raise_for_status = MagicMock()
-
-        with patch("ingestion.blog_linker.requests.get", return_value=mock_resp), \
-             patch("ingestion.blog_linker.BLOG_LINKS_PATH", blog_links_path):
-            result = discover_blog_links(events)
+        result = discover_blog_links(SNOWBIRD_EVENTS)
 
         # Should still have only 1 entry — no duplicate
         snowbird_urls = [e["url"] for e in result["imd-100"]
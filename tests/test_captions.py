@@ -2,6 +2,7 @@
 
 import pytest
 from pathlib import Path
+from types import MappingProxyType
 
 from social.captions import (
     _format_disciplines,
@@ -17,10 +18,11 @@ from social.captions import (
 
 
 # -- Fixtures --
+# Event fixtures are shared across the module, so they are read-only.
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_event():
-    return {
+    return MappingProxyType({
         "id": "imd-test-001",
         "name": "Jr. IMC U14 Qualifier / David Wright - 1SL/2GS- Park City",
         "dates": {
@@ -37,12 +39,12 @@ def sample_event():
         "age_groups": ["U14", "U16"],
         "status": "upcoming",
         "pcss_relevant": True,
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def snowbird_event():
-    return {
+    return MappingProxyType({
         "id": "imd-test-snowbird",
         "name": "South Series GS - 2GS- Snowbird",
         "dates": {
@@ -59,12 +61,12 @@ def snowbird_event():
         "age_groups": ["U14", "U16"],
         "status": "upcoming",
         "pcss_relevant": True,
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def minimal_event():
-    return {
+    return MappingProxyType({
         "id": "imd-test-min",
         "name": "Test Race",
         "dates": {"start": "2026-03-01", "end": "2026-03-01", "display": "Mar 1, 2026"},
@@ -77,13 +79,13 @@ def minimal_event():
         "age_groups": [],
         "status": "upcoming",
         "pcss_relevant": False,
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def completed_snowbird_event():
     """A completed event at Snowbird with blog recaps."""
-    return {
+    return MappingProxyType({
         "id": "imd-old-snowbird",
         "name": "Old Race at Snowbird",
         "dates": {"start": "2026-01-10", "end": "2026-01-11", "display": "Jan 10-11, 2026"},
@@ -98,7 +100,12 @@ def completed_snowbird_event():
         "blog_recap_urls": [
             {"date": "2026-01-10", "title": "Snowbird Recap", "url": "https://example.com/recap"}
         ],
-    }
+    })
+
+
+@pytest.fixture(scope="module")
+def sample_captions(sample_event):
+    return generate_event_captions(sample_event)
 
 
 # -- _format_disciplines --
@@ -128,50 +135,40 @@ class TestFormatDisciplines:
 # -- _venue_hashtag --
 
 class TestVenueHashtag:
-    def test_single_word(self):
-        assert _venue_hashtag("Snowbird") == "#Snowbird"
-
-    def test_multi_word(self):
-        assert _venue_hashtag("Utah Olympic Park") == "#UtahOlympicPark"
-
-    def test_dot_venue(self):
-        assert _venue_hashtag("Mt. Bachelor") == "#MtBachelor"
-
-    def test_empty(self):
-        assert _venue_hashtag("") == ""
-
-    def test_tbd(self):
-        assert _venue_hashtag("TBD") == ""
-
-    def test_slash_venue(self):
-        assert _venue_hashtag("Snowbird/Utah Olympic Park") == "#SnowbirdUtahOlympicPark"
+    @pytest.mark.parametrize("venue,expected", [
+        ("Snowbird", "#Snowbird"),
+        ("Utah Olympic Park", "#UtahOlympicPark"),
+        ("Mt. Bachelor", "#MtBachelor"),
+        ("", ""),
+        ("TBD", ""),
+        ("Snowbird/Utah Olympic Park", "#SnowbirdUtahOlympicPark"),
+    ])
+    def test_venue_hashtag(self, venue, expected):
+        assert _venue_hashtag(venue) == expected
 
 
 # -- generate_event_captions --
 
 class TestEventCaptions:
-    def test_pre_race_includes_venue_and_date(self, sample_event):
-        captions = generate_event_captions(sample_event)
-        ig = captions["pre_race"]["instagram"]
-        assert "Park City" in ig
-        assert "Feb 28-Mar 2, 2026" in ig
-
-    def test_pre_race_includes_disciplines(self, sample_event):
-        captions = generate_event_captions(sample_event)
-        ig = captions["pre_race"]["instagram"]
-        assert "SL" in ig
-        assert "2x GS" in ig
-
-    def test_race_day_includes_race_day(self, sample_event):
-        captions = generate_event_captions(sample_event)
-        ig = captions["race_day"]["instagram"]
+    @pytest.mark.parametrize("section,platform,contains,not_contains", [
+        ("pre_race", "instagram", ["Park City", "Feb 28-Mar 2, 2026", "SL", "2x GS", "#"], []),
+        ("pre_race", "facebook", [], ["#"]),
+    ])
+    def test_caption_contents(self, sample_captions, section, platform, contains, not_contains):
+        caption = sample_captions[section][platform]
+        for text in contains:
+            assert text in caption
+        for text in not_contains:
+            assert text not in caption
+
+    def test_race_day_includes_race_day(self, sample_captions):
+        ig = sample_captions["race_day"]["instagram"]
         assert "race day" in ig.lower()
 
-    def test_blog_intro_is_short(self, sample_event):
-        captions = generate_event_captions(sample_event)
+    def test_blog_intro_is_short(self, sample_captions):
         # blog_intro should be 1-2 sentences, no hashtags
-        assert "#" not in captions["blog_intro"]
-        assert len(captions["blog_intro"]) < 300
+        assert "#" not in sample_captions["blog_intro"]
+        assert len(sample_captions["blog_intro"]) < 300
 
     def test_historical_context_when_recap_exists(self, snowbird_event, completed_snowbird_event):
         all_events = [snowbird_event, completed_snowbird_event]
@@ -192,25 +189,14 @@ class TestEventCaptions:
         assert captions["race_day"]["instagram"]
         assert captions["blog_intro"]
 
-    def test_all_sections_present(self, sample_event):
-        captions = generate_event_captions(sample_event)
-        assert "pre_race" in captions
-        assert "race_day" in captions
-        assert "blog_intro" in captions
+    def test_all_sections_present(self, sample_captions):
+        assert "pre_race" in sample_captions
+        assert "race_day" in sample_captions
+        assert "blog_intro" in sample_captions
         for section in ("pre_race", "race_day"):
-            assert "instagram" in captions[section]
-            assert "facebook" in captions[section]
-            assert "short" in captions[section]
-
-    def test_facebook_has_no_hashtags(self, sample_event):
-        captions = generate_event_captions(sample_event)
-        fb = captions["pre_race"]["facebook"]
-        assert "#" not in fb
-
-    def test_instagram_has_hashtags(self, sample_event):
-        captions = generate_event_captions(sample_event)
-        ig = captions["pre_race"]["instagram"]
-        assert "#" in ig
+            assert "instagram" in sample_captions[section]
+            assert "facebook" in sample_captions[section]
+            assert "short" in sample_captions[section]
 
 
 # -- generate_weekly_caption --
@@ -0,0 +1,193 @@
+"""Tests for social image generation helpers."""
+
+import shutil
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from social.generate import (
+    _ensure_dir,
+    _key_path,
+    _render_key,
+    bucketize_events,
+    filter_pcss_upcoming,
+    generate_event_images,
+    get_pre_race_events,
+    get_race_day_events,
+    get_weekend_events,
+    get_weekly_events,
+    partition_events,
+)
+from social.templates.pre_race import PreRaceTemplate
+
+
+def _make_event(event_id, start, end=None, pcss_relevant=True):
+    """Helper to build a minimal event dict."""
+    return {
+        "id": event_id,
+        "name": f"Test Event {event_id}",
+        "dates": {"start": start, "end": end or start, "display": start},
+        "venue": "Test Venue",
+        "pcss_relevant": pcss_relevant,
+    }
+
+
+EVENTS = [
+    _make_event("past", "2026-02-10", "2026-02-12"),
+    _make_event("early-week", "2026-02-23", "2026-02-24"),
+    _make_event("midweek", "2026-02-25", "2026-02-26"),
+    _make_event("weekend", "2026-02-28", "2026-03-01"),
+    _make_event("weekend-other", "2026-02-27", pcss_relevant=False),
+    _make_event("next-week", "2026-03-04", "2026-03-06"),
+    _make_event("future-other", "2026-03-10", pcss_relevant=False),
+]
+
+
+def _ids(events):
+    return [e["id"] for e in events]
+
+
+class TestPartitionEvents:
+    def _run(self, today, **kwargs):
+        with patch("social.generate.date") as mock_date:
+            mock_date.today.return_value = today
+            mock_date.side_effect = lambda *a, **kw: date(*a, **kw)
+            return (
+                partition_events(EVENTS, **kwargs),
+                filter_pcss_upcoming(EVENTS),
+                get_weekly_events(EVENTS),
+                get_weekend_events(EVENTS),
+            )
+
+    def test_matches_individual_filters(self):
+        """Single pass returns the same buckets as the three filters."""
+        for day in (23, 25, 28):
+            (upcoming, weekly, weekend), exp_up, exp_week, exp_weekend = self._run(date(2026, 2, day))
+            assert _ids(upcoming) == _ids(exp_up)
+            assert _ids(weekly) == _ids(exp_week)
+            assert _ids(weekend) == _ids(exp_weekend)
+
+    def test_weekly_keeps_events_earlier_this_week(self):
+        """Events that ended earlier in the week still count for the weekly preview."""
+        (upcoming, weekly, _), *_ = self._run(date(2026, 2, 26))
+        assert "early-week" in _ids(weekly)
+        assert "early-week" not in _ids(upcoming)
+
+    def test_include_all_adds_non_pcss_upcoming(self):
+        (upcoming, weekly, _), *_ = self._run(date(2026, 2, 25), include_all=True)
+        assert "future-other" in _ids(upcoming)
+        assert "weekend-other" not in _ids(weekly)
+
+    def test_ref_date_and_null_dates(self):
+        events = EVENTS + [{"id": "undated", "dates": None, "pcss_relevant": True}]
+        upcoming, weekly, weekend = partition_events(events, ref_date=date(2026, 2, 25))
+        assert _ids(upcoming) == ["midweek", "weekend", "next-week"]
+        assert _ids(weekly) == ["early-week", "midweek", "weekend"]
+        assert _ids(weekend) == ["weekend", "weekend-other"]
+
+
+class TestBucketizeEvents:
+    def test_matches_individual_getters(self):
+        """Single pass returns the same windows as the four getters."""
+        for day in range(21, 29):
+            today = date(2026, 2, day)
+            expected = {
+                "today": get_race_day_events(EVENTS, ref_date=today),
+                "in_2_days": get_pre_race_events(EVENTS, days_ahead=2, ref_date=today),
+                "this_week": get_weekly_events(EVENTS, ref_date=today),
+                "this_weekend": get_weekend_events(EVENTS, ref_date=today),
+            }
+            buckets = bucketize_events(EVENTS, ref_date=today)
+            assert {k: _ids(v) for k, v in buckets.items()} == {k: _ids(v) for k, v in expected.items()}
+
+    def test_null_dates_skipped(self):
+        events = [{"id": "undated", "dates": None, "pcss_relevant": True}, *EVENTS]
+        buckets = bucketize_events(events, ref_date=date(2026, 2, 25))
+        assert all("undated" not in _ids(v) for v in buckets.values())
+
+
+class TestIncrementalRender:
+    def test_render_key_is_order_independent(self):
+        a = {"id": "e1", "dates": {"start": "2026-02-01", "end": "2026-02-02"}}
+        b = {"dates": {"end": "2026-02-02", "start": "2026-02-01"}, "id": "e1"}
+        assert _render_key("pre_race", "post", a) == _render_key("pre_race", "post", b)
+        assert _render_key("pre_race", "post", a) != _render_key("race_day", "post", a)
+
+    def test_render_version_changes_key(self, monkeypatch):
+        event = {"id": "e1"}
+        key = _render_key("pre_race", "post", event)
+        monkeypatch.setattr("social.generate._RENDER_VERSION", 999)
+        assert _render_key("pre_race", "post", event) != key
+
+    def test_unchanged_event_skips_render(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("social.generate.OUTPUT_DIR", tmp_path)
+        event = _make_event("e1", "2026-02-25")
+        generate_event_images(event, ["pre_race"], ["post"])
+        png = next(tmp_path.glob("*/pre_race_post.png"))
+        assert _key_path(png).exists()
+
+        with patch("social.generate.PreRaceTemplate") as mock_cls:
+            mock_cls.return_value.save.side_effect = lambda path, **kw: Path(path).write_bytes(b"png")
+            generate_event_images(event, ["pre_race"], ["post"])
+            mock_cls.assert_not_called()
+
+            generate_event_images(dict(event, disciplines=["SL"]), ["pre_race"], ["post"])
+            mock_cls.assert_called_once_with("post")
+
+            generate_event_images(event, ["pre_race"], ["post"], force=True)
+            assert mock_cls.call_count == 2
+
+    def test_interrupted_save_is_not_fresh(self, tmp_path, monkeypatch):
+        """A forced re-render that dies mid-save must not leave the old key behind."""
+        monkeypatch.setattr("social.generate.OUTPUT_DIR", tmp_path)
+        event = _make_event("e1", "2026-02-25")
+        generate_event_images(event, ["pre_race"], ["post"])
+        png = next(tmp_path.glob("*/pre_race_post.png"))
+        original = png.read_bytes()
+
+        with patch("social.generate.PreRaceTemplate") as mock_cls:
+            mock_cls.return_value.save.side_effect = KeyboardInterrupt
+            with pytest.raises(KeyboardInterrupt):
+                generate_event_images(event, ["pre_race"], ["post"], force=True)
+        assert png.read_bytes() == original
+        assert not _key_path(png).exists()
+
+    def test_asset_change_invalidates_key(self, monkeypatch):
+        event = {"id": "e1"}
+        key = _render_key("pre_race", "post", event)
+        monkeypatch.setattr("social.generate._asset_stamp", lambda: "replaced-font")
+        assert _render_key("pre_race", "post", event) != key
+
+    def test_aliased_formats_render_once(self, tmp_path, monkeypatch):
+        """Reel reuses the story render instead of drawing it again."""
+        monkeypatch.setattr("social.generate.OUTPUT_DIR", tmp_path)
+        event = _make_event("e1", "2026-02-25")
+        with patch("social.generate.PreRaceTemplate", wraps=PreRaceTemplate) as spy:
+            outputs = generate_event_images(event, ["pre_race"], ["story", "reel"])
+        spy.assert_called_once_with("story")
+        story, reel = outputs[:2]
+        assert story.read_bytes() == reel.read_bytes()
+        assert _key_path(story).read_text() != _key_path(reel).read_text()
+
+
+class TestEnsureDir:
+    def test_creates_missing_and_skips_existing(self, tmp_path):
+        (tmp_path / "existing").mkdir()
+        with patch.object(Path, "mkdir", autospec=True, side_effect=Path.mkdir) as spy:
+            _ensure_dir(tmp_path / "existing")
+            _ensure_dir(tmp_path / "new")
+            _ensure_dir(tmp_path / "new")
+        assert (tmp_path / "new").is_dir()
+        assert [call.args[0] for call in spy.call_args_list] == [tmp_path / "new"]
+
+    def test_save_recreates_folder_removed_after_caching(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("social.generate.OUTPUT_DIR", tmp_path)
+        event = _make_event("e1", "2026-02-25")
+        generate_event_images(event, ["pre_race"], ["post"])
+        event_dir = next(tmp_path.iterdir())
+        shutil.rmtree(event_dir)
+
+        outputs = generate_event_images(event, ["pre_race"], ["post"])
+        assert outputs[0].is_file()
@@ -1,26 +1,21 @@
 """Tests for .ics calendar feed generation."""
 
 import json
-import tempfile
-from pathlib import Path
+import re
 
 import pytest
 
-from ingestion.ics_feed import generate_feed
+from ingestion.ics_feed import _escape_ics, build_feed, generate_feed
 
 
 def _make_database(events, generated_at="2026-01-15T10:30:00"):
-    """Create a temporary race database JSON file."""
-    data = {
+    """Create race database data as it would be loaded from JSON."""
+    return {
         "generated_at": generated_at,
         "source": "test",
         "event_count": len(events),
         "events": events,
     }
-    tmp = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
-    json.dump(data, tmp)
-    tmp.flush()
-    return Path(tmp.name)
 
 
 def _make_event(**overrides):
@@ -42,137 +37,135 @@ def _make_event(**overrides):
 
 
 def _generate_with_events(events, generated_at="2026-01-15T10:30:00"):
-    """Generate .ics content from a list of test events."""
-    db_path = _make_database(events, generated_at)
-    out_path = Path(tempfile.mkdtemp()) / "test.ics"
-    content = generate_feed(database_path=db_path, output_path=out_path)
-    db_path.unlink()
-    return content
+    """Generate .ics content from a list of test events, without touching disk."""
+    return build_feed(_make_database(events, generated_at))
+
+
+@pytest.fixture(scope="session")
+def default_ics():
+    """Feed for a single default event, generated once and shared."""
+    return _generate_with_events([_make_event()])
+
+
+# One variant per behaviour under test, keyed by event id. They share a single
+# generated feed; tests look up their own VEVENT block by UID.
+VARIANT_EVENTS = [
+    _make_event(id="imd-single-day",
+                dates={"start": "2026-03-01", "end": "2026-03-01", "display": ""}),
+    _make_event(id="imd-special", name="Race, with; special\\chars"),
+    _make_event(id="imd-no-state", venue="Snowbasin", state=""),
+    _make_event(id="imd-canceled", status="canceled"),
+    _make_event(id="imd-upcoming", status="upcoming"),
+    _make_event(id="imd-completed", status="completed"),
+    _make_event(id="imd-backslash", name="Race \\ test"),
+    _make_event(id="imd-semicolon", name="Race; test"),
+    _make_event(id="imd-comma", name="Race, test"),
+    _make_event(id="imd-newline", name="Race\ntest"),
+]
+
+
+@pytest.fixture(scope="session")
+def variants_ics():
+    """Feed holding every VARIANT_EVENTS entry, generated once and shared."""
+    return _generate_with_events(VARIANT_EVENTS)
+
+
+def _vevent(content, event_id):
+    """Return the VEVENT block for one event id from a generated feed."""
+    match = re.search(
+        rf"BEGIN:VEVENT\r\nUID:{re.escape(event_id)}@sim\.sports\r\n.*?END:VEVENT\r\n",
+        content,
+        re.DOTALL,
+    )
+    assert match, f"no VEVENT for {event_id}"
+    return match.group(0)
 
 
 class TestCalendarStructure:
-    def test_begins_with_vcalendar(self):
-        content = _generate_with_events([_make_event()])
-        assert content.startswith("BEGIN:VCALENDAR\r\n")
+    def test_begins_with_vcalendar(self, default_ics):
+        assert default_ics.startswith("BEGIN:VCALENDAR\r\n")
 
-    def test_ends_with_vcalendar(self):
-        content = _generate_with_events([_make_event()])
-        assert content.strip().endswith("END:VCALENDAR")
+    def test_ends_with_vcalendar(self, default_ics):
+        assert default_ics.strip().endswith("END:VCALENDAR")
 
-    def test_version_present(self):
-        content = _generate_with_events([_make_event()])
-        assert "VERSION:2.0\r\n" in content
-
-    def test_prodid_present(self):
-        content = _generate_with_events([_make_event()])
-        assert "PRODID:-//Sim.Sports//Race Calendar//EN\r\n" in content
-
-    def test_calname_present(self):
-        content = _generate_with_events([_make_event()])
-        assert "X-WR-CALNAME:IMD Youth Ski Race Calendar\r\n" in content
-
-    def test_method_publish(self):
-        content = _generate_with_events([_make_event()])
-        assert "METHOD:PUBLISH\r\n" in content
-
-    def test_refresh_interval(self):
-        content = _generate_with_events([_make_event()])
-        assert "REFRESH-INTERVAL;VALUE=DURATION:PT12H\r\n" in content
-        assert "X-PUBLISHED-TTL:PT12H\r\n" in content
+    @pytest.mark.parametrize("line", [
+        "VERSION:2.0",
+        "PRODID:-//Sim.Sports//Race Calendar//EN",
+        "X-WR-CALNAME:IMD Youth Ski Race Calendar",
+        "METHOD:PUBLISH",
+        "REFRESH-INTERVAL;VALUE=DURATION:PT12H",
+        "X-PUBLISHED-TTL:PT12H",
+    ])
+    def test_header_line_present(self, default_ics, line):
+        assert f"{line}\r\n" in default_ics
 
 
 class TestEventFormatting:
-    def test_uid_format(self):
-        content = _generate_with_events([_make_event(id="imd-1234")])
-        assert "UID:imd-1234@sim.sports\r\n" in content
+    def test_uid_format(self, default_ics):
+        assert "UID:imd-1234@sim.sports\r\n" in default_ics
 
-    def test_dtend_exclusive(self):
+    def test_dtend_exclusive(self, default_ics):
         """DTEND should be end date + 1 day (exclusive per RFC 5545)."""
-        content = _generate_with_events([
-            _make_event(dates={"start": "2026-02-14", "end": "2026-02-15", "display": ""})
-        ])
-        assert "DTSTART;VALUE=DATE:20260214\r\n" in content
-        assert "DTEND;VALUE=DATE:20260216\r\n" in content  # 15th + 1 = 16th
+        # Default event runs 2026-02-14 to 2026-02-15
+        assert "DTSTART;VALUE=DATE:20260214\r\n" in default_ics
+        assert "DTEND;VALUE=DATE:20260216\r\n" in default_ics  # 15th + 1 = 16th
 
-    def test_single_day_event(self):
+    def test_single_day_event(self, variants_ics):
         """Single-day event: DTEND = start + 1."""
-        content = _generate_with_events([
-            _make_event(dates={"start": "2026-03-01", "end": "2026-03-01", "display": ""})
-        ])
-        assert "DTSTART;VALUE=DATE:20260301\r\n" in content
-        assert "DTEND;VALUE=DATE:20260302\r\n" in content
+        vevent = _vevent(variants_ics, "imd-single-day")
+        assert "DTSTART;VALUE=DATE:20260301\r\n" in vevent
+        assert "DTEND;VALUE=DATE:20260302\r\n" in vevent
 
-    def test_summary_escaped(self):
-        content = _generate_with_events([_make_event(name="Race, with; special\\chars")])
-        assert "SUMMARY:Race\\, with\\; special\\\\chars\r\n" in content
+    def test_summary_escaped(self, variants_ics):
+        vevent = _vevent(variants_ics, "imd-special")
+        assert "SUMMARY:Race\\, with\\; special\\\\chars\r\n" in vevent
 
-    def test_location_with_state(self):
-        content = _generate_with_events([_make_event(venue="Snowbasin", state="UT")])
-        assert "LOCATION:Snowbasin\\, UT\r\n" in content
+    def test_location_with_state(self, default_ics):
+        assert "LOCATION:Snowbasin\\, UT\r\n" in default_ics
 
-    def test_location_without_state(self):
-        content = _generate_with_events([_make_event(venue="Snowbasin", state="")])
-        assert "LOCATION:Snowbasin\r\n" in content
+    def test_location_without_state(self, variants_ics):
+        vevent = _vevent(variants_ics, "imd-no-state")
+        assert "LOCATION:Snowbasin\r\n" in vevent
 
-    def test_description_includes_disciplines(self):
-        content = _generate_with_events([_make_event(disciplines=["SL", "GS"])])
-        assert "Disciplines: SL\\, GS" in content
+    def test_description_includes_disciplines(self, default_ics):
+        assert "Disciplines: SL\\, GS" in default_ics
 
-    def test_description_includes_circuit(self):
-        content = _generate_with_events([_make_event(circuit="IMD")])
-        assert "Circuit: IMD" in content
+    def test_description_includes_circuit(self, default_ics):
+        assert "Circuit: IMD" in default_ics
 
-    def test_source_url_as_url_property(self):
-        content = _generate_with_events([
-            _make_event(source_url="https://imdalpine.org/event/test/")
-        ])
-        assert "URL:https://imdalpine.org/event/test/\r\n" in content
+    def test_source_url_as_url_property(self, default_ics):
+        assert "URL:https://imdalpine.org/event/test/\r\n" in default_ics
 
 
 class TestCanceledEvents:
-    def test_canceled_status(self):
-        content = _generate_with_events([_make_event(status="canceled")])
-        assert "STATUS:CANCELLED\r\n" in content
+    def test_canceled_status(self, variants_ics):
+        assert "STATUS:CANCELLED\r\n" in _vevent(variants_ics, "imd-canceled")
 
-    def test_upcoming_no_status_line(self):
-        content = _generate_with_events([_make_event(status="upcoming")])
-        assert "STATUS:" not in content
-
-    def test_completed_no_status_line(self):
-        content = _generate_with_events([_make_event(status="completed")])
-        assert "STATUS:" not in content
+    @pytest.mark.parametrize("event_id", ["imd-upcoming", "imd-completed"])
+    def test_no_status_line(self, variants_ics, event_id):
+        assert "STATUS:" not in _vevent(variants_ics, event_id)
 
 
 class TestValarm:
-    def test_valarm_present(self):
-        content = _generate_with_events([_make_event()])
-        assert "BEGIN:VALARM\r\n" in content
-        assert "END:VALARM\r\n" in content
-
-    def test_trigger_one_day_before(self):
-        content = _generate_with_events([_make_event()])
-        assert "TRIGGER:-P1D\r\n" in content
-
-    def test_action_display(self):
-        content = _generate_with_events([_make_event()])
-        assert "ACTION:DISPLAY\r\n" in content
+    @pytest.mark.parametrize("line", [
+        "BEGIN:VALARM",
+        "TRIGGER:-P1D",
+        "ACTION:DISPLAY",
+        "END:VALARM",
+    ])
+    def test_valarm_line_present(self, default_ics, line):
+        assert f"{line}\r\n" in default_ics
 
 
 class TestDtstamp:
-    def test_uses_generated_at(self):
+    def test_uses_generated_at(self, default_ics):
         """DTSTAMP should use database generated_at, not current time."""
-        content = _generate_with_events(
-            [_make_event()],
-            generated_at="2026-01-15T10:30:00",
-        )
-        assert "DTSTAMP:20260115T103000Z\r\n" in content
+        assert "DTSTAMP:20260115T103000Z\r\n" in default_ics
 
-    def test_deterministic_output(self):
+    def test_deterministic_output(self, default_ics):
         """Same input should produce identical output."""
-        events = [_make_event()]
-        content1 = _generate_with_events(events, "2026-01-15T10:30:00")
-        content2 = _generate_with_events(events, "2026-01-15T10:30:00")
-        assert content1 == content2
+        content = _generate_with_events([_make_event()], "2026-01-15T10:30:00")
+        assert content == default_ics
 
 
 class TestMultipleEvents:
@@ -197,44 +190,43 @@ class TestMultipleEvents:
 
 
 class TestLineEndings:
-    def test_crlf_line_endings(self):
+    def test_crlf_line_endings(self, default_ics):
         """RFC 5545 requires CRLF line endings."""
-        content = _generate_with_events([_make_event()])
         # Split on \r\n — all lines should end with \r\n
-        lines = content.split("\r\n")
+        lines = default_ics.split("\r\n")
         assert len(lines) > 5  # sanity check
         # No bare \n should exist (after removing \r\n)
-        cleaned = content.replace("\r\n", "")
+        cleaned = default_ics.replace("\r\n", "")
         assert "\n" not in cleaned
 
 
 class TestTextEscaping:
-    def test_backslash_escaped(self):
-        content = _generate_with_events([_make_event(name="Race \\ test")])
-        assert "SUMMARY:Race \\\\ test" in content
-
-    def test_semicolon_escaped(self):
-        content = _generate_with_events([_make_event(name="Race; test")])
-        assert "SUMMARY:Race\\; test" in content
+    @pytest.mark.parametrize("event_id,summary", [
+        ("imd-backslash", "Race \\\\ test"),
+        ("imd-semicolon", "Race\\; test"),
+        ("imd-comma", "Race\\, test"),
+        ("imd-newline", "Race\\ntest"),
+    ])
+    def test_special_chars_escaped(self, variants_ics, event_id, summary):
+        assert f"SUMMARY:{summary}\r\n" in _vevent(variants_ics, event_id)
 
-    def test_comma_escaped(self):
-        content = _generate_with_events([_make_event(name="Race, test")])
-        assert "SUMMARY:Race\\, test" in content
+    def test_plain_text_unchanged(self):
+        text = "Jr. IMC U14 Qualifier / David Wright - 1SL/2GS: Park City (UT) é"
+        assert _escape_ics(text) == text
 
-    def test_newline_escaped(self):
-        content = _generate_with_events([_make_event(name="Race\ntest")])
-        assert "SUMMARY:Race\\ntest" in content
+    def test_each_special_char_escaped_once(self):
+        assert _escape_ics("\\;,\n") == "\\\\\\;\\,\\n"
 
 
 class TestFileOutput:
-    def test_writes_file(self):
-        db_path = _make_database([_make_event()])
-        out_path = Path(tempfile.mkdtemp()) / "output.ics"
-        generate_feed(database_path=db_path, output_path=out_path)
+    def test_writes_file(self, tmp_path, default_ics):
+        db_path = tmp_path / "race_database.json"
+        db_path.write_text(json.dumps(_make_database([_make_event()])))
+        out_path = tmp_path / "output.ics"
+        content = generate_feed(database_path=db_path, output_path=out_path)
         assert out_path.exists()
-        content = out_path.read_text()
-        assert content.startswith("BEGIN:VCALENDAR")
-        db_path.unlink()
+        assert content == default_ics
+        assert out_path.read_bytes().decode() == content
 
     def test_skips_events_without_dates(self):
         events = [
@@ -12,6 +12,7 @@ from ingestion.name_extractor import (
     parse_names_from_text,
     _normalize_name,
     _is_valid_name,
+    _HEADER_WORDS,
 )
 
 
@@ -119,60 +120,41 @@ class TestParseNamesFromText:
 # --- Name Normalization ---
 
 class TestNormalizeName:
-    def test_basic(self):
-        assert _normalize_name("Smith", "John") == "John Smith"
-
-    def test_title_case(self):
-        assert _normalize_name("JONES", "SARAH") == "Sarah Jones"
-
-    def test_hyphenated_last(self):
-        result = _normalize_name("Smith-Jones", "Mary")
-        assert result == "Mary Smith-Jones"
-
-    def test_apostrophe_last(self):
-        result = _normalize_name("O'Brien", "Pat")
-        assert result == "Pat O'Brien"
-
-    def test_hyphenated_first(self):
-        result = _normalize_name("Smith", "Mary-Kate")
-        assert result == "Mary-Kate Smith"
+    @pytest.mark.parametrize("last,first,expected", [
+        ("Smith", "John", "John Smith"),
+        ("JONES", "SARAH", "Sarah Jones"),  # title case
+        ("Smith-Jones", "Mary", "Mary Smith-Jones"),
+        ("O'Brien", "Pat", "Pat O'Brien"),
+        ("Smith", "Mary-Kate", "Mary-Kate Smith"),
+    ])
+    def test_normalize(self, last, first, expected):
+        assert _normalize_name(last, first) == expected
 
 
 # --- Name Validation ---
 
 class TestIsValidName:
-    def test_valid_name(self):
-        assert _is_valid_name("Smith", "John")
-
-    def test_valid_hyphenated(self):
-        assert _is_valid_name("O'Brien", "Mary")
-
-    def test_header_word_official(self):
-        assert not _is_valid_name("Official", "Results")
-
-    def test_header_word_results(self):
-        assert not _is_valid_name("Results", "Final")
-
-    def test_header_word_slalom(self):
-        assert not _is_valid_name("Slalom", "Giant")
-
-    def test_header_word_dnf(self):
-        assert not _is_valid_name("DNF", "Smith")
-
-    def test_too_short_last(self):
-        assert not _is_valid_name("S", "John")
-
-    def test_too_short_first(self):
-        assert not _is_valid_name("Smith", "J")
-
-    def test_digit_last(self):
-        assert not _is_valid_name("123", "John")
-
-    def test_digit_first(self):
-        assert not _is_valid_name("Smith", "123")
-
-    def test_header_word_rank(self):
-        assert not _is_valid_name("Rank", "Name")
-
-    def test_header_word_team(self):
-        assert not _is_valid_name("Team", "Club")
+    @pytest.mark.parametrize("last,first,expected", [
+        ("Smith", "John", True),
+        ("O'Brien", "Mary", True),
+        # Header words
+        ("Official", "Results", False),
+        ("Results", "Final", False),
+        ("Slalom", "Giant", False),
+        ("DNF", "Smith", False),
+        ("Rank", "Name", False),
+        ("Team", "Club", False),
+        # Too short
+        ("S", "John", False),
+        ("Smith", "J", False),
+        # Digits
+        ("123", "John", False),
+        ("Smith", "123", False),
+    ])
+    def test_is_valid_name(self, last, first, expected):
+        assert _is_valid_name(last, first) is expected
+
+    def test_header_words_is_frozenset(self):
+        """Header words are checked by hash lookup, stored uppercase."""
+        assert isinstance(_HEADER_WORDS, frozenset)
+        assert all(word == word.upper() for word in _HEADER_WORDS)
@@ -9,6 +9,7 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
+from ingestion.config import PCSS_PATTERN, PCSS_PATTERNS
 from ingestion.pcss_detector import (
     _parse_venue,
     _parse_dates,
@@ -88,114 +89,74 @@ class TestVenuesMatch:
 # --- Date Overlap ---
 
 class TestDatesOverlap:
-    def test_overlapping(self):
-        assert _dates_overlap(
-            date(2025, 12, 20), date(2025, 12, 23),
-            date(2025, 12, 21), date(2025, 12, 24),
-        )
-
-    def test_exact_same(self):
-        assert _dates_overlap(
-            date(2025, 12, 20), date(2025, 12, 23),
-            date(2025, 12, 20), date(2025, 12, 23),
-        )
-
-    def test_no_overlap(self):
-        assert not _dates_overlap(
-            date(2025, 12, 20), date(2025, 12, 23),
-            date(2026, 1, 10), date(2026, 1, 12),
-        )
-
-    def test_tolerance_one_day(self):
+    @pytest.mark.parametrize("rs,re_,es,ee,expected", [
+        # overlapping
+        (date(2025, 12, 20), date(2025, 12, 23), date(2025, 12, 21), date(2025, 12, 24), True),
+        # exact same
+        (date(2025, 12, 20), date(2025, 12, 23), date(2025, 12, 20), date(2025, 12, 23), True),
+        # no overlap
+        (date(2025, 12, 20), date(2025, 12, 23), date(2026, 1, 10), date(2026, 1, 12), False),
         # Results end Dec 23, event starts Dec 24 — should match with tolerance=1
-        assert _dates_overlap(
-            date(2025, 12, 20), date(2025, 12, 23),
-            date(2025, 12, 24), date(2025, 12, 25),
-        )
-
-    def test_beyond_tolerance(self):
+        (date(2025, 12, 20), date(2025, 12, 23), date(2025, 12, 24), date(2025, 12, 25), True),
         # 3 days apart — should NOT match with default tolerance=1
-        assert not _dates_overlap(
-            date(2025, 12, 20), date(2025, 12, 21),
-            date(2025, 12, 25), date(2025, 12, 26),
-        )
+        (date(2025, 12, 20), date(2025, 12, 21), date(2025, 12, 25), date(2025, 12, 26), False),
+    ])
+    def test_overlap(self, rs, re_, es, ee, expected):
+        assert _dates_overlap(rs, re_, es, ee) is expected
 
 
 # --- Event Matching ---
 
 class TestMatchToEvent:
-    def _make_event(self, eid, venue, start, end):
-        return {
-            "id": eid,
-            "venue": venue,
-            "dates": {"start": start, "end": end},
-        }
-
-    def test_match_found(self):
+    @pytest.mark.parametrize("events_spec,group_venue,expected", [
+        # match found
+        ([("imd-100", "Snow King", "2025-12-20", "2025-12-23"),
+          ("imd-200", "Snowbird", "2026-01-10", "2026-01-12")], "Snow King", "imd-100"),
+        # no match
+        ([("imd-100", "Snowbird", "2025-12-20", "2025-12-23")], "Bogus Basin", None),
+        # venue matches, dates don't
+        ([("imd-100", "Snowbird", "2026-03-01", "2026-03-03")], "Snowbird", None),
+        # venue already normalized by _parse_venue
+        ([("imd-100", "Snow King", "2025-12-20", "2025-12-23")], "Snow King", "imd-100"),
+    ])
+    def test_match(self, events_spec, group_venue, expected):
         events = [
-            self._make_event("imd-100", "Snow King", "2025-12-20", "2025-12-23"),
-            self._make_event("imd-200", "Snowbird", "2026-01-10", "2026-01-12"),
+            {"id": eid, "venue": venue, "dates": {"start": start, "end": end}}
+            for eid, venue, start, end in events_spec
         ]
         group = {
-            "venue": "Snow King",
+            "venue": group_venue,
             "date_start": date(2025, 12, 20),
             "date_end": date(2025, 12, 23),
         }
-        assert _match_to_event(group, events) == "imd-100"
+        assert _match_to_event(group, events) == expected
 
-    def test_no_match(self):
-        events = [
-            self._make_event("imd-100", "Snowbird", "2025-12-20", "2025-12-23"),
-        ]
-        group = {
-            "venue": "Bogus Basin",
-            "date_start": date(2025, 12, 20),
-            "date_end": date(2025, 12, 23),
-        }
-        assert _match_to_event(group, events) is None
 
-    def test_venue_match_date_mismatch(self):
-        events = [
-            self._make_event("imd-100", "Snowbird", "2026-03-01", "2026-03-03"),
-        ]
-        group = {
-            "venue": "Snowbird",
-            "date_start": date(2025, 12, 20),
-            "date_end": date(2025, 12, 23),
-        }
-        assert _match_to_event(group, events) is None
-
-    def test_normalized_venue_match(self):
-        events = [
-            self._make_event("imd-100", "Snow King", "2025-12-20", "2025-12-23"),
-        ]
-        group = {
-            "venue": "Snow King",  # Already normalized by _parse_venue
-            "date_start": date(2025, 12, 20),
-            "date_end": date(2025, 12, 23),
-        }
-        assert _match_to_event(group, events) == "imd-100"
+# --- PCSS Pattern Matching ---
 
+PCSS_CASES = (
+    ("John Smith  PCSS  1:23.45", True),
+    ("Jane Doe  Park City  1:24.00", True),
+    ("John Smith  Bogus Basin Ski Club  1:23.45", False),
+)
 
-# --- PCSS Pattern Matching ---
 
 class TestPCSSPatterns:
     """Test that PCSS patterns correctly match in text."""
 
-    def test_pcss_abbreviation(self):
-        from ingestion.config import PCSS_PATTERNS
-        text = "John Smith  PCSS  1:23.45"
-        assert any(p.search(text) for p in PCSS_PATTERNS)
-
-    def test_park_city(self):
-        from ingestion.config import PCSS_PATTERNS
-        text = "Jane Doe  Park City  1:24.00"
-        assert any(p.search(text) for p in PCSS_PATTERNS)
-
-    def test_no_match(self):
-        from ingestion.config import PCSS_PATTERNS
-        text = "John Smith  Bogus Basin Ski Club  1:23.45"
-        assert not any(p.search(text) for p in PCSS_PATTERNS)
+    @pytest.mark.parametrize("text,expected", PCSS_CASES)
+    def test_pattern(self, text, expected):
+        assert (PCSS_PATTERN.search(text) is not None) is expected
+
+    @pytest.mark.parametrize("text", [
+        *(text for text, _ in PCSS_CASES),
+        "Jane Doe  Park City Ski  1:24.00",
+        "Impcss and Park Cityside",
+        "",
+    ])
+    def test_combined_pattern_agrees(self, text):
+        expected = any(p.search(text) for p in PCSS_PATTERNS)
+        assert (PCSS_PATTERN.search(text) is not None) == expected
 
 
 # --- Cache ---
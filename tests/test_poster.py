@@ -1,45 +1,69 @@
 """Tests for social media poster module."""
 
 import json
+from dataclasses import dataclass
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
+from PIL import Image
 
-from social.poster import MetaPoster, _check_response, detect_content_type
+from social.poster import (
+    _MAX_IMAGE_BYTES,
+    ImagePreflightError,
+    MetaPoster,
+    _check_response,
+    _preflight_image,
+    detect_content_type,
+    list_folders,
+    main,
+)
 
 
-# -- detect_content_type --
+def _write_png(path, size):
+    """Write a small real PNG so upload preflight checks pass."""
+    Image.new("RGB", size).save(path, "PNG")
 
-class TestDetectContentType:
-    def test_weekend_preview(self, tmp_path):
-        (tmp_path / "weekend_preview_post.png").touch()
-        (tmp_path / "captions.txt").touch()
-        assert detect_content_type(tmp_path) == "weekend_preview"
 
-    def test_weekly_preview(self, tmp_path):
-        (tmp_path / "weekly_preview_post.png").touch()
-        assert detect_content_type(tmp_path) == "weekly_preview"
+@dataclass(frozen=True)
+class FakeResponse:
+    """Just the parts of requests.Response that the poster reads.
+
+    A payload of None stands for a body that is not JSON.
+    """
+    payload: object = None
+    status_code: int = 200
+    body: str | None = None
 
-    def test_monthly_calendar(self, tmp_path):
-        (tmp_path / "monthly_calendar_post.png").touch()
-        assert detect_content_type(tmp_path) == "monthly_calendar"
+    def json(self):
+        if self.payload is None:
+            raise ValueError("No JSON")
+        return self.payload
 
-    def test_race_day(self, tmp_path):
-        (tmp_path / "race_day_post.png").touch()
-        assert detect_content_type(tmp_path) == "race_day"
+    @property
+    def text(self):
+        return self.body if self.body is not None else json.dumps(self.payload)
 
-    def test_pre_race(self, tmp_path):
-        (tmp_path / "pre_race_post.png").touch()
-        assert detect_content_type(tmp_path) == "pre_race"
+    def raise_for_status(self):
+        pass
 
-    def test_mixed_prefers_weekend(self, tmp_path):
-        (tmp_path / "weekend_preview_post.png").touch()
-        (tmp_path / "pre_race_post.png").touch()
-        assert detect_content_type(tmp_path) == "weekend_preview"
 
-    def test_empty_folder(self, tmp_path):
-        assert detect_content_type(tmp_path) == "pre_race"
+# -- detect_content_type --
+
+class TestDetectContentType:
+    @pytest.mark.parametrize("files,expected", [
+        (["weekend_preview_post.png", "captions.txt"], "weekend_preview"),
+        (["weekly_preview_post.png"], "weekly_preview"),
+        (["monthly_calendar_post.png"], "monthly_calendar"),
+        (["race_day_post.png"], "race_day"),
+        (["pre_race_post.png"], "pre_race"),
+        (["weekend_preview_post.png", "pre_race_post.png"], "weekend_preview"),  # mixed
+        ([], "pre_race"),  # empty folder
+    ])
+    def test_detects_from_files(self, tmp_path, files, expected):
+        for name in files:
+            (tmp_path / name).touch()
+        assert detect_content_type(tmp_path) == expected
 
     def test_nonexistent_folder(self, tmp_path):
         assert detect_content_type(tmp_path / "nope") == "pre_race"
@@ -48,67 +72,67 @@ class TestDetectContentType:
 # -- _check_response --
 
 class TestCheckResponse:
-    def _make_response(self, status_code, json_data):
-        resp = MagicMock()
-        resp.status_code = status_code
-        resp.json.return_value = json_data
-        resp.text = json.dumps(json_data)
-        resp.raise_for_status = MagicMock()
-        return resp
-
     def test_success(self):
-        resp = self._make_response(200, {"id": "123"})
+        resp = FakeResponse(status_code=200, payload={"id": "123"})
         data = _check_response(resp, "test")
         assert data["id"] == "123"
 
     def test_rate_limit_code_4(self):
-        resp = self._make_response(400, {
+        resp = FakeResponse(status_code=400, payload={
             "error": {"code": 4, "message": "Too many calls"}
         })
         with pytest.raises(RuntimeError, match="rate limited"):
             _check_response(resp, "test")
 
     def test_rate_limit_code_32(self):
-        resp = self._make_response(400, {
+        resp = FakeResponse(status_code=400, payload={
             "error": {"code": 32, "message": "Limit reached"}
         })
         with pytest.raises(RuntimeError, match="rate limited"):
             _check_response(resp, "test")
 
     def test_rate_limit_code_613(self):
-        resp = self._make_response(400, {
+        resp = FakeResponse(status_code=400, payload={
             "error": {"code": 613, "message": "Calls limit"}
         })
         with pytest.raises(RuntimeError, match="rate limited"):
             _check_response(resp, "test")
 
     def test_expired_token(self):
-        resp = self._make_response(400, {
+        resp = FakeResponse(status_code=400, payload={
             "error": {"code": 190, "message": "Invalid token"}
         })
         with pytest.raises(RuntimeError, match="expired or invalid"):
             _check_response(resp, "test")
 
     def test_generic_error(self):
-        resp = self._make_response(400, {
+        resp = FakeResponse(status_code=400, payload={
             "error": {"code": 100, "message": "Something broke"}
         })
         with pytest.raises(RuntimeError, match="Something broke"):
             _check_response(resp, "test")
 
     def test_non_json_response(self):
-        resp = MagicMock()
-        resp.status_code = 500
-        resp.json.side_effect = ValueError("No JSON")
-        resp.text = "Internal Server Error"
+        resp = FakeResponse(status_code=500, body="Internal Server Error")
         with pytest.raises(RuntimeError, match="non-JSON response"):
             _check_response(resp, "test")
 
 
 # -- MetaPoster.post_folder (dry run) --
 
+@pytest.fixture(scope="module")
+def dry_run_poster():
+    """Poster shared by dry-run tests, which never touch its session or rate limiter.
+
+    Tests that mock ``social.poster.requests`` build their own poster, since the
+    session is created from the (patched) module at construction time.
+    """
+    with MetaPoster("token", "page_id", "ig_user_id") as poster:
+        yield poster
+
+
 class TestPostFolder:
-    def test_dry_run_selects_correct_files(self, tmp_path):
+    def test_dry_run_selects_correct_files(self, dry_run_poster, tmp_path):
         """Dry run should identify the right image files without making API calls."""
         # Create test files
         (tmp_path / "pre_race_post.png").write_bytes(b"fake png")
@@ -118,8 +142,7 @@ class TestPostFolder:
             "=== PRE_RACE — FACEBOOK ===\nFB caption\n"
         )
 
-        poster = MetaPoster("token", "page_id", "ig_user_id")
-        results = poster.post_folder(
+        results = dry_run_poster.post_folder(
             tmp_path, "pre_race", ["facebook", "instagram"], dry_run=True,
         )
 
@@ -130,15 +153,14 @@ class TestPostFolder:
         assert "would post" in results["instagram"]
         assert "pre_race_post.png" in results["instagram"]
 
-    def test_dry_run_missing_image(self, tmp_path):
+    def test_dry_run_missing_image(self, dry_run_poster, tmp_path):
         """Dry run with missing image file should report 'skipped'."""
-        poster = MetaPoster("token", "page_id", "ig_user_id")
-        results = poster.post_folder(
+        results = dry_run_poster.post_folder(
             tmp_path, "pre_race", ["facebook"], dry_run=True,
         )
         assert "skipped" in results["facebook"]
 
-    def test_dry_run_with_bare_captions(self, tmp_path):
+    def test_dry_run_with_bare_captions(self, dry_run_poster, tmp_path):
         """Dry run should work with weekend-style bare caption keys."""
         (tmp_path / "weekend_preview_post.png").write_bytes(b"fake png")
         (tmp_path / "weekend_preview_facebook.png").write_bytes(b"fake png")
@@ -147,8 +169,7 @@ class TestPostFolder:
             "=== FACEBOOK ===\nWeekend FB caption\n"
         )
 
-        poster = MetaPoster("token", "page_id", "ig_user_id")
-        results = poster.post_folder(
+        results = dry_run_poster.post_folder(
             tmp_path, "weekend_preview", ["facebook", "instagram"], dry_run=True,
         )
 
@@ -163,85 +184,80 @@ class TestPostFolder:
 class TestPostSequence:
     @patch("social.poster.requests")
     def test_facebook_then_instagram(self, mock_requests, tmp_path):
-        """Verify the Facebook→CDN→Instagram call chain."""
-        (tmp_path / "pre_race_post.png").write_bytes(b"fake png")
-        (tmp_path / "pre_race_facebook.png").write_bytes(b"fake png")
+        """Verify the Facebook and unpublished-upload→CDN→Instagram call chains."""
+        _write_png(tmp_path / "pre_race_post.png", (1080, 1080))
+        _write_png(tmp_path / "pre_race_facebook.png", (1200, 630))
         (tmp_path / "captions.txt").write_text(
             "=== PRE_RACE — INSTAGRAM ===\nIG caption\n\n"
             "=== PRE_RACE — FACEBOOK ===\nFB caption\n"
         )
 
         # Mock responses
-        fb_post_resp = MagicMock()
-        fb_post_resp.json.return_value = {"id": "fb_photo_123", "post_id": "post_456"}
-        fb_post_resp.status_code = 200
-
-        cdn_resp = MagicMock()
-        cdn_resp.json.return_value = {
+        fb_post_resp = FakeResponse({"id": "fb_photo_123", "post_id": "post_456"})
+        cdn_resp = FakeResponse({
             "images": [{"source": "https://cdn.fbsbx.com/photo.jpg"}]
-        }
-        cdn_resp.status_code = 200
-
-        container_resp = MagicMock()
-        container_resp.json.return_value = {"id": "container_789"}
-        container_resp.status_code = 200
-
-        status_resp = MagicMock()
-        status_resp.json.return_value = {"status_code": "FINISHED"}
-        status_resp.status_code = 200
-
-        publish_resp = MagicMock()
-        publish_resp.json.return_value = {"id": "ig_media_101"}
-        publish_resp.status_code = 200
-
-        # Sequence: FB post → CDN get → IG create → IG status → IG publish
-        mock_requests.post.side_effect = [fb_post_resp, container_resp, publish_resp]
-        mock_requests.get.side_effect = [cdn_resp, status_resp]
+        })
+        container_resp = FakeResponse({"id": "container_789"})
+        status_resp = FakeResponse({"status_code": "FINISHED"})
+        publish_resp = FakeResponse({"id": "ig_media_101"})
+        unpublished_resp = FakeResponse({"id": "unpub_photo_123"})
+
+        # FB and IG run concurrently, so route by URL instead of call order
+        def route_post(url, data=None, **kwargs):
+            if url.endswith("/page_id/photos"):
+                return unpublished_resp if data.fields.get("published") == "false" else fb_post_resp
+            if url.endswith("/media_publish"):
+                return publish_resp
+            if url.endswith("/ig_user_id/media"):
+                return container_resp
+            raise AssertionError(f"unexpected POST {url}")
+
+        def route_get(url, params=None, **kwargs):
+            return cdn_resp if params["fields"] == "images" else status_resp
+
+        session = mock_requests.Session.return_value
+        session.post.side_effect = route_post
+        session.get.side_effect = route_get
 
         poster = MetaPoster("token", "page_id", "ig_user_id")
         results = poster.post_folder(
             tmp_path, "pre_race", ["facebook", "instagram"],
         )
 
-        assert "posted" in results["facebook"]
-        assert "posted" in results["instagram"]
+        assert results["facebook"] == "posted (id=fb_photo_123)"
+        assert results["instagram"] == "posted (id=ig_media_101)"
 
-        # Verify call counts
-        assert mock_requests.post.call_count == 3  # FB post + IG create + IG publish
-        assert mock_requests.get.call_count == 2    # CDN URL + container status
+        # FB post + IG unpublished upload + IG create + IG publish
+        assert session.post.call_count == 4
+        assert session.get.call_count == 2    # CDN URL + container status
+
+        # Photo uploads are streamed multipart bodies
+        upload_call = session.post.call_args_list[0]
+        assert upload_call.kwargs["headers"]["Content-Type"].startswith("multipart/form-data")
+
+        # Instagram uploads its own (post-format) image rather than reusing Facebook's
+        cdn_calls = [c for c in session.get.call_args_list if c.kwargs["params"]["fields"] == "images"]
+        assert cdn_calls[0].args[0].endswith("/unpub_photo_123")
 
     @patch("social.poster.requests")
     def test_instagram_only_uses_unpublished(self, mock_requests, tmp_path):
         """Instagram-only should use unpublished Facebook upload for CDN URL."""
-        (tmp_path / "pre_race_post.png").write_bytes(b"fake png")
+        _write_png(tmp_path / "pre_race_post.png", (1080, 1080))
         (tmp_path / "captions.txt").write_text(
             "=== PRE_RACE — INSTAGRAM ===\nIG caption\n"
         )
 
-        unpublished_resp = MagicMock()
-        unpublished_resp.json.return_value = {"id": "unpub_photo_123"}
-        unpublished_resp.status_code = 200
-
-        cdn_resp = MagicMock()
-        cdn_resp.json.return_value = {
+        unpublished_resp = FakeResponse({"id": "unpub_photo_123"})
+        cdn_resp = FakeResponse({
             "images": [{"source": "https://cdn.fbsbx.com/unpub.jpg"}]
-        }
-        cdn_resp.status_code = 200
-
-        container_resp = MagicMock()
-        container_resp.json.return_value = {"id": "container_789"}
-        container_resp.status_code = 200
-
-        status_resp = MagicMock()
-        status_resp.json.return_value = {"status_code": "FINISHED"}
-        status_resp.status_code = 200
-
-        publish_resp = MagicMock()
-        publish_resp.json.return_value = {"id": "ig_media_101"}
-        publish_resp.status_code = 200
+        })
+        container_resp = FakeResponse({"id": "container_789"})
+        status_resp = FakeResponse({"status_code": "FINISHED"})
+        publish_resp = FakeResponse({"id": "ig_media_101"})
 
-        mock_requests.post.side_effect = [unpublished_resp, container_resp, publish_resp]
-        mock_requests.get.side_effect = [cdn_resp, status_resp]
+        session = mock_requests.Session.return_value
+        session.post.side_effect = [unpublished_resp, container_resp, publish_resp]
+        session.get.side_effect = [cdn_resp, status_resp]
 
         poster = MetaPoster("token", "page_id", "ig_user_id")
         results = poster.post_folder(tmp_path, "pre_race", ["instagram"])
@@ -249,5 +265,254 @@ class TestPostSequence:
         assert "posted" in results["instagram"]
 
         # The first post call should be the unpublished upload (published=false)
-        first_post_call = mock_requests.post.call_args_list[0]
+        first_post_call = session.post.call_args_list[0]
         assert "published" in str(first_post_call) or "photos" in str(first_post_call[0])
+
+    @patch("social.poster.requests")
+    def test_batched_post_single_upload_request(self, mock_requests, tmp_path):
+        """Batched posting sends FB post, IG upload, CDN lookup and IG container in one call."""
+        _write_png(tmp_path / "pre_race_post.png", (1080, 1080))
+        _write_png(tmp_path / "pre_race_facebook.png", (1200, 630))
+        (tmp_path / "captions.txt").write_text(
+            "=== PRE_RACE — INSTAGRAM ===\nIG caption\n\n"
+            "=== PRE_RACE — FACEBOOK ===\nFB caption\n"
+        )
+
+        batch_resp = FakeResponse([
+            {"code": 200, "body": json.dumps({"id": "fb_photo_123", "post_id": "post_456"})},
+            {"code": 200, "body": json.dumps({"id": "unpub_photo_123"})},
+            {"code": 200, "body": json.dumps({"images": [{"source": "https://cdn.fbsbx.com/photo.jpg"}]})},
+            {"code": 200, "body": json.dumps({"id": "container_789"})},
+        ])
+        status_resp = FakeResponse({"status_code": "FINISHED"})
+        publish_resp = FakeResponse({"id": "ig_media_101"})
+
+        session = mock_requests.Session.return_value
+        session.post.side_effect = [batch_resp, publish_resp]
+        session.get.side_effect = [status_resp]
+
+        poster = MetaPoster("token", "page_id", "ig_user_id")
+        results = poster.post_folder_batched(
+            tmp_path, "pre_race", ["facebook", "instagram"],
+        )
+
+        assert results["facebook"] == "posted (id=fb_photo_123)"
+        assert results["instagram"] == "posted (id=ig_media_101)"
+        assert session.post.call_count == 2  # batch + IG publish
+
+        batch_call = session.post.call_args_list[0]
+        ops = json.loads(batch_call.kwargs["data"]["batch"])
+        assert [op["name"] for op in ops] == ["fb", "ig_upload", "cdn", "ig_container"]
+        # Instagram uses its own post-format upload, not the Facebook photo
+        assert ops[2]["relative_url"].startswith("{result=ig_upload:$.id}")
+        assert "{result=cdn:$.images.0.source}" in ops[3]["body"]
+        files = batch_call.kwargs["files"]
+        assert files["fb_image"][0] == "pre_race_facebook.png"
+        assert files["ig_image"][0] == "pre_race_post.png"
+
+    @patch("social.poster.requests")
+    def test_batched_post_sub_request_error(self, mock_requests, tmp_path):
+        """An error inside a batch entry surfaces with the usual message."""
+        _write_png(tmp_path / "pre_race_facebook.png", (1200, 630))
+
+        batch_resp = FakeResponse([
+            {"code": 400, "body": json.dumps({"error": {"code": 190, "message": "Invalid token"}})},
+        ])
+        session = mock_requests.Session.return_value
+        session.post.return_value = batch_resp
+
+        poster = MetaPoster("token", "page_id", "ig_user_id")
+        results = poster.post_folder_batched(tmp_path, "pre_race", ["facebook"])
+        assert results["facebook"].startswith("failed: Batch fb: access token expired or invalid")
+
+    @patch("social.poster.requests")
+    def test_batched_ig_failure_keeps_facebook_post(self, mock_requests, tmp_path):
+        """A failed Instagram upload must not lose the already-live Facebook post."""
+        _write_png(tmp_path / "pre_race_post.png", (1080, 1080))
+        _write_png(tmp_path / "pre_race_facebook.png", (1200, 630))
+
+        batch_resp = FakeResponse([
+            {"code": 200, "body": json.dumps({"id": "fb_photo_123", "post_id": "post_456"})},
+            {"code": 400, "body": json.dumps({"error": {"code": 100, "message": "Invalid upload"}})},
+            None,
+            None,
+        ])
+        session = mock_requests.Session.return_value
+        session.post.return_value = batch_resp
+
+        poster = MetaPoster("token", "page_id", "ig_user_id")
+        results = poster.post_folder_batched(tmp_path, "pre_race", ["facebook", "instagram"])
+
+        assert results["facebook"] == "posted (id=fb_photo_123)"
+        assert results["instagram"] == "failed: Batch ig_upload: API error (code 100): Invalid upload"
+        assert session.post.call_count == 1  # no container wait or publish
+        session.get.assert_not_called()
+
+
+# -- Instagram container polling --
+
+class TestWaitForContainer:
+    def _status(self, code):
+        return FakeResponse({"status_code": code})
+
+    @patch("social.poster.time.sleep")
+    @patch("social.poster.requests")
+    def test_backoff_grows_and_caps(self, mock_requests, mock_sleep):
+        session = mock_requests.Session.return_value
+        session.get.side_effect = [self._status("IN_PROGRESS")] * 6 + [self._status("FINISHED")]
+        poster = MetaPoster("token", "page_id", "ig_user_id")
+        poster._wait_for_container("c1")
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert len(delays) == 6
+        assert MetaPoster.INITIAL_POLL <= delays[0] <= MetaPoster.INITIAL_POLL * 1.2
+        assert delays[1] > delays[0]
+        assert max(delays) <= MetaPoster.MAX_POLL * 1.2
+
+    @patch("social.poster.time.sleep")
+    @patch("social.poster.requests")
+    def test_error_status_raises(self, mock_requests, mock_sleep):
+        session = mock_requests.Session.return_value
+        session.get.return_value = self._status("ERROR")
+        poster = MetaPoster("token", "page_id", "ig_user_id")
+        with pytest.raises(RuntimeError, match="failed"):
+            poster._wait_for_container("c1")
+        mock_sleep.assert_not_called()
+
+    @patch("social.poster.time.monotonic")
+    @patch("social.poster.time.sleep")
+    @patch("social.poster.requests")
+    def test_deadline_raises(self, mock_requests, mock_sleep, mock_monotonic):
+        session = mock_requests.Session.return_value
+        session.get.return_value = self._status("IN_PROGRESS")
+        clock = iter(range(0, 1000, 20))
+        mock_monotonic.side_effect = lambda: next(clock)
+        poster = MetaPoster("token", "page_id", "ig_user_id")
+        with pytest.raises(RuntimeError, match="did not finish"):
+            poster._wait_for_container("c1")
+
+
+# -- HTTP session --
+
+class TestSession:
+    def test_retries_only_idempotent_requests(self):
+        with MetaPoster("token", "page_id", "ig_user_id") as poster:
+            retry = poster.session.get_adapter("https://graph.facebook.com").max_retries
+            assert retry.is_retry("GET", 503)
+            assert not retry.is_retry("POST", 503)
+
+
+# -- list_folders --
+
+class TestListFolders:
+    def test_lists_only_directories_sorted(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("social.poster.OUTPUT_DIR", tmp_path)
+        (tmp_path / "b folder").mkdir()
+        (tmp_path / "a folder").mkdir()
+        (tmp_path / "notes.txt").touch()
+        assert [p.name for p in list_folders()] == ["a folder", "b folder"]
+
+    def test_missing_output_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("social.poster.OUTPUT_DIR", tmp_path / "missing")
+        assert list_folders() == []
+
+
+# -- main --
+
+class TestMain:
+    def test_failed_folder_does_not_hide_others(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setattr("social.poster.OUTPUT_DIR", tmp_path)
+        (tmp_path / "good").mkdir()
+        (tmp_path / "bad").mkdir()
+        monkeypatch.setattr("sys.argv", ["poster", "good", "bad", "--facebook-only", "--no-cache"])
+        monkeypatch.setenv("META_PAGE_ACCESS_TOKEN", "token")
+        monkeypatch.setenv("META_PAGE_ID", "page_id")
+
+        def post_folder(self, folder, content_type, platforms, dry_run=False):
+            if folder.name == "bad":
+                raise RuntimeError("token expired")
+            return {"facebook": "posted (id=fb_1)"}
+
+        monkeypatch.setattr(MetaPoster, "post_folder", post_folder)
+        with pytest.raises(SystemExit) as exc:
+            main()
+        assert exc.value.code == 1
+        out = capsys.readouterr().out
+        assert "facebook: posted (id=fb_1)" in out
+        assert "error: token expired" in out
+
+
+# -- Upload preflight --
+
+class TestPreflight:
+    def test_valid_png_passes(self, tmp_path):
+        path = tmp_path / "pre_race_post.png"
+        _write_png(path, (1080, 1080))
+        _preflight_image(path, "instagram")
+        _preflight_image(path, "facebook")
+
+    def test_corrupt_image_rejected(self, tmp_path):
+        path = tmp_path / "pre_race_post.png"
+        path.write_bytes(b"fake png")
+        with pytest.raises(ImagePreflightError, match="not a readable image"):
+            _preflight_image(path, "facebook")
+
+    def test_instagram_aspect_ratio(self, tmp_path):
+        path = tmp_path / "pre_race_story.png"
+        _write_png(path, (1080, 1920))
+        _preflight_image(path, "facebook")
+        with pytest.raises(ImagePreflightError, match="aspect ratio"):
+            _preflight_image(path, "instagram")
+
+    def test_oversize_rejected(self, tmp_path, monkeypatch):
+        path = tmp_path / "pre_race_post.png"
+        _write_png(path, (1080, 1080))
+        monkeypatch.setitem(_MAX_IMAGE_BYTES, "instagram", 10)
+        with pytest.raises(ImagePreflightError, match="MB"):
+            _preflight_image(path, "instagram")
+
+    @patch("social.poster.requests")
+    def test_post_folder_reports_skip_without_upload(self, mock_requests, tmp_path):
+        (tmp_path / "pre_race_facebook.png").write_bytes(b"fake png")
+        poster = MetaPoster("token", "page_id", "ig_user_id")
+        results = poster.post_folder(tmp_path, "pre_race", ["facebook"])
+        assert results["facebook"].startswith("skipped:")
+        mock_requests.Session.return_value.post.assert_not_called()
+
+
+class TestPostFolderGraph:
+    def test_failed_upload_skips_downstream_nodes(self, tmp_path):
+        _write_png(tmp_path / "pre_race_facebook.png", (1080, 1080))
+        _write_png(tmp_path / "pre_race_post.png", (1080, 1080))
+        poster = MetaPoster("token", "page_id", "ig_user_id")
+        with patch.object(poster, "post_to_facebook", return_value={"id": "fb_1"}), \
+             patch.object(poster, "_upload_unpublished", side_effect=ImagePreflightError("bad")), \
+             patch.object(poster, "get_photo_cdn_url") as cdn, \
+             patch.object(poster, "post_to_instagram") as publish:
+            results = poster.post_folder(tmp_path, "pre_race", ["facebook", "instagram"])
+        assert results["facebook"] == "posted (id=fb_1)"
+        assert results["instagram"] == "skipped: bad"
+        cdn.assert_not_called()
+        publish.assert_not_called()
+
+    def test_failed_sink_keeps_other_platform_result(self, tmp_path):
+        _write_png(tmp_path / "pre_race_facebook.png", (1200, 630))
+        _write_png(tmp_path / "pre_race_post.png", (1080, 1080))
+        poster = MetaPoster("token", "page_id", "ig_user_id")
+        with patch.object(poster, "post_to_facebook", side_effect=RuntimeError("fb down")), \
+             patch.object(poster, "_upload_unpublished", return_value="photo_1"), \
+             patch.object(poster, "get_photo_cdn_url", return_value="https://cdn/x.png"), \
+             patch.object(poster, "post_to_instagram", return_value={"id": "IG1"}):
+            results = poster.post_folder(tmp_path, "pre_race", ["facebook", "instagram"])
+        assert results == {"facebook": "failed: fb down", "instagram": "posted (id=IG1)"}
+
+    def test_publish_waits_for_cdn_url(self, tmp_path):
+        _write_png(tmp_path / "pre_race_post.png", (1080, 1080))
+        poster = MetaPoster("token", "page_id", "ig_user_id")
+        with patch.object(poster, "_upload_unpublished", return_value="photo_1"), \
+             patch.object(poster, "get_photo_cdn_url", return_value="https://cdn/x.png") as cdn, \
+             patch.object(poster, "post_to_instagram", return_value={"id": "ig_1"}) as publish:
+            results = poster.post_folder(tmp_path, "pre_race", ["instagram"])
+        cdn.assert_called_once_with("photo_1")
+        publish.assert_called_once_with("https://cdn/x.png", "")
+        assert results["instagram"] == "posted (id=ig_1)"
@@ -0,0 +1,115 @@
+"""Tests for the Meta Graph API response cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from social.poster import MetaPoster
+from social.poster_cache import CacheMissError, PosterCache
+
+
+class TestPosterCache:
+    def test_roundtrip(self, tmp_path):
+        cache = PosterCache(tmp_path / "cache.sqlite")
+        cache.set("cdn", "photo_1", "https://cdn/1.jpg")
+        assert cache.get("cdn", "photo_1", ttl=60) == "https://cdn/1.jpg"
+        assert cache.get("upload", "photo_1", ttl=60) is None
+
+    def test_expired_entry_ignored(self, tmp_path):
+        cache = PosterCache(tmp_path / "cache.sqlite")
+        with patch("social.poster_cache.time.time", return_value=1000.0):
+            cache.set("cdn", "photo_1", "https://cdn/1.jpg")
+        with patch("social.poster_cache.time.time", return_value=1000.0 + 61):
+            assert cache.get("cdn", "photo_1", ttl=60) is None
+
+    def test_replay_mode_does_not_write(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        PosterCache(path).set("cdn", "a", "old")
+        replay = PosterCache(path, mode="replay")
+        replay.set("cdn", "a", "new")
+        assert replay.get("cdn", "a", ttl=60) == "old"
+
+    def test_write_only_mode_does_not_read(self, tmp_path):
+        cache = PosterCache(tmp_path / "cache.sqlite", mode="write-only")
+        cache.set("cdn", "a", "value")
+        assert cache.get("cdn", "a", ttl=60) is None
+
+    def test_off_mode_creates_no_file(self, tmp_path):
+        cache = PosterCache(tmp_path / "cache.sqlite", mode="off")
+        cache.set("cdn", "a", "value")
+        assert cache.get("cdn", "a", ttl=60) is None
+        assert not (tmp_path / "cache.sqlite").exists()
+
+    def test_unknown_mode(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown cache mode"):
+            PosterCache(tmp_path / "cache.sqlite", mode="sometimes")
+
+
+class TestPosterUsesCache:
+    @patch("social.poster.requests")
+    def test_identical_image_uploaded_once(self, mock_requests, tmp_path):
+        image = tmp_path / "pre_race_post.png"
+        Image.new("RGB", (1080, 1080)).save(image, "PNG")
+
+        upload_resp = MagicMock()
+        upload_resp.json.return_value = {"id": "unpub_1"}
+        cdn_resp = MagicMock()
+        cdn_resp.json.return_value = {"images": [{"source": "https://cdn/unpub_1.jpg"}]}
+        session = mock_requests.Session.return_value
+        session.post.return_value = upload_resp
+        session.get.return_value = cdn_resp
+
+        cache = PosterCache(tmp_path / "cache.sqlite")
+        poster = MetaPoster("token", "page_id", "ig_user_id", cache=cache)
+        for _ in range(2):
+            assert poster._upload_unpublished(image) == "unpub_1"
+            assert poster.get_photo_cdn_url("unpub_1") == "https://cdn/unpub_1.jpg"
+
+        assert session.post.call_count == 1
+        assert session.get.call_count == 1
+
+    @patch("social.poster.requests")
+    def test_replay_miss_makes_no_api_call(self, mock_requests, tmp_path):
+        image = tmp_path / "pre_race_post.png"
+        Image.new("RGB", (1080, 1080)).save(image, "PNG")
+        cache = PosterCache(tmp_path / "cache.sqlite", mode="replay")
+        poster = MetaPoster("token", "page_id", "ig_user_id", cache=cache)
+
+        with pytest.raises(CacheMissError, match="upload"):
+            poster._upload_unpublished(image)
+        with pytest.raises(CacheMissError, match="cdn photo_1"):
+            poster.get_photo_cdn_url("photo_1")
+        session = mock_requests.Session.return_value
+        session.post.assert_not_called()
+        session.get.assert_not_called()
+
+    def _stale_poster(self, tmp_path, mock_requests, allow_stale=True):
+        cache = PosterCache(tmp_path / "cache.sqlite")
+        with patch("social.poster_cache.time.time", return_value=1000.0):
+            cache.set("cdn", "photo_1", "https://cdn/old.jpg")
+        error_resp = MagicMock()
+        error_resp.json.return_value = {"error": {"code": 2, "message": "Service unavailable"}}
+        mock_requests.Session.return_value.get.return_value = error_resp
+        return MetaPoster("token", "page_id", "ig_user_id", cache=cache, allow_stale=allow_stale)
+
+    @patch("social.poster.requests")
+    def test_failed_cdn_lookup_serves_stale_url(self, mock_requests, tmp_path):
+        poster = self._stale_poster(tmp_path, mock_requests)
+        with patch("social.poster_cache.time.time", return_value=1000.0 + 2 * 3600):
+            with pytest.warns(UserWarning, match="stale URL"):
+                assert poster.get_photo_cdn_url("photo_1") == "https://cdn/old.jpg"
+
+    @patch("social.poster.requests")
+    def test_stale_url_too_old_reraises(self, mock_requests, tmp_path):
+        poster = self._stale_poster(tmp_path, mock_requests)
+        with patch("social.poster_cache.time.time", return_value=1000.0 + 7 * 3600):
+            with pytest.raises(RuntimeError, match="Service unavailable"):
+                poster.get_photo_cdn_url("photo_1")
+
+    @patch("social.poster.requests")
+    def test_no_stale_reraises(self, mock_requests, tmp_path):
+        poster = self._stale_poster(tmp_path, mock_requests, allow_stale=False)
+        with patch("social.poster_cache.time.time", return_value=1000.0 + 2 * 3600):
+            with pytest.raises(RuntimeError, match="Service unavailable"):
+                poster.get_photo_cdn_url("photo_1")
@@ -0,0 +1,46 @@
+"""Tests for Graph API call pacing."""
+
+from unittest.mock import patch
+
+import pytest
+
+from social.rate_limit import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestTokenBucket:
+    def test_burst_then_paced(self):
+        clock = FakeClock()
+        with patch("social.rate_limit.time", clock):
+            bucket = TokenBucket(rate_per_min=60, burst=3)
+            for _ in range(3):
+                bucket.acquire()
+            assert clock.now == 0.0
+            bucket.acquire()
+            assert clock.now == pytest.approx(1.0)
+
+    def test_refill_capped_at_burst(self):
+        clock = FakeClock()
+        with patch("social.rate_limit.time", clock):
+            bucket = TokenBucket(rate_per_min=60, burst=2)
+            clock.now = 100.0
+            bucket.acquire()
+            bucket.acquire()
+            bucket.acquire()
+            assert clock.now == pytest.approx(101.0)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate_per_min=0, burst=1)
+        with pytest.raises(ValueError):
+            TokenBucket(rate_per_min=10, burst=0)
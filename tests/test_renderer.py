@@ -0,0 +1,146 @@
+"""Tests for Pillow drawing primitives and font loading."""
+
+from unittest.mock import patch
+
+from PIL import Image, ImageDraw
+
+from social.font_loader import load_font
+from social.renderer import (
+    _venue_composite,
+    clear_venue_cache,
+    composite_logo,
+    composite_venue_photo,
+    create_canvas,
+    draw_wrapped_text,
+    measure_logo,
+    paste_wrapped_text,
+    render_text_block,
+    text_bbox,
+    wrap_lines,
+    wrap_text,
+)
+
+
+class TestFontCaching:
+    def test_load_font_reuses_instance(self):
+        assert load_font("Bold", 24) is load_font("Bold", 24)
+        assert load_font("Bold", 24) is not load_font("Bold", 25)
+
+    def test_text_bbox_matches_getbbox(self):
+        font = load_font("Regular", 20)
+        assert text_bbox(font, "Park City") == font.getbbox("Park City")
+
+
+class TestWrapText:
+    def test_short_text_single_line(self):
+        font = load_font("Regular", 20)
+        assert wrap_text("Park City", font, 1000) == ["Park City"]
+
+    def test_lines_fit_width(self):
+        font = load_font("Regular", 20)
+        text = "Western Region Open FIS Slalom and Giant Slalom at Palisades Tahoe"
+        lines = wrap_text(text, font, 200)
+        assert len(lines) > 1
+        assert " ".join(lines) == text
+        for line in lines:
+            assert font.getlength(line) <= 200 or " " not in line
+
+    def test_overlong_word_kept_whole(self):
+        font = load_font("Regular", 20)
+        assert wrap_text("Supercalifragilistic", font, 10) == ["Supercalifragilistic"]
+
+    def test_empty_text(self):
+        assert wrap_text("", load_font("Regular", 20), 100) == []
+
+    def test_wrap_lines_cached(self):
+        font = load_font("Regular", 20)
+        text = "Western Region Open FIS Slalom and Giant Slalom at Palisades Tahoe"
+        lines = wrap_lines(text, font, 200)
+        assert lines == tuple(wrap_text(text, font, 200))
+        with patch("social.renderer.wrap_text") as mock_wrap:
+            assert wrap_lines(text, font, 200) is lines
+            mock_wrap.assert_not_called()
+
+
+class TestTextBlock:
+    TEXT = "Jr. IMC U14 Qualifier / David Wright - 1SL/2GS- Park City"
+
+    def test_paste_matches_direct_draw(self):
+        font = load_font("Bold", 38)
+        direct = create_canvas(1080, 400)
+        h = draw_wrapped_text(ImageDraw.Draw(direct), self.TEXT, 70, 50, font, 940)
+        pasted = create_canvas(1080, 400)
+        assert paste_wrapped_text(pasted, self.TEXT, 70, 50, font, 940) == h
+        assert pasted.tobytes() == direct.tobytes()
+
+    def test_block_rendered_once(self):
+        font = load_font("Bold", 38)
+        paste_wrapped_text(create_canvas(1080, 400), self.TEXT, 70, 50, font, 940)
+        with patch("social.renderer.draw_wrapped_text") as mock_draw:
+            paste_wrapped_text(create_canvas(1080, 400), self.TEXT, 0, 0, font, 940)
+            mock_draw.assert_not_called()
+
+    def test_empty_text(self):
+        assert render_text_block("", load_font("Bold", 38), 940) == (None, 0, 0, 0)
+
+
+class TestVenueCache:
+    def test_second_render_uses_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("social.renderer.VENUE_CACHE_DIR", tmp_path)
+        first = Image.new("RGB", (300, 400))
+        composite_venue_photo(first, 0, 0, 300, 400, "Snowbird")
+        assert len(list(tmp_path.glob("*.png"))) == 1
+        _venue_composite.cache_clear()  # force the on-disk path
+
+        second = Image.new("RGB", (300, 400))
+        with patch("social.renderer._vertical_ramp") as mock_composite:
+            composite_venue_photo(second, 0, 0, 300, 400, "Snowbird")
+            mock_composite.assert_not_called()
+        assert first.tobytes() == second.tobytes()
+
+    def test_size_is_part_of_key(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("social.renderer.VENUE_CACHE_DIR", tmp_path)
+        canvas = Image.new("RGB", (300, 400))
+        composite_venue_photo(canvas, 0, 0, 300, 400, "Snowbird")
+        composite_venue_photo(canvas, 0, 0, 300, 200, "Snowbird")
+        assert len(list(tmp_path.glob("*.png"))) == 2
+
+    def test_repeat_render_skips_disk(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("social.renderer.VENUE_CACHE_DIR", tmp_path)
+        first = Image.new("RGB", (300, 400))
+        composite_venue_photo(first, 0, 0, 300, 400, "Snowbird")
+
+        second = Image.new("RGB", (300, 400))
+        with patch("social.renderer.Image.open") as mock_open:
+            composite_venue_photo(second, 0, 0, 300, 400, "Snowbird")
+            mock_open.assert_not_called()
+        assert first.tobytes() == second.tobytes()
+
+    def test_venue_photo_resolved_once(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("social.renderer.VENUE_CACHE_DIR", tmp_path)
+        composite_venue_photo(Image.new("RGB", (300, 400)), 0, 0, 300, 400, "Snowbird")
+        with patch("social.renderer._resolve_venue_photo") as mock_resolve:
+            composite_venue_photo(Image.new("RGB", (300, 200)), 0, 0, 300, 200, "Snowbird")
+            mock_resolve.assert_not_called()
+
+    def test_clear_venue_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("social.renderer.VENUE_CACHE_DIR", tmp_path / "venues")
+        composite_venue_photo(Image.new("RGB", (100, 100)), 0, 0, 100, 100, "Nowhere")
+        clear_venue_cache()
+        assert not (tmp_path / "venues").exists()
+
+
+class TestCompositeLogo:
+    def test_scaled_logo_cached_per_box(self):
+        canvas = Image.new("RGB", (600, 200))
+        size = composite_logo(canvas, 0, 0, 300, 60)
+        assert size[0] <= 300 and size[1] <= 60
+        with patch("social.renderer.Image.open") as mock_open:
+            assert composite_logo(canvas, 10, 10, 300, 60) == size
+            mock_open.assert_not_called()
+
+    def test_measure_logo_matches_composite_without_drawing(self):
+        canvas = Image.new("RGB", (600, 200))
+        size = measure_logo(300, 60)
+        assert canvas.getbbox() is None
+        assert composite_logo(canvas, 0, 0, 300, 60) == size
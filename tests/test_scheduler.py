@@ -1,9 +1,22 @@
 """Tests for social posting scheduler."""
 
+import json
 from datetime import date
 from unittest.mock import patch
 
-from social.scheduler import get_todays_tasks, is_posted, load_posting_log, save_posting_log
+import pytest
+
+from social.scheduler import (
+    Task,
+    append_post,
+    build_poster,
+    execute_tasks,
+    get_todays_tasks,
+    is_posted,
+    load_posting_log,
+    posted_keys,
+    save_posting_log,
+)
 
 
 def _make_event(event_id, start, end=None, pcss_relevant=True):
@@ -27,16 +40,13 @@ class TestGetTodaysTasks:
         monday = date(2026, 2, 23)  # A Monday
         events = [_make_event("e1", "2026-02-25", "2026-02-27")]
 
-        with patch("social.generate.date") as mock_date:
-            mock_date.today.return_value = monday
-            mock_date.side_effect = lambda *a, **kw: date(*a, **kw)
-            tasks = get_todays_tasks(events, {"posts": []}, ref_date=monday)
+        tasks = get_todays_tasks(events, {"posts": []}, ref_date=monday)
 
-        types = [t["type"] for t in tasks]
+        types = [t.type for t in tasks]
         assert "weekly_preview" in types
         # Key should reference the Monday date
-        weekly = [t for t in tasks if t["type"] == "weekly_preview"][0]
-        assert weekly["key"] == "weekly_preview:2026-02-23"
+        weekly = [t for t in tasks if t.type == "weekly_preview"][0]
+        assert weekly.key == "weekly_preview:2026-02-23"
 
     def test_thursday_posts_weekend(self):
         """Thursday with weekend events returns weekend_preview task."""
@@ -44,16 +54,13 @@ class TestGetTodaysTasks:
         # Event on Saturday Feb 28
         events = [_make_event("e1", "2026-02-28")]
 
-        with patch("social.generate.date") as mock_date:
-            mock_date.today.return_value = thursday
-            mock_date.side_effect = lambda *a, **kw: date(*a, **kw)
-            tasks = get_todays_tasks(events, {"posts": []}, ref_date=thursday)
+        tasks = get_todays_tasks(events, {"posts": []}, ref_date=thursday)
 
-        types = [t["type"] for t in tasks]
+        types = [t.type for t in tasks]
         assert "weekend_preview" in types
-        weekend = [t for t in tasks if t["type"] == "weekend_preview"][0]
+        weekend = [t for t in tasks if t.type == "weekend_preview"][0]
         # Friday is Feb 27
-        assert weekend["key"] == "weekend_preview:2026-02-27"
+        assert weekend.key == "weekend_preview:2026-02-27"
 
     def test_pre_race_two_days_before(self):
         """Event starting in 2 days returns pre_race task."""
@@ -62,10 +69,10 @@ class TestGetTodaysTasks:
 
         tasks = get_todays_tasks(events, {"posts": []}, ref_date=today)
 
-        types = [t["type"] for t in tasks]
+        types = [t.type for t in tasks]
         assert "pre_race" in types
-        pre = [t for t in tasks if t["type"] == "pre_race"][0]
-        assert pre["key"] == "pre_race:e1"
+        pre = [t for t in tasks if t.type == "pre_race"][0]
+        assert pre.key == "pre_race:e1"
 
     def test_race_day_on_start(self):
         """Event starting today returns race_day task."""
@@ -74,10 +81,10 @@ class TestGetTodaysTasks:
 
         tasks = get_todays_tasks(events, {"posts": []}, ref_date=today)
 
-        types = [t["type"] for t in tasks]
+        types = [t.type for t in tasks]
         assert "race_day" in types
-        rd = [t for t in tasks if t["type"] == "race_day"][0]
-        assert rd["key"] == "race_day:e1"
+        rd = [t for t in tasks if t.type == "race_day"][0]
+        assert rd.key == "race_day:e1"
 
     def test_no_events_no_tasks(self):
         """No matching events returns empty list."""
@@ -96,7 +103,7 @@ class TestGetTodaysTasks:
         log = {"posts": [{"key": "race_day:e1", "content_type": "race_day"}]}
         tasks = get_todays_tasks(events, log, ref_date=today)
 
-        keys = [t["key"] for t in tasks]
+        keys = [t.key for t in tasks]
         assert "race_day:e1" not in keys
 
     def test_multiple_tasks_same_day(self):
@@ -109,12 +116,9 @@ class TestGetTodaysTasks:
             _make_event("e2", "2026-02-27", "2026-02-28"),
         ]
 
-        with patch("social.generate.date") as mock_date:
-            mock_date.today.return_value = thursday
-            mock_date.side_effect = lambda *a, **kw: date(*a, **kw)
-            tasks = get_todays_tasks(events, {"posts": []}, ref_date=thursday)
+        tasks = get_todays_tasks(events, {"posts": []}, ref_date=thursday)
 
-        types = [t["type"] for t in tasks]
+        types = [t.type for t in tasks]
         assert "weekend_preview" in types
         assert "race_day" in types
 
@@ -123,12 +127,9 @@ class TestGetTodaysTasks:
         tuesday = date(2026, 2, 24)  # A Tuesday
         events = [_make_event("e1", "2026-02-28", "2026-03-01")]
 
-        with patch("social.generate.date") as mock_date:
-            mock_date.today.return_value = tuesday
-            mock_date.side_effect = lambda *a, **kw: date(*a, **kw)
-            tasks = get_todays_tasks(events, {"posts": []}, ref_date=tuesday)
+        tasks = get_todays_tasks(events, {"posts": []}, ref_date=tuesday)
 
-        types = [t["type"] for t in tasks]
+        types = [t.type for t in tasks]
         assert "weekly_preview" not in types
         assert "weekend_preview" not in types
 
@@ -136,7 +137,7 @@ class TestGetTodaysTasks:
 class TestPostingLog:
     def test_load_save_roundtrip(self, tmp_path, monkeypatch):
         """Posting log can be saved and loaded."""
-        log_path = tmp_path / "posting_log.json"
+        log_path = tmp_path / "posting_log.jsonl"
         monkeypatch.setattr("social.scheduler.POSTING_LOG_PATH", log_path)
 
         log = {"posts": [{"key": "test:1", "content_type": "test"}]}
@@ -145,9 +146,58 @@ class TestPostingLog:
         loaded = load_posting_log()
         assert loaded["posts"][0]["key"] == "test:1"
 
+    def test_failed_save_keeps_previous_log(self, tmp_path, monkeypatch):
+        """A write that fails midway leaves the existing log untouched."""
+        log_path = tmp_path / "posting_log.jsonl"
+        monkeypatch.setattr("social.scheduler.POSTING_LOG_PATH", log_path)
+        save_posting_log({"posts": [{"key": "test:1"}]})
+
+        with patch("social.scheduler.json.dumps", side_effect=TypeError("not serializable")):
+            with pytest.raises(TypeError):
+                save_posting_log({"posts": [{"key": "test:2"}]})
+
+        assert load_posting_log() == {"posts": [{"key": "test:1"}]}
+
+    def test_append_post(self, tmp_path, monkeypatch):
+        """Appending writes one line per entry without rewriting the log."""
+        log_path = tmp_path / "posting_log.jsonl"
+        monkeypatch.setattr("social.scheduler.POSTING_LOG_PATH", log_path)
+
+        append_post({"key": "test:1"})
+        append_post({"key": "test:2"})
+
+        assert log_path.read_text().splitlines() == ['{"key": "test:1"}', '{"key": "test:2"}']
+        assert [p["key"] for p in load_posting_log()["posts"]] == ["test:1", "test:2"]
+
+    def test_migrates_legacy_json_log(self, tmp_path, monkeypatch):
+        """An old {"posts": [...]} file is converted to JSONL on first load."""
+        log_path = tmp_path / "posting_log.jsonl"
+        legacy_path = tmp_path / "posting_log.json"
+        legacy_path.write_text(json.dumps({"posts": [{"key": "test:1"}, {"key": "test:2"}]}, indent=2))
+        monkeypatch.setattr("social.scheduler.POSTING_LOG_PATH", log_path)
+
+        assert load_posting_log() == {"posts": [{"key": "test:1"}, {"key": "test:2"}]}
+        assert not legacy_path.exists()
+        assert len(log_path.read_text().splitlines()) == 2
+
+    def test_unchanged_log_parsed_once(self, tmp_path, monkeypatch):
+        """Repeat loads of an unchanged file reuse the parse; appends invalidate it."""
+        log_path = tmp_path / "posting_log.jsonl"
+        monkeypatch.setattr("social.scheduler.POSTING_LOG_PATH", log_path)
+        append_post({"key": "test:1"})
+
+        first = load_posting_log()
+        first["posts"].append({"key": "not saved"})
+        with patch("social.scheduler.json.loads") as mock_loads:
+            assert load_posting_log() == {"posts": [{"key": "test:1"}]}
+            mock_loads.assert_not_called()
+
+        append_post({"key": "test:2"})
+        assert len(load_posting_log()["posts"]) == 2
+
     def test_load_missing_file(self, tmp_path, monkeypatch):
         """Loading a missing log returns empty structure."""
-        log_path = tmp_path / "does_not_exist.json"
+        log_path = tmp_path / "does_not_exist.jsonl"
         monkeypatch.setattr("social.scheduler.POSTING_LOG_PATH", log_path)
 
         log = load_posting_log()
@@ -157,3 +207,77 @@ class TestPostingLog:
         log = {"posts": [{"key": "weekly_preview:2026-02-23"}]}
         assert is_posted(log, "weekly_preview:2026-02-23") is True
         assert is_posted(log, "weekly_preview:2026-03-02") is False
+
+    def test_posted_keys(self):
+        log = {"posts": [{"key": "pre_race:a"}, {"key": "race_day:a"}, {"key": "pre_race:a"}]}
+        assert posted_keys(log) == {"pre_race:a", "race_day:a"}
+        assert posted_keys({}) == set()
+
+
+class TestExecuteTasks:
+    def _task(self, event_id="evt-1"):
+        return Task("pre_race", f"pre_race:{event_id}", event_id, event={"id": event_id})
+
+    @patch("social.scheduler.MetaPoster")
+    @patch("social.scheduler.generate_event_images", side_effect=RuntimeError("render failed"))
+    def test_generation_error_skips_post(self, mock_generate, mock_poster, capsys):
+        execute_tasks([self._task()], all_events=[], log={"posts": []}, dry_run=True)
+        assert "Error: render failed" in capsys.readouterr().out
+        mock_poster.return_value.post_folder.assert_not_called()
+
+    @patch("social.scheduler.MetaPoster")
+    @patch("social.scheduler.generate_event_images")
+    def test_unknown_task_type_not_generated(self, mock_generate, mock_poster, capsys):
+        task = Task("mystery", "mystery:1", "1")
+        execute_tasks([task], all_events=[], log={"posts": []}, dry_run=True)
+        assert "Unknown task type: mystery" in capsys.readouterr().out
+        mock_generate.assert_not_called()
+
+    @patch("social.scheduler.append_post")
+    @patch("social.scheduler.detect_content_type", return_value="pre_race")
+    @patch("social.scheduler.MetaPoster")
+    @patch("social.scheduler.generate_event_images")
+    def test_posted_task_logged(self, mock_generate, mock_poster, mock_detect, mock_append, tmp_path):
+        mock_generate.return_value = [tmp_path / "pre_race_post.png"]
+        mock_poster.return_value.post_folder.return_value = {"facebook": "posted (id=1)"}
+        log = {"posts": []}
+        with patch.dict("os.environ", {"META_PAGE_ACCESS_TOKEN": "t", "META_PAGE_ID": "p", "META_IG_USER_ID": "i"}):
+            execute_tasks([self._task()], all_events=[], log=log)
+        assert [e["key"] for e in log["posts"]] == ["pre_race:evt-1"]
+        mock_append.assert_called_once_with(log["posts"][0])
+
+    @patch("social.scheduler.load_posting_log", return_value={"posts": []})
+    @patch("social.scheduler.MetaPoster")
+    @patch("social.scheduler.generate_event_images", return_value=[])
+    def test_positional_dry_run_loads_log(self, mock_generate, mock_poster, mock_load):
+        execute_tasks([self._task()], [], True)
+        mock_load.assert_called_once_with()
+        mock_poster.assert_called_once_with(
+            page_access_token="DRY_RUN", page_id="DRY_RUN", ig_user_id="DRY_RUN",
+        )
+
+    @patch("social.scheduler.append_post")
+    @patch("social.scheduler.detect_content_type", return_value="pre_race")
+    @patch("social.scheduler.MetaPoster")
+    @patch("social.scheduler.generate_event_images")
+    def test_partial_failure_logs_posted_platforms(self, mock_generate, mock_poster, mock_detect, mock_append, tmp_path):
+        mock_generate.return_value = [tmp_path / "pre_race_post.png"]
+        mock_poster.return_value.post_folder.return_value = {
+            "facebook": "failed: fb down",
+            "instagram": "posted (id=IG1)",
+        }
+        log = {"posts": []}
+        with patch.dict("os.environ", {"META_PAGE_ACCESS_TOKEN": "t", "META_PAGE_ID": "p", "META_IG_USER_ID": "i"}):
+            execute_tasks([self._task()], all_events=[], log=log)
+        assert log["posts"][0]["platforms"] == ["instagram"]
+
+
+class TestBuildPoster:
+    def test_dry_run_needs_no_credentials(self, monkeypatch):
+        monkeypatch.delenv("META_PAGE_ACCESS_TOKEN", raising=False)
+        assert build_poster(dry_run=True).token == "DRY_RUN"
+
+    def test_missing_credentials_exit(self, monkeypatch):
+        monkeypatch.delenv("META_PAGE_ACCESS_TOKEN", raising=False)
+        with pytest.raises(SystemExit):
+            build_poster(dry_run=False)
@@ -1,19 +1,25 @@
 """Tests for social media image generation templates."""
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 import pytest
 from social.config import FORMATS
+from social.font_loader import load_font
+from social.templates.base import AGE_GROUP_PILL_COLOR, format_event_header, pill_items_for
 from social.templates.pre_race import PreRaceTemplate
 from social.templates.race_day import RaceDayTemplate
 from social.templates.weekly_preview import WeeklyPreviewTemplate
 from social.templates.weekend_preview import WeekendPreviewTemplate
-from social.templates.monthly_calendar import MonthlyCalendarTemplate
+from social.templates.monthly_calendar import MonthlyCalendarTemplate, _assign_lanes
 
 
 # -- Fixtures --
+# Templates only read events, so these are built once and shared read-only.
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_event():
-    return {
+    return MappingProxyType({
         "id": "imd-test-001",
         "name": "Jr. IMC U14 Qualifier / David Wright - 1SL/2GS- Park City",
         "dates": {
@@ -31,13 +37,13 @@ def sample_event():
         "status": "upcoming",
         "pcss_relevant": True,
         "pcss_confirmed": False,
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def snowbird_event():
     """Event at Snowbird — has a matching venue photo."""
-    return {
+    return MappingProxyType({
         "id": "imd-test-snowbird",
         "name": "Snowbird Open SL/GS",
         "dates": {
@@ -54,13 +60,13 @@ def snowbird_event():
         "age_groups": [],
         "status": "upcoming",
         "pcss_relevant": True,
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def unknown_venue_event():
     """Event at venue with no matching photo — should use default."""
-    return {
+    return MappingProxyType({
         "id": "imd-test-unknown",
         "name": "Mystery Mountain Race",
         "dates": {
@@ -77,13 +83,13 @@ def unknown_venue_event():
         "age_groups": [],
         "status": "upcoming",
         "pcss_relevant": False,
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_event():
     """Event with no disciplines, no age groups, no state."""
-    return {
+    return MappingProxyType({
         "id": "imd-test-002",
         "name": "Test Race",
         "dates": {"start": "2026-03-01", "end": "2026-03-01", "display": "Mar 1, 2026"},
@@ -96,13 +102,13 @@ def minimal_event():
         "age_groups": [],
         "status": "upcoming",
         "pcss_relevant": False,
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def long_name_event():
     """Event with a very long name that requires wrapping."""
-    return {
+    return MappingProxyType({
         "id": "imd-test-003",
         "name": "Western Region Junior Championships Super Giant Slalom and Downhill Combined Event - Mission Ridge Resort",
         "dates": {"start": "2026-03-12", "end": "2026-03-17", "display": "Mar 12-17, 2026"},
@@ -115,152 +121,163 @@ def long_name_event():
         "age_groups": ["U14", "U16", "U18", "U21"],
         "status": "upcoming",
         "pcss_relevant": True,
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multiple_events(sample_event, minimal_event, long_name_event):
-    return [sample_event, minimal_event, long_name_event]
+    return (sample_event, minimal_event, long_name_event)
+
+
+@pytest.fixture(scope="session")
+def five_sample_events(sample_event):
+    """Five copies of sample_event with distinct ids and names."""
+    return tuple(
+        MappingProxyType({**sample_event, "id": f"imd-test-{i}", "name": f"Event {i+1} - Race"})
+        for i in range(5)
+    )
+
+
+@pytest.fixture(scope="session")
+def five_weekend_events(sample_event):
+    """Five copies of sample_event named as weekend races."""
+    return tuple(
+        MappingProxyType({**sample_event, "id": f"imd-weekend-{i}", "name": f"Weekend Race {i+1}"})
+        for i in range(5)
+    )
+
+
+def _input_key(value):
+    """Identify a render input: events by id, sequences element-wise."""
+    if isinstance(value, Mapping):
+        return value["id"]
+    if isinstance(value, (list, tuple)):
+        return tuple(_input_key(v) for v in value)
+    return value
+
+
+@pytest.fixture(scope="session")
+def render_size():
+    """Render each (template, format, inputs) once per session; return the image size.
+
+    Several tests render identical inputs (e.g. a format's dimension test and a
+    smoke test at that format), and they only assert on the size. Tests using
+    this fixture are marked slow (see conftest.py); the rest never render.
+    """
+    sizes = {}
+
+    def render(template_cls, fmt, **kwargs):
+        key = (template_cls, fmt, tuple(sorted((k, _input_key(v)) for k, v in kwargs.items())))
+        if key not in sizes:
+            sizes[key] = template_cls(fmt).render(**kwargs).size
+        return sizes[key]
+
+    return render
 
 
 # -- Dimension tests --
 
 class TestPreRaceTemplate:
     @pytest.mark.parametrize("fmt,expected", list(FORMATS.items()))
-    def test_dimensions(self, fmt, expected, sample_event):
-        template = PreRaceTemplate(fmt)
-        img = template.render(event=sample_event)
-        assert img.size == expected
-
-    def test_no_disciplines(self, minimal_event):
-        template = PreRaceTemplate("story")
-        img = template.render(event=minimal_event)
-        assert img.size == (1080, 1920)
-
-    def test_many_disciplines(self, long_name_event):
-        template = PreRaceTemplate("story")
-        img = template.render(event=long_name_event)
-        assert img.size == (1080, 1920)
-
-    def test_venue_photo_match(self, snowbird_event):
+    def test_dimensions(self, fmt, expected, sample_event, render_size):
+        assert render_size(PreRaceTemplate, fmt, event=sample_event) == expected
+
+    def test_no_disciplines(self, minimal_event, render_size):
+        assert render_size(PreRaceTemplate, "story", event=minimal_event) == (1080, 1920)
+
+    def test_many_disciplines(self, long_name_event, render_size):
+        assert render_size(PreRaceTemplate, "story", event=long_name_event) == (1080, 1920)
+
+    def test_venue_photo_match(self, snowbird_event, render_size):
         """Event with matching venue photo should render without error."""
-        template = PreRaceTemplate("story")
-        img = template.render(event=snowbird_event)
-        assert img.size == (1080, 1920)
+        assert render_size(PreRaceTemplate, "story", event=snowbird_event) == (1080, 1920)
 
-    def test_venue_photo_fallback(self, unknown_venue_event):
+    def test_venue_photo_fallback(self, unknown_venue_event, render_size):
         """Event with unknown venue should fall back to default."""
-        template = PreRaceTemplate("post")
-        img = template.render(event=unknown_venue_event)
-        assert img.size == (1080, 1080)
+        assert render_size(PreRaceTemplate, "post", event=unknown_venue_event) == (1080, 1080)
 
-    def test_compact_format(self, sample_event):
+    def test_compact_format(self, sample_event, render_size):
         """Facebook format should render at correct dimensions."""
-        template = PreRaceTemplate("facebook")
-        img = template.render(event=sample_event)
-        assert img.size == (1200, 630)
+        assert render_size(PreRaceTemplate, "facebook", event=sample_event) == (1200, 630)
+
+    def test_format_event_header(self, sample_event, minimal_event):
+        assert format_event_header(sample_event) == (
+            "Park City, UT", "Feb 28-Mar 2, 2026", "Park City, UT  |  Feb 28-Mar 2, 2026"
+        )
+        assert format_event_header(minimal_event)[0] == "TBD"
+        assert format_event_header({"venue": "Snowbird"}) == ("Snowbird", "", "Snowbird")
+
+    def test_pill_items_shared_across_events(self, sample_event):
+        items, age_items = pill_items_for(sample_event)
+        assert [label for label, _ in items] == ["SL", "GS"]
+        assert age_items == (("U14", AGE_GROUP_PILL_COLOR), ("U16", AGE_GROUP_PILL_COLOR))
+        assert pill_items_for(dict(sample_event, id="other")) == (items, age_items)
+        assert pill_items_for(dict(sample_event, id="other"))[0] is items
+
+    def test_pill_items_null_lists(self, sample_event):
+        assert pill_items_for(dict(sample_event, disciplines=None, age_groups=None)) == ((), ())
 
 
 class TestRaceDayTemplate:
     @pytest.mark.parametrize("fmt,expected", list(FORMATS.items()))
-    def test_dimensions(self, fmt, expected, sample_event):
-        template = RaceDayTemplate(fmt)
-        img = template.render(event=sample_event)
-        assert img.size == expected
+    def test_dimensions(self, fmt, expected, sample_event, render_size):
+        assert render_size(RaceDayTemplate, fmt, event=sample_event) == expected
 
-    def test_venue_photo_match(self, snowbird_event):
+    def test_venue_photo_match(self, snowbird_event, render_size):
         """Event with matching venue photo should render without error."""
-        template = RaceDayTemplate("story")
-        img = template.render(event=snowbird_event)
-        assert img.size == (1080, 1920)
+        assert render_size(RaceDayTemplate, "story", event=snowbird_event) == (1080, 1920)
 
-    def test_venue_photo_fallback(self, unknown_venue_event):
+    def test_venue_photo_fallback(self, unknown_venue_event, render_size):
         """Event with unknown venue should fall back to default."""
-        template = RaceDayTemplate("post")
-        img = template.render(event=unknown_venue_event)
-        assert img.size == (1080, 1080)
+        assert render_size(RaceDayTemplate, "post", event=unknown_venue_event) == (1080, 1080)
 
-    def test_no_disciplines(self, minimal_event):
+    def test_no_disciplines(self, minimal_event, render_size):
         """Minimal event should render without error."""
-        template = RaceDayTemplate("story")
-        img = template.render(event=minimal_event)
-        assert img.size == (1080, 1920)
+        assert render_size(RaceDayTemplate, "story", event=minimal_event) == (1080, 1920)
 
 
 class TestWeeklyPreviewTemplate:
     @pytest.mark.parametrize("fmt,expected", list(FORMATS.items()))
-    def test_dimensions(self, fmt, expected, multiple_events):
-        template = WeeklyPreviewTemplate(fmt)
-        img = template.render(events=multiple_events)
-        assert img.size == expected
+    def test_dimensions(self, fmt, expected, multiple_events, render_size):
+        assert render_size(WeeklyPreviewTemplate, fmt, events=multiple_events) == expected
 
-    def test_single_event(self, sample_event):
+    def test_single_event(self, sample_event, render_size):
         """Should handle a single event."""
-        template = WeeklyPreviewTemplate("story")
-        img = template.render(events=[sample_event])
-        assert img.size == (1080, 1920)
+        assert render_size(WeeklyPreviewTemplate, "story", events=[sample_event]) == (1080, 1920)
 
-    def test_five_events(self, sample_event):
+    def test_five_events(self, five_sample_events, render_size):
         """Should handle five events without overflow."""
-        events = [sample_event.copy() for _ in range(5)]
-        for i, e in enumerate(events):
-            e["id"] = f"imd-test-{i}"
-            e["name"] = f"Event {i+1} - Race"
-        template = WeeklyPreviewTemplate("story")
-        img = template.render(events=events)
-        assert img.size == (1080, 1920)
-
-    def test_empty_events(self):
+        assert render_size(WeeklyPreviewTemplate, "story", events=five_sample_events) == (1080, 1920)
+
+    def test_empty_events(self, render_size):
         """Should handle empty event list gracefully."""
-        template = WeeklyPreviewTemplate("post")
-        img = template.render(events=[])
-        assert img.size == (1080, 1080)
+        assert render_size(WeeklyPreviewTemplate, "post", events=[]) == (1080, 1080)
 
-    def test_uses_default_venue(self, multiple_events):
+    def test_uses_default_venue(self, multiple_events, render_size):
         """Weekly preview uses default/gradient venue photo."""
-        template = WeeklyPreviewTemplate("story")
-        img = template.render(events=multiple_events)
-        assert img.size == (1080, 1920)
+        assert render_size(WeeklyPreviewTemplate, "story", events=multiple_events) == (1080, 1920)
 
 
 class TestWeekendPreviewTemplate:
     @pytest.mark.parametrize("fmt,expected", list(FORMATS.items()))
-    def test_dimensions(self, fmt, expected, multiple_events):
-        template = WeekendPreviewTemplate(fmt)
-        img = template.render(events=multiple_events)
-        assert img.size == expected
+    def test_dimensions(self, fmt, expected, multiple_events, render_size):
+        assert render_size(WeekendPreviewTemplate, fmt, events=multiple_events) == expected
 
-    def test_single_event(self, sample_event):
+    def test_single_event(self, sample_event, render_size):
         """Should handle a single event."""
-        template = WeekendPreviewTemplate("story")
-        img = template.render(events=[sample_event])
-        assert img.size == (1080, 1920)
+        assert render_size(WeekendPreviewTemplate, "story", events=[sample_event]) == (1080, 1920)
 
-    def test_three_events(self, sample_event):
+    def test_three_events(self, five_weekend_events, render_size):
         """Should handle three events (MAX_EVENTS)."""
-        events = [sample_event.copy() for _ in range(3)]
-        for i, e in enumerate(events):
-            e["id"] = f"imd-weekend-{i}"
-            e["name"] = f"Weekend Race {i+1}"
-        template = WeekendPreviewTemplate("story")
-        img = template.render(events=events)
-        assert img.size == (1080, 1920)
-
-    def test_five_events_capped_to_three(self, sample_event):
+        assert render_size(WeekendPreviewTemplate, "story", events=five_weekend_events[:3]) == (1080, 1920)
+
+    def test_five_events_capped_to_three(self, five_weekend_events, render_size):
         """Should cap at 3 events even if 5 are provided."""
-        events = [sample_event.copy() for _ in range(5)]
-        for i, e in enumerate(events):
-            e["id"] = f"imd-weekend-{i}"
-            e["name"] = f"Weekend Race {i+1}"
-        template = WeekendPreviewTemplate("story")
-        img = template.render(events=events)
-        assert img.size == (1080, 1920)
-
-    def test_empty_events(self):
+        assert render_size(WeekendPreviewTemplate, "story", events=five_weekend_events) == (1080, 1920)
+
+    def test_empty_events(self, render_size):
         """Should handle empty event list gracefully."""
-        template = WeekendPreviewTemplate("post")
-        img = template.render(events=[])
-        assert img.size == (1080, 1080)
+        assert render_size(WeekendPreviewTemplate, "post", events=[]) == (1080, 1080)
 
     def test_title_override(self):
         """Should use 'THIS WEEKEND IN' title."""
@@ -271,40 +288,39 @@ class TestWeekendPreviewTemplate:
 
 class TestMonthlyCalendarTemplate:
     @pytest.mark.parametrize("fmt,expected", list(FORMATS.items()))
-    def test_dimensions(self, fmt, expected, sample_event):
+    def test_dimensions(self, fmt, expected, sample_event, render_size):
         """All 4 formats should produce correct dimensions."""
-        template = MonthlyCalendarTemplate(fmt)
-        img = template.render(events=[sample_event], year=2026, month=3)
-        assert img.size == expected
+        assert render_size(
+            MonthlyCalendarTemplate, fmt, events=[sample_event], year=2026, month=3
+        ) == expected
 
-    def test_empty_month(self):
+    def test_empty_month(self, render_size):
         """Month with no events should render cleanly."""
-        template = MonthlyCalendarTemplate("story")
-        img = template.render(events=[], year=2026, month=6)
-        assert img.size == (1080, 1920)
+        assert render_size(
+            MonthlyCalendarTemplate, "story", events=[], year=2026, month=6
+        ) == (1080, 1920)
 
-    def test_overlapping_events(self, sample_event, snowbird_event):
+    def test_overlapping_events(self, sample_event, snowbird_event, render_size):
         """Overlapping events should be placed in separate lanes."""
-        template = MonthlyCalendarTemplate("story")
-        img = template.render(
-            events=[sample_event, snowbird_event], year=2026, month=3
-        )
-        assert img.size == (1080, 1920)
+        assert render_size(
+            MonthlyCalendarTemplate, "story",
+            events=[sample_event, snowbird_event], year=2026, month=3,
+        ) == (1080, 1920)
 
-    def test_events_spanning_month_boundary(self, sample_event):
+    def test_events_spanning_month_boundary(self, sample_event, render_size):
         """Event starting in Feb and ending in Mar should appear in March."""
         # sample_event: Feb 28 - Mar 2
-        template = MonthlyCalendarTemplate("story")
-        img = template.render(events=[sample_event], year=2026, month=3)
-        assert img.size == (1080, 1920)
+        assert render_size(
+            MonthlyCalendarTemplate, "story", events=[sample_event], year=2026, month=3
+        ) == (1080, 1920)
 
-    def test_events_spanning_month_boundary_prev_month(self, sample_event):
+    def test_events_spanning_month_boundary_prev_month(self, sample_event, render_size):
         """Same event should also appear in February."""
-        template = MonthlyCalendarTemplate("post")
-        img = template.render(events=[sample_event], year=2026, month=2)
-        assert img.size == (1080, 1080)
+        assert render_size(
+            MonthlyCalendarTemplate, "post", events=[sample_event], year=2026, month=2
+        ) == (1080, 1080)
 
-    def test_many_events_one_week(self):
+    def test_many_events_one_week(self, render_size):
         """5+ events in one week should render without errors."""
         events = []
         for i in range(6):
@@ -326,21 +342,48 @@ class TestMonthlyCalendarTemplate:
                 "status": "upcoming",
                 "pcss_relevant": True,
             })
-        template = MonthlyCalendarTemplate("story")
-        img = template.render(events=events, year=2026, month=3)
-        assert img.size == (1080, 1920)
+        assert render_size(
+            MonthlyCalendarTemplate, "story", events=events, year=2026, month=3
+        ) == (1080, 1920)
 
-    def test_facebook_compact(self, sample_event, snowbird_event):
+    def test_facebook_compact(self, sample_event, snowbird_event, render_size):
         """Facebook format with events should fit in compact layout."""
-        template = MonthlyCalendarTemplate("facebook")
-        img = template.render(
-            events=[sample_event, snowbird_event], year=2026, month=3
-        )
-        assert img.size == (1200, 630)
+        assert render_size(
+            MonthlyCalendarTemplate, "facebook",
+            events=[sample_event, snowbird_event], year=2026, month=3,
+        ) == (1200, 630)
 
-    def test_no_matching_events(self, sample_event):
+    def test_no_matching_events(self, sample_event, render_size):
         """Events outside the target month should be filtered out."""
-        template = MonthlyCalendarTemplate("post")
         # sample_event is Feb 28 - Mar 2, so it should NOT appear in June
-        img = template.render(events=[sample_event], year=2026, month=6)
-        assert img.size == (1080, 1080)
+        assert render_size(
+            MonthlyCalendarTemplate, "post", events=[sample_event], year=2026, month=6
+        ) == (1080, 1080)
+
+    def test_filter_month_events_by_overlap(self, sample_event):
+        """Events spanning a month boundary appear in both months; bad dates are skipped."""
+        template = MonthlyCalendarTemplate("post")
+        bad = {"id": "bad", "dates": {"start": "2026-02-30", "end": "2026-03-01"}}
+        events = [sample_event, bad]
+        assert template._filter_month_events(events, 2026, 2) == [sample_event]
+        assert template._filter_month_events(events, 2026, 3) == [sample_event]
+        assert template._filter_month_events(events, 2026, 4) == []
+
+    def test_abbreviate_name_fits_width(self):
+        """Long bar labels are truncated with an ellipsis to fit the bar."""
+        template = MonthlyCalendarTemplate("post")
+        font = load_font("Regular", 12)
+        name = "SL/GS Utah Olympic Park U12 U14 U16"
+        label = template._abbreviate_name(name, 80, font)
+        assert label.endswith("...")
+        bbox = font.getbbox(label)
+        assert bbox[2] - bbox[0] <= 80
+        assert template._abbreviate_name(name, 1000, font) == name
+        assert template._abbreviate_name(name, 0, font) == ""
+
+    def test_assign_lanes_stacks_overlaps_and_overflows(self):
+        """Overlapping bars take successive lanes; extras share the last lane."""
+        # Mon-Wed, Tue-Thu, Tue only, Fri-Sun, Mon-Sun
+        starts = [0, 1, 1, 4, 0]
+        ends = [2, 3, 1, 6, 6]
+        assert _assign_lanes(starts, ends, max_lanes=3) == [1, 2, 2, 1, 0]